@@ -0,0 +1,284 @@
+"""
+annual_leave_batch.py - 연차휴가 일괄 계산 명령행 도구
+
+직원 명부(CSV 또는 엑셀) 파일을 읽어 모든 직원의 연차휴가를
+입사일 기준과 회계연도 기준으로 계산하고 결과를 엑셀 파일로 저장합니다.
+브라우저 없이 서버의 예약 작업에서 실행할 수 있습니다.
+
+사용 예:
+    python annual_leave_batch.py roster.csv -o leave_report.xlsx
+    python annual_leave_batch.py roster.xlsx -o leave_report.xlsx --as-of 2025-12-31 --workers 4
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from hr_core.annual_leave_calculator import AnnualLeaveCalculator
+
+# 명부 열 이름 매핑 (입력 열 이름: 내부 필드)
+ROSTER_COLUMNS = {
+    "employee_id": "employee_id",
+    "직원 ID": "employee_id",
+    "사번": "employee_id",
+    "name": "name",
+    "이름": "name",
+    "성명": "name",
+    "hire_date": "hire_date",
+    "entry_date": "hire_date",
+    "입사일": "hire_date",
+    "termination_date": "termination_date",
+    "퇴사일": "termination_date",
+}
+
+# 결과 열 목록
+RESULT_COLUMNS = [
+    "직원 ID", "이름", "입사일", "퇴사일",
+    "입사일 기준 연차", "회계연도 기준 연차",
+    "입사일 기준 다음 발생일", "입사일 기준 다음 발생 일수",
+    "회계연도 기준 다음 발생일", "회계연도 기준 다음 발생 일수",
+    "오류"
+]
+
+def _parse_date(value):
+    """
+    명부의 날짜 값을 datetime.date로 변환
+    
+    Args:
+        value: 날짜 값 (문자열, datetime, pandas.Timestamp 등)
+    
+    Returns:
+        datetime.date: 변환된 날짜 (값이 비어 있으면 None)
+    """
+    if value is None or (isinstance(value, float) and pd.isna(value)) or value == "":
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return pd.to_datetime(str(value).strip()).date()
+
+def calculate_leave_rows(rows, as_of, horizon_years):
+    """
+    명부 행 묶음의 연차휴가 계산 (작업 프로세스에서 실행)
+    
+    Args:
+        rows (list): (직원 ID, 이름, 입사일, 퇴사일) 튜플 리스트
+        as_of (datetime.date): 계산 기준일
+        horizon_years (int): 계산 기간 (년)
+    
+    Returns:
+        list: 결과 행 리스트 (RESULT_COLUMNS 순서)
+    """
+    results = []
+    
+    for employee_id, name, hire_value, termination_value in rows:
+        try:
+            hire_date = _parse_date(hire_value)
+            termination_date = _parse_date(termination_value)
+            
+            if hire_date is None:
+                raise ValueError("입사일이 없습니다.")
+            
+            calculator = AnnualLeaveCalculator(
+                hire_date, termination_date, horizon_years=horizon_years, as_of=as_of
+            )
+            employment_next = calculator.get_next_grant("employment") or {}
+            fiscal_next = calculator.get_next_grant("fiscal") or {}
+            
+            results.append([
+                employee_id, name, hire_date, termination_date,
+                calculator.get_leave_for_year(as_of.year, "employment"),
+                calculator.get_leave_for_year(as_of.year, "fiscal"),
+                employment_next.get("발생일"), employment_next.get("연차일수"),
+                fiscal_next.get("발생일"), fiscal_next.get("연차일수"),
+                None
+            ])
+        except Exception as e:
+            results.append([employee_id, name, hire_value, termination_value] + [None] * 6 + [str(e)])
+    
+    return results
+
+def iter_roster_chunks(file_path, chunk_size=1000, sheet_name=None):
+    """
+    명부 파일을 일정 크기의 행 묶음으로 읽기
+    
+    CSV는 pandas의 청크 단위 읽기로, 엑셀은 openpyxl 읽기 전용 모드로 한 행씩 읽으므로
+    명부 전체를 메모리에 올리지 않습니다.
+    
+    Args:
+        file_path (str): 명부 파일 경로 (.csv, .xlsx)
+        chunk_size (int, optional): 묶음당 행 수. 기본값은 1000.
+        sheet_name (str, optional): 엑셀 시트 이름. 기본값은 None (첫 번째 시트).
+    
+    Yields:
+        list: (직원 ID, 이름, 입사일, 퇴사일) 튜플 리스트
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    
+    if extension in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            row_iter = worksheet.iter_rows(values_only=True)
+            header = next(row_iter, None)
+            if header is None:
+                return
+            positions = _column_positions(header)
+            
+            chunk = []
+            for values in row_iter:
+                if values is None or all(value is None for value in values):
+                    continue
+                chunk.append(tuple(
+                    values[positions[field]] if positions.get(field) is not None and positions[field] < len(values) else None
+                    for field in ("employee_id", "name", "hire_date", "termination_date")
+                ))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        finally:
+            workbook.close()
+    else:
+        for frame in pd.read_csv(file_path, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            positions = _column_positions(frame.columns)
+            columns = [
+                frame.iloc[:, positions[field]] if positions.get(field) is not None else [None] * len(frame)
+                for field in ("employee_id", "name", "hire_date", "termination_date")
+            ]
+            yield list(zip(*columns))
+
+def _column_positions(header):
+    """
+    명부 머리글에서 필드별 열 위치 찾기
+    
+    Args:
+        header (list): 머리글 값 목록
+    
+    Returns:
+        dict: 필드별 열 위치
+    """
+    positions = {}
+    for index, column in enumerate(header):
+        field = ROSTER_COLUMNS.get(str(column).strip()) if column is not None else None
+        if field is not None and field not in positions:
+            positions[field] = index
+    
+    if "hire_date" not in positions:
+        raise ValueError("명부에 입사일(hire_date/입사일) 열이 없습니다.")
+    
+    return positions
+
+def run_leave_report(input_path, output_path, as_of=None, horizon_years=5, workers=None, chunk_size=1000, sheet_name=None):
+    """
+    명부 파일의 연차휴가를 일괄 계산하여 엑셀 파일로 저장
+    
+    Args:
+        input_path (str): 명부 파일 경로
+        output_path (str): 결과 엑셀 파일 경로
+        as_of (datetime.date, optional): 계산 기준일. 기본값은 None (오늘).
+        horizon_years (int, optional): 계산 기간 (년). 기본값은 5.
+        workers (int, optional): 작업 프로세스 수. 기본값은 None (CPU 코어 수).
+        chunk_size (int, optional): 작업 단위 행 수. 기본값은 1000.
+        sheet_name (str, optional): 엑셀 명부의 시트 이름. 기본값은 None.
+    
+    Returns:
+        dict: 처리 결과 (rows, errors, seconds)
+    """
+    import xlsxwriter
+    
+    as_of = as_of or datetime.date.today()
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    total_rows = 0
+    error_rows = 0
+    
+    workbook = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet("연차휴가")
+        header_format = workbook.add_format({"bold": True, "bg_color": "#E3F2FD", "border": 1})
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+        worksheet.write_row(0, 0, RESULT_COLUMNS, header_format)
+        worksheet.set_column(0, len(RESULT_COLUMNS) - 1, 16)
+        
+        row_index = 1
+        
+        def write_results(results):
+            nonlocal row_index, total_rows, error_rows
+            for result in results:
+                for column_index, value in enumerate(result):
+                    if isinstance(value, datetime.date):
+                        worksheet.write_datetime(row_index, column_index, datetime.datetime.combine(value, datetime.time()), date_format)
+                    elif value is not None:
+                        worksheet.write(row_index, column_index, value)
+                if result[-1]:
+                    error_rows += 1
+                row_index += 1
+                total_rows += 1
+        
+        chunks = iter_roster_chunks(input_path, chunk_size=chunk_size, sheet_name=sheet_name)
+        
+        if workers == 1:
+            for chunk in chunks:
+                write_results(calculate_leave_rows(chunk, as_of, horizon_years))
+        else:
+            # 진행 중인 작업 수를 제한하여 명부를 순서대로 스트리밍
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = []
+                for chunk in chunks:
+                    pending.append(executor.submit(calculate_leave_rows, chunk, as_of, horizon_years))
+                    if len(pending) >= workers * 2:
+                        write_results(pending.pop(0).result())
+                for future in pending:
+                    write_results(future.result())
+    finally:
+        workbook.close()
+    
+    return {
+        "rows": total_rows,
+        "errors": error_rows,
+        "seconds": time.perf_counter() - started
+    }
+
+def main(argv=None):
+    """
+    명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="직원 명부의 연차휴가를 일괄 계산하여 엑셀 파일로 저장합니다.")
+    parser.add_argument("roster", help="직원 명부 파일 (.csv 또는 .xlsx)")
+    parser.add_argument("-o", "--output", default="annual_leave_report.xlsx", help="결과 엑셀 파일 경로")
+    parser.add_argument("--as-of", type=lambda value: datetime.date.fromisoformat(value), default=None, help="계산 기준일 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--horizon", type=int, default=5, help="계산 기간 (년, 기본값: 5)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="작업 단위 행 수 (기본값: 1000)")
+    parser.add_argument("--sheet", default=None, help="엑셀 명부의 시트 이름")
+    args = parser.parse_args(argv)
+    
+    try:
+        summary = run_leave_report(
+            args.roster, args.output,
+            as_of=args.as_of, horizon_years=args.horizon, workers=args.workers,
+            chunk_size=args.chunk_size, sheet_name=args.sheet
+        )
+    except (OSError, ValueError) as e:
+        print(f"연차휴가 일괄 계산 오류: {e}", file=sys.stderr)
+        return 1
+    
+    rate = summary["rows"] / summary["seconds"] if summary["seconds"] > 0 else 0
+    print(
+        f"{summary['rows']}명 처리 완료 (오류 {summary['errors']}건), "
+        f"{summary['seconds']:.2f}초, 초당 {rate:,.0f}명 -> {args.output}"
+    )
+    return 0 if summary["errors"] == 0 else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
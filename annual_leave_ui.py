@@ -4,7 +4,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import datetime
 import math
-from annual_leave_calculator import AnnualLeaveCalculator
+from hr_core.annual_leave_calculator import AnnualLeaveCalculator
 
 def render_annual_leave_calculator():
     """
@@ -80,7 +80,7 @@ def render_annual_leave_calculator():
     # 계산 버튼
     if st.button("연차 계산하기", key="calculate_leave"):
         # 연차 계산
-        calculator = AnnualLeaveCalculator(hire_date, termination_date)
+        calculator = AnnualLeaveCalculator(hire_date, termination_date, horizon_years=years)
         
         # 탭 생성
         tabs = st.tabs(["입사일 기준 계산", "회계연도 기준 계산", "연차휴가 발생 테이블", "두 방식 비교"])
@@ -1,18 +1,26 @@
 import streamlit as st
 import os
 import sys
+import time
+import importlib
+from streamlit.logger import get_logger
 from streamlit_option_menu import option_menu
-from PIL import Image
-import base64
 
 # 모듈 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# 각 모듈 임포트 (평평한 구조에 맞게 수정됨)
-from annual_leave_ui import render_annual_leave_calculator
-from employment_contract import render_employment_contract_form
-from payroll_ledger import render_payroll_ledger_ui
-from pay_statement import render_pay_statement_ui
+# Streamlit 로그 설정(logger.level, 기본값 info)을 따르는 로거
+logger = get_logger(__name__)
+
+# 메뉴별 페이지 모듈 (메뉴 이름: (모듈, 렌더링 함수, 아이콘))
+# 페이지 모듈은 메뉴를 처음 선택할 때 임포트하여 홈 화면의 초기 로딩 시간을 줄임
+PAGES = {
+    "홈": (None, None, "house"),
+    "연차휴가 계산기": ("annual_leave_ui", "render_annual_leave_calculator", "calendar-check"),
+    "근로계약서": ("employment_contract", "render_employment_contract_form", "file-earmark-text"),
+    "임금대장": ("payroll_ledger", "render_payroll_ledger_ui", "cash-coin"),
+    "임금명세서": ("pay_statement", "render_pay_statement_ui", "envelope"),
+}
 
 # 페이지 설정
 st.set_page_config(
@@ -186,15 +194,21 @@ def load_css():
     """
     st.markdown(css, unsafe_allow_html=True)
 
+# 정적 파일로 제공되는 배경 이미지 경로 (.streamlit/config.toml의 enableStaticServing 사용)
+BACKGROUND_IMAGE_URL = "app/static/images/background.png"
+
 # 배경 이미지 설정
-def add_bg_from_local(image_file):
-    with open(image_file, "rb") as image_file:
-        encoded_string = base64.b64encode(image_file.read()).decode()
+def add_background(image_url=BACKGROUND_IMAGE_URL):
+    """
+    배경 이미지 스타일 적용
     
+    이미지를 base64로 인라인하지 않고 정적 파일 경로만 참조하므로
+    재실행할 때마다 전송되는 스타일이 수백 바이트로 줄어듭니다.
+    """
     bg_image = f"""
     <style>
     .stApp {{
-        background-image: url("data:image/png;base64,{encoded_string}");
+        background-image: url("{image_url}");
         background-size: cover;
         background-repeat: no-repeat;
         background-attachment: fixed;
@@ -204,7 +218,8 @@ def add_bg_from_local(image_file):
     
     st.markdown(bg_image, unsafe_allow_html=True)
 
-# 배경 이미지 파일 생성
+# 배경 이미지 파일 생성 (프로세스당 한 번만 실행)
+@st.cache_resource(show_spinner=False)
 def create_background_image():
     # 배경 이미지 디렉토리 생성
     image_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static/images")
@@ -233,6 +248,31 @@ def create_background_image():
     
     return bg_image_path
 
+# 페이지 렌더링 함수 로드
+def load_page_renderer(page):
+    """
+    메뉴에 해당하는 페이지 모듈을 임포트하고 렌더링 함수 반환
+    
+    처음 임포트하는 모듈은 임포트 소요 시간을 로그로 남깁니다.
+    이후에는 이미 로드된 모듈을 그대로 사용합니다.
+    
+    Args:
+        page (str): 메뉴 이름
+    
+    Returns:
+        callable: 페이지 렌더링 함수
+    """
+    module_name, function_name, _ = PAGES[page]
+    
+    if module_name in sys.modules:
+        module = sys.modules[module_name]
+    else:
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        logger.info("페이지 모듈 임포트: %s (%.1fms)", module_name, (time.perf_counter() - started) * 1000)
+    
+    return getattr(module, function_name)
+
 # 메인 함수
 def main():
     # CSS 스타일 적용
@@ -240,8 +280,8 @@ def main():
     
     # 배경 이미지 설정 (에러 핸들링 추가)
     try:
-        bg_image_path = create_background_image()
-        add_bg_from_local(bg_image_path)
+        create_background_image()
+        add_background()
     except Exception as e:
         pass  # 배경 이미지 없이도 계속 실행
     
@@ -255,10 +295,10 @@ def main():
         
         selected = option_menu(
             menu_title=None,
-            options=["홈", "연차휴가 계산기", "근로계약서", "임금대장", "임금명세서"],
-            icons=["house", "calendar-check", "file-earmark-text", "cash-coin", "envelope"],
+            options=list(PAGES),
+            icons=[icon for _, _, icon in PAGES.values()],
             menu_icon="cast",
-            default_index=["홈", "연차휴가 계산기", "근로계약서", "임금대장", "임금명세서"].index(st.session_state.current_page),
+            default_index=list(PAGES).index(st.session_state.current_page),
         )
         
         st.session_state.current_page = selected
@@ -266,14 +306,8 @@ def main():
     # 페이지 렌더링
     if st.session_state.current_page == "홈":
         render_home_page()
-    elif st.session_state.current_page == "연차휴가 계산기":
-        render_annual_leave_calculator()
-    elif st.session_state.current_page == "근로계약서":
-        render_employment_contract_form()
-    elif st.session_state.current_page == "임금대장":
-        render_payroll_ledger_ui()
-    elif st.session_state.current_page == "임금명세서":
-        render_pay_statement_ui()
+    else:
+        load_page_renderer(st.session_state.current_page)()
     
     # 푸터
     st.markdown(
@@ -0,0 +1,46 @@
+"""
+hr_core - HR 관리 시스템 핵심 패키지
+
+연차휴가 계산, 임금대장 저장소, 직원 검색, 임금명세서 및 근로계약서 생성 기능을 제공합니다.
+Streamlit에 의존하지 않으므로 웹 화면 없이 명령행 도구나 작업 프로세스에서 사용할 수 있습니다.
+
+하위 모듈은 처음 사용할 때 불러오므로 hr_core.ids처럼 가벼운 모듈만 쓰는 경우
+pandas, numpy 등을 불러오는 비용이 들지 않습니다.
+"""
+
+import importlib
+
+# 패키지에서 바로 사용할 수 있는 이름과 정의된 하위 모듈
+_EXPORTS = {
+    "AnnualLeaveCalculator": "annual_leave_calculator",
+    "BusinessCalendar": "business_calendar",
+    "get_business_calendar": "business_calendar",
+    "EmployeeSearchIndex": "employee_search",
+    "get_initials": "employee_search",
+    "EmploymentContract": "employment_contract",
+    "import_employees_csv": "importers",
+    "import_payroll_workbook": "importers",
+    "build_pay_statement_records": "pay_statement",
+    "generate_pay_statement_html": "pay_statement",
+    "get_pay_statement_template": "pay_statement",
+    "write_pay_statements": "pay_statement",
+    "PayrollLedger": "payroll_ledger",
+    "calculate_payroll_frame": "payroll_ledger",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """
+    패키지 속성을 처음 사용할 때 하위 모듈에서 불러오기
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
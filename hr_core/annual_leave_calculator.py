@@ -0,0 +1,783 @@
+import datetime
+import calendar
+import math
+import pandas as pd
+import numpy as np
+from hr_core.business_calendar import get_business_calendar
+
+class AnnualLeaveCalculator:
+    """
+    연차휴가 계산기 클래스
+    
+    한국 근로기준법에 따른 연차휴가 계산 로직을 구현합니다.
+    - 입사일 기준: 개인별 입사일을 기준으로 연차휴가 계산
+    - 회계연도 기준: 회사의 회계연도(보통 1월 1일 ~ 12월 31일)를 기준으로 연차휴가 계산
+    """
+    
+    def __init__(self, hire_date, termination_date=None, business_calendar=None, horizon_years=5, as_of=None, absent_days=None):
+        """
+        초기화
+        
+        Args:
+            hire_date (datetime.date): 입사일
+            termination_date (datetime.date, optional): 퇴사일. 기본값은 None.
+            business_calendar (BusinessCalendar, optional): 근무일 계산에 사용할 영업일 캘린더. 기본값은 None (공용 캘린더 사용).
+            horizon_years (int, optional): 퇴사일이 없을 때 기준일로부터 계산할 연수. 기본값은 5.
+            as_of (datetime.date, optional): 계산 기준일. 기본값은 None (오늘).
+            absent_days (int or list, optional): 입사일 기준 연차 산정 기간별 결근일수. 기본값은 None (결근 없음).
+                숫자 하나를 지정하면 모든 기간에 적용하고, 목록이 기간 수보다 짧으면 나머지 기간은 결근 없음으로 봅니다.
+                지정하면 출근율 80% 미만인 기간 다음의 입사일 기준 연차는 발생하지 않습니다.
+        """
+        self.hire_date = hire_date
+        self.termination_date = termination_date
+        self.today = as_of if as_of is not None else datetime.date.today()
+        self.business_calendar = business_calendar
+        self.horizon_years = horizon_years
+        self.absent_days = absent_days
+        
+        # 산정 기간 시작일별 출근율 요건 충족 여부 (처음 확인할 때 계산)
+        self._attendance_requirements = None
+        
+        # 퇴사일이 없으면 기준일로부터 horizon_years 후까지 계산
+        if self.termination_date is None:
+            self.calculation_end_date = self.today + datetime.timedelta(days=365*horizon_years)
+        else:
+            self.calculation_end_date = self.termination_date
+    
+    def get_employment_year_leaves(self):
+        """
+        입사연도 기준 연차휴가 계산
+        
+        Returns:
+            dict: 연도별 연차일수 (키: 연도, 값: 일수)
+        """
+        return dict(self.iter_employment_year_leaves())
+    
+    def iter_employment_year_leaves(self, until=None):
+        """
+        입사연도 기준 연도별 연차휴가를 순서대로 생성
+        
+        Args:
+            until (datetime.date, optional): 계산 종료일. 기본값은 None (calculation_end_date).
+        
+        Yields:
+            tuple: (연도, 연차일수)
+        """
+        end_date = self._resolve_end_date(until)
+        years_worked = 0
+        
+        # 입사 첫해
+        first_year_end = datetime.date(self.hire_date.year, 12, 31)
+        days_in_first_year = (first_year_end - self.hire_date).days + 1
+        
+        # 1년 미만인 경우 - 매월 1일씩 계산 (최대 11일)
+        if days_in_first_year < 365:
+            # 입사 연도 안의 월별 발생일 수 (입사월부터 12월까지 매월 입사일과 같은 날)
+            months_worked = 12 - self.hire_date.month + 1
+            # 11월 이상 근무시 12월에는 연차가 발생하지 않음 (최대 11일)
+            yield self.hire_date.year, min(months_worked, 11)
+        # 1년 이상인 경우 - 15일 부여
+        else:
+            yield self.hire_date.year, 15
+            years_worked = 1
+        
+        # 다음 연도부터 계산
+        for year in range(self.hire_date.year + 1, end_date.year + 1):
+            # 연초 시점의 근속 연수 계산
+            years_at_start_of_year = years_worked + (year - self.hire_date.year - 1)
+            
+            # 해당 연도가 입사 후 1년 미만인 경우
+            if years_at_start_of_year == 0:
+                # 해당 연도 1월 1일부터 입사 1주년 전까지의 월별 발생일 수 (1월부터 입사 전월까지)
+                anniversary = self._add_years(self.hire_date, 1)
+                months_until_anniversary = self.hire_date.month - 1
+                # 남은 달에 대해 1일씩 부여 (최대 11일까지)
+                annual_leave = min(months_until_anniversary, 11)
+                
+                # 입사 1주년부터 해당 연도 말까지의 기간에 대한 15일 비례 계산 (첫 1년 출근율 80% 이상인 경우)
+                if anniversary <= datetime.date(year, 12, 31) and self._meets_attendance(self.hire_date):
+                    annual_leave += self._prorate_leave(15, anniversary, datetime.date(year, 12, 31))
+            # 입사 1년 이후
+            else:
+                # 기본 15일
+                annual_leave = 15
+                
+                # 3년 이상 근속시 2년마다 1일씩 추가 (최대 25일)
+                if years_at_start_of_year >= 3:
+                    additional_days = min((years_at_start_of_year - 1) // 2, 10)  # 최대 10일 추가
+                    annual_leave += additional_days
+                
+                # 해당 연도 입사 기념일 직전 1년의 출근율이 80% 미만이면 연차 미발생
+                if not self._meets_attendance(self._add_years(self.hire_date, year - self.hire_date.year - 1)):
+                    annual_leave = 0
+            
+            years_worked += 1
+            
+            # 퇴사한 경우 해당 연도까지만 계산
+            if self.termination_date and year == self.termination_date.year:
+                # 퇴사일까지의 비례 연차 계산
+                days_in_year = 366 if calendar.isleap(year) else 365
+                yield year, self._prorate_leave(annual_leave, datetime.date(year, 1, 1), self.termination_date, days_in_year)
+                break
+            
+            yield year, annual_leave
+    
+    def get_fiscal_year_leaves(self):
+        """
+        회계연도 기준 연차휴가 계산
+        
+        Returns:
+            dict: 연도별 연차일수 (키: 연도, 값: 일수)
+        """
+        return dict(self.iter_fiscal_year_leaves())
+    
+    def iter_fiscal_year_leaves(self, until=None):
+        """
+        회계연도 기준 연도별 연차휴가를 순서대로 생성
+        
+        Args:
+            until (datetime.date, optional): 계산 종료일. 기본값은 None (calculation_end_date).
+        
+        Yields:
+            tuple: (연도, 연차일수)
+        """
+        end_date = self._resolve_end_date(until)
+        
+        # 1월 1일 입사인 경우 즉시 15일 부여
+        if self.hire_date.month == 1 and self.hire_date.day == 1:
+            yield self.hire_date.year, 15
+        # 그 외의 경우 매월 1일씩 계산 (최대 11일)
+        else:
+            months_in_first_year = 12 - self.hire_date.month + (1 if self.hire_date.day == 1 else 0)
+            yield self.hire_date.year, min(months_in_first_year, 11)
+        
+        # 다음 회계연도부터 계산
+        for year in range(self.hire_date.year + 1, end_date.year + 1):
+            # 전년도 재직일수에 따른 비례 연차 계산 또는 15일 기본 부여
+            if year == self.hire_date.year + 1:
+                # 입사 첫해의 재직일수
+                days_worked_prev_year = (datetime.date(year-1, 12, 31) - self.hire_date).days + 1
+                
+                # 입사일이 1년 미만인 경우 비례 연차 (소수점 올림)
+                if days_worked_prev_year < 365:
+                    annual_leave = self._prorate_leave(15, self.hire_date, datetime.date(year-1, 12, 31))
+                # 입사일이 1년 이상인 경우 15일 부여
+                else:
+                    annual_leave = 15
+            else:
+                # 1년 이상 근무한 경우
+                # 입사 연도부터 현재 연도까지의 근속 연수 계산
+                years_worked = (datetime.date(year, 1, 1) - self.hire_date).days // 365
+                
+                # 기본 15일
+                annual_leave = 15
+                
+                # 3년 이상 근속시 2년마다 1일씩 추가 (최대 25일)
+                if years_worked >= 3:
+                    additional_days = min((years_worked - 1) // 2, 10)  # 최대 10일 추가
+                    annual_leave += additional_days
+            
+            # 퇴사한 경우 해당 연도까지만 계산
+            if self.termination_date and year == self.termination_date.year:
+                # 퇴사일까지의 비례 연차 계산
+                days_in_year = 366 if calendar.isleap(year) else 365
+                yield year, self._prorate_leave(annual_leave, datetime.date(year, 1, 1), self.termination_date, days_in_year)
+                break
+            
+            yield year, annual_leave
+    
+    def get_leave_for_year(self, year, method="employment"):
+        """
+        특정 연도의 연차휴가 일수 조회
+        
+        해당 연도에 도달하면 계산을 중단하므로 장기 근속자도 필요한 연도까지만 계산합니다.
+        
+        Args:
+            year (int): 조회할 연도
+            method (str, optional): 계산 방식 ('employment': 입사일 기준, 'fiscal': 회계연도 기준). 기본값은 'employment'.
+        
+        Returns:
+            int: 연차휴가 일수 (해당 연도가 계산 범위에 없으면 None)
+        """
+        leaves = self.iter_employment_year_leaves if method == "employment" else self.iter_fiscal_year_leaves
+        
+        for leave_year, days in leaves(until=max(datetime.date(year, 12, 31), self.hire_date)):
+            if leave_year == year:
+                return days
+            if leave_year > year:
+                break
+        
+        return None
+    
+    def _resolve_end_date(self, until):
+        """
+        계산 종료일 결정 (퇴사일이 있으면 퇴사일을 넘지 않음)
+        
+        Args:
+            until (datetime.date): 요청한 계산 종료일
+        
+        Returns:
+            datetime.date: 계산 종료일
+        """
+        if until is None:
+            return self.calculation_end_date
+        if self.termination_date is not None:
+            return min(until, self.termination_date)
+        return until
+    
+    def get_calendar(self):
+        """
+        근무일 계산에 사용할 영업일 캘린더 반환
+        
+        Returns:
+            BusinessCalendar: 영업일 캘린더
+        """
+        if self.business_calendar is None:
+            self.business_calendar = get_business_calendar()
+        return self.business_calendar
+    
+    def get_leave_year_periods(self):
+        """
+        입사일 기준 연차 산정 기간(1년 단위) 목록 계산
+        
+        Returns:
+            list: (시작일, 종료일) 튜플 리스트. 종료일은 기간에 포함됩니다.
+        """
+        periods = []
+        end_date = self.termination_date or self.today
+        period_start = self.hire_date
+        
+        while period_start <= end_date:
+            next_start = self._add_years(self.hire_date, len(periods) + 1)
+            periods.append((period_start, min(next_start - datetime.timedelta(days=1), end_date)))
+            period_start = next_start
+        
+        return periods
+    
+    def get_attendance_rates(self, absent_days=None):
+        """
+        입사일 기준 연차 산정 기간별 출근율 계산
+        
+        연차휴가는 1년간 80% 이상 출근한 경우에 발생하므로,
+        영업일 캘린더의 실제 근무일수(소정근로일수)를 기준으로 출근율을 계산합니다.
+        영업일 캘린더 범위를 벗어난 기간은 소정근로일수와 출근율을 빈 값으로 둡니다.
+        
+        Args:
+            absent_days (int or list, optional): 기간별 결근일수. 기본값은 None (생성할 때 지정한 결근일수, 없으면 결근 없음).
+        
+        Returns:
+            pandas.DataFrame: 기간별 소정근로일수, 출근일수, 출근율, 연차 발생 요건 충족 여부
+        
+        Raises:
+            ValueError: 결근일수 목록이 산정 기간 수보다 긴 경우
+        """
+        periods = self.get_leave_year_periods()
+        if not periods:
+            return pd.DataFrame(columns=["시작일", "종료일", "소정근로일수", "출근일수", "출근율", "요건 충족"])
+        
+        if absent_days is None:
+            absent_days = self.absent_days
+        
+        starts = np.array([start for start, _ in periods], dtype="datetime64[D]")
+        ends = np.array([end for _, end in periods], dtype="datetime64[D]")
+        absences = self._absence_array(absent_days, len(periods))
+        
+        # 영업일 캘린더 범위 안의 기간만 계산
+        business_calendar = self.get_calendar()
+        covered = np.array([business_calendar.covers(start, end) for start, end in periods], dtype=bool)
+        scheduled = np.full(len(periods), np.nan)
+        rates = np.full(len(periods), np.nan)
+        met = np.full(len(periods), None, dtype=object)
+        
+        if covered.any():
+            scheduled[covered] = business_calendar.count_workdays(starts[covered], ends[covered])
+            rates[covered] = business_calendar.attendance_rate(starts[covered], ends[covered], absences[covered])
+            met[covered] = business_calendar.meets_attendance_requirement(starts[covered], ends[covered], absences[covered])
+        
+        return pd.DataFrame({
+            "시작일": starts,
+            "종료일": ends,
+            "소정근로일수": pd.array(scheduled, dtype="Int64"),
+            "출근일수": pd.array(np.clip(scheduled - absences, 0, None), dtype="Int64"),
+            "출근율": rates,
+            "요건 충족": met
+        })
+    
+    @staticmethod
+    def _absence_array(absent_days, count):
+        """
+        기간별 결근일수를 산정 기간 수에 맞춘 배열로 변환
+        
+        Args:
+            absent_days (int or list): 결근일수 (숫자 하나이면 모든 기간에 적용)
+            count (int): 산정 기간 수
+        
+        Returns:
+            numpy.ndarray: 기간별 결근일수 (지정하지 않은 기간은 0)
+        
+        Raises:
+            ValueError: 결근일수 목록이 산정 기간 수보다 긴 경우
+        """
+        if absent_days is None:
+            return np.zeros(count)
+        
+        values = np.asarray(absent_days, dtype=float)
+        if values.ndim == 0:
+            return np.full(count, float(values))
+        
+        if len(values) > count:
+            raise ValueError(f"결근일수 목록({len(values)}개)이 연차 산정 기간 수({count}개)보다 깁니다.")
+        
+        # 기록이 없는 이후 기간은 결근 없음으로 처리
+        absences = np.zeros(count)
+        absences[:len(values)] = values
+        return absences
+    
+    def _meets_attendance(self, period_start):
+        """
+        입사일 기준 연차 산정 기간의 출근율 요건(80% 이상) 충족 여부
+        
+        결근일수를 지정하지 않았거나, 아직 시작하지 않은 기간이거나, 영업일 캘린더 범위를 벗어난 기간은 충족으로 봅니다.
+        
+        Args:
+            period_start (datetime.date): 산정 기간 시작일 (입사일 또는 입사 기념일)
+        
+        Returns:
+            bool: 요건 충족 여부
+        """
+        if self.absent_days is None:
+            return True
+        
+        if self._attendance_requirements is None:
+            rates = self.get_attendance_rates()
+            self._attendance_requirements = {
+                start.date(): bool(met)
+                for start, met in zip(pd.to_datetime(rates["시작일"]), rates["요건 충족"])
+                if met is not None
+            }
+        
+        return self._attendance_requirements.get(period_start, True)
+    
+    def _prorate_leave(self, leave_days, period_start, period_end, days_in_year=365):
+        """
+        연차일수를 연도 중 재직 기간의 비율로 비례 계산 (소수점 올림)
+        
+        영업일 캘린더가 해당 연도를 포함하면 연간 소정근로일수 대비 기간의 소정근로일수 비율로,
+        포함하지 않으면 달력 일수 비율로 계산합니다.
+        
+        Args:
+            leave_days (int): 1년 전체 재직 시 연차일수
+            period_start (datetime.date): 재직 기간 시작일
+            period_end (datetime.date): 재직 기간 종료일 (포함, 시작일과 같은 연도)
+            days_in_year (int, optional): 달력 일수로 계산할 때의 연간 일수. 기본값은 365.
+        
+        Returns:
+            int: 비례 연차일수
+        """
+        year_start = datetime.date(period_start.year, 1, 1)
+        year_end = datetime.date(period_start.year, 12, 31)
+        business_calendar = self.get_calendar()
+        
+        if business_calendar.covers(year_start, year_end):
+            worked, total = business_calendar.count_workdays(
+                np.array([period_start, year_start], dtype="datetime64[D]"),
+                np.array([period_end, year_end], dtype="datetime64[D]")
+            ).tolist()
+        else:
+            worked = (period_end - period_start).days + 1
+            total = days_in_year
+        
+        return math.ceil(leave_days * worked / total)
+    
+    @staticmethod
+    def _month_date(year, month, day):
+        """
+        해당 월에 없는 일자(31일 등)는 월말로 보정한 날짜 반환
+        """
+        return datetime.date(year, month, min(day, calendar.monthrange(year, month)[1]))
+    
+    @staticmethod
+    def _add_years(date, years):
+        """
+        날짜에 연수 더하기 (2월 29일은 2월 28일로 보정)
+        """
+        try:
+            return date.replace(year=date.year + years)
+        except ValueError:
+            return date.replace(year=date.year + years, day=28)
+    
+    def get_employment_year_schedule(self):
+        """
+        입사연도 기준 연차 발생 일정 계산
+        
+        Returns:
+            list: 연차 발생 일정 리스트 (각 항목은 사전형)
+        """
+        return list(self.iter_employment_year_schedule())
+    
+    def iter_employment_year_schedule(self, since=None, until=None):
+        """
+        입사연도 기준 연차 발생 일정을 발생일 순서대로 생성
+        
+        필요한 만큼만 소비하면 나머지 일정은 계산하지 않습니다.
+        
+        Args:
+            since (datetime.date, optional): 이 날짜 이전에 발생한 연차는 건너뜀. 기본값은 None.
+            until (datetime.date, optional): 계산 종료일. 기본값은 None (calculation_end_date).
+        
+        Yields:
+            dict: 연차 발생 정보 (발생일, 만료일, 연차일수, 비고)
+        """
+        for grant in self._iter_employment_year_grants(until):
+            if since is None or grant["발생일"] >= since:
+                yield grant
+    
+    def _iter_employment_year_grants(self, until):
+        """
+        입사연도 기준 연차 발생 일정 생성 (전체)
+        """
+        end_date = self._resolve_end_date(until)
+        
+        # 근속 첫 해
+        if (datetime.date(self.hire_date.year, 12, 31) - self.hire_date).days < 365:
+            # 1년 미만 근무자는 1개월 근무 시 1일씩 발생
+            for i in range(min(11, 12 - self.hire_date.month + 1)):
+                accrual_date = self._month_date(
+                    self.hire_date.year if self.hire_date.month + i <= 12 else self.hire_date.year + 1,
+                    (self.hire_date.month + i - 1) % 12 + 1,
+                    self.hire_date.day
+                )
+                
+                # 발생일이 퇴사일 이후인 경우 중단
+                if self.termination_date and accrual_date > self.termination_date:
+                    break
+                
+                # 발생일이 현재 계산 종료일 이후인 경우 중단
+                if accrual_date > end_date:
+                    break
+                
+                expiry_date = self._add_years(accrual_date, 1)
+                
+                yield {
+                    "발생일": accrual_date,
+                    "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                    "연차일수": 1,
+                    "비고": f"입사 {i+1}개월차"
+                }
+        else:
+            # 입사일에 바로 15일 부여 (1년 이상 근무한 경우)
+            expiry_date = self._add_years(self.hire_date, 1)
+            yield {
+                "발생일": self.hire_date,
+                "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                "연차일수": 15,
+                "비고": "1년 이상 근무"
+            }
+        
+        # 입사 1주년부터 매년 입사일마다 연차 발생
+        anniversary_date = self._add_years(self.hire_date, 1)
+        
+        for i in range(1, (end_date.year - anniversary_date.year) + 2):
+            current_anniversary = self._add_years(anniversary_date, i - 1)
+            
+            # 발생일이 퇴사일 이후인 경우 중단
+            if self.termination_date and current_anniversary > self.termination_date:
+                break
+            
+            # 발생일이 현재 계산 종료일 이후인 경우 중단
+            if current_anniversary > end_date:
+                break
+            
+            years_worked = i + 1  # 1주년 + i년
+            additional_days = min((years_worked - 1) // 2, 10) if years_worked >= 3 else 0
+            annual_leave = 15 + additional_days
+            note = f"근속 {years_worked}년차" + (f" (+{additional_days}일)" if additional_days > 0 else "")
+            
+            # 직전 1년의 출근율이 80% 미만이면 연차 미발생
+            if not self._meets_attendance(self._add_years(self.hire_date, i - 1)):
+                annual_leave = 0
+                note = f"근속 {years_worked}년차 (직전 1년 출근율 80% 미만)"
+            
+            expiry_date = self._add_years(current_anniversary, 1)
+            
+            yield {
+                "발생일": current_anniversary,
+                "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                "연차일수": annual_leave,
+                "비고": note
+            }
+    
+    def get_fiscal_year_schedule(self):
+        """
+        회계연도 기준 연차 발생 일정 계산
+        
+        Returns:
+            list: 연차 발생 일정 리스트 (각 항목은 사전형)
+        """
+        return list(self.iter_fiscal_year_schedule())
+    
+    def iter_fiscal_year_schedule(self, since=None, until=None):
+        """
+        회계연도 기준 연차 발생 일정을 발생일 순서대로 생성
+        
+        필요한 만큼만 소비하면 나머지 일정은 계산하지 않습니다.
+        
+        Args:
+            since (datetime.date, optional): 이 날짜 이전에 발생한 연차는 건너뜀. 기본값은 None.
+            until (datetime.date, optional): 계산 종료일. 기본값은 None (calculation_end_date).
+        
+        Yields:
+            dict: 연차 발생 정보 (발생일, 만료일, 연차일수, 비고)
+        """
+        for grant in self._iter_fiscal_year_grants(until):
+            if since is None or grant["발생일"] >= since:
+                yield grant
+    
+    def _iter_fiscal_year_grants(self, until):
+        """
+        회계연도 기준 연차 발생 일정 생성 (전체)
+        """
+        end_date = self._resolve_end_date(until)
+        
+        # 입사 첫해
+        if self.hire_date.month == 1 and self.hire_date.day == 1:
+            # 1월 1일 입사는 바로 15일 부여
+            expiry_date = datetime.date(self.hire_date.year + 1, 1, 1)
+            yield {
+                "발생일": self.hire_date,
+                "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                "연차일수": 15,
+                "비고": "1월 1일 입사"
+            }
+        else:
+            # 입사 후 1개월마다 1일씩 발생 (최대 11일)
+            months_in_first_year = 12 - self.hire_date.month + (1 if self.hire_date.day == 1 else 0)
+            
+            for i in range(min(11, months_in_first_year)):
+                accrual_date = self._month_date(
+                    self.hire_date.year if self.hire_date.month + i <= 12 else self.hire_date.year + 1,
+                    (self.hire_date.month + i - 1) % 12 + 1,
+                    self.hire_date.day
+                )
+                
+                # 발생일이 퇴사일 이후인 경우 중단
+                if self.termination_date and accrual_date > self.termination_date:
+                    break
+                
+                # 발생일이 현재 계산 종료일 이후인 경우 중단
+                if accrual_date > end_date:
+                    break
+                
+                expiry_date = datetime.date(self.hire_date.year + 1, 1, 1)
+                
+                yield {
+                    "발생일": accrual_date,
+                    "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                    "연차일수": 1,
+                    "비고": f"입사 {i+1}개월차"
+                }
+        
+        # 입사 다음 해 1월 1일부터 매년 1월 1일마다 연차 발생
+        next_fiscal_year = datetime.date(self.hire_date.year + 1, 1, 1)
+        
+        for i in range(0, (end_date.year - next_fiscal_year.year) + 1):
+            current_fiscal_year = next_fiscal_year.replace(year=next_fiscal_year.year + i)
+            
+            # 발생일이 퇴사일 이후인 경우 중단
+            if self.termination_date and current_fiscal_year > self.termination_date:
+                break
+            
+            # 발생일이 현재 계산 종료일 이후인 경우 중단
+            if current_fiscal_year > end_date:
+                break
+            
+            # 첫 번째 회계연도의 비례 연차 계산
+            if i == 0 and (current_fiscal_year - self.hire_date).days < 365:
+                days_worked_prev_year = (datetime.date(current_fiscal_year.year - 1, 12, 31) - self.hire_date).days + 1
+                annual_leave = self._prorate_leave(15, self.hire_date, datetime.date(current_fiscal_year.year - 1, 12, 31))  # 소수점 올림
+                note = f"비례 연차 (전년도 근무 {days_worked_prev_year}일)"
+            else:
+                # 입사일부터 현재 회계연도까지의 근속 연수 계산
+                years_worked = (current_fiscal_year - self.hire_date).days // 365
+                
+                # 기본 15일
+                annual_leave = 15
+                
+                # 3년 이상 근속시 2년마다 1일씩 추가 (최대 25일)
+                additional_days = 0
+                if years_worked >= 3:
+                    additional_days = min((years_worked - 1) // 2, 10)  # 최대 10일 추가
+                    annual_leave += additional_days
+                
+                note = f"근속 {years_worked+1}년차" + (f" (+{additional_days}일)" if additional_days > 0 else "")
+            
+            expiry_date = datetime.date(current_fiscal_year.year + 1, 1, 1)
+            
+            yield {
+                "발생일": current_fiscal_year,
+                "만료일": min(expiry_date, end_date) if self.termination_date is None else min(expiry_date, self.termination_date),
+                "연차일수": annual_leave,
+                "비고": note
+            }
+    
+    def get_next_grant(self, method="employment", as_of=None):
+        """
+        기준일 이후 다음 연차 발생 정보 조회
+        
+        Args:
+            method (str, optional): 계산 방식 ('employment': 입사일 기준, 'fiscal': 회계연도 기준). 기본값은 'employment'.
+            as_of (datetime.date, optional): 기준일. 기본값은 None (계산 기준일).
+        
+        Returns:
+            dict: 다음 연차 발생 정보 (없으면 None)
+        """
+        since = as_of if as_of is not None else self.today
+        schedule = self.iter_employment_year_schedule if method == "employment" else self.iter_fiscal_year_schedule
+        return next(schedule(since=since), None)
+    
+    def generate_annual_leave_table(self, years=5):
+        """
+        연차휴가 발생 테이블 생성
+        
+        Args:
+            years (int, optional): 계산할 연도 수. 기본값은 5.
+            
+        Returns:
+            pandas.DataFrame: 연차휴가 발생 테이블
+        """
+        # 입사일 기준 및 회계연도 기준 연차휴가 계산
+        employment_year_leaves = self.get_employment_year_leaves()
+        fiscal_year_leaves = self.get_fiscal_year_leaves()
+        
+        # 결과를 담을 데이터 프레임 준비
+        data = []
+        current_date = self.hire_date
+        
+        # 각 월별 데이터 생성
+        for year in range(self.hire_date.year, self.hire_date.year + years):
+            for month in range(1, 13):
+                # 입사일 이전 월은 건너뛰기
+                if year == self.hire_date.year and month < self.hire_date.month:
+                    continue
+                
+                # 입사일로부터의 근속기간 계산
+                current_date = datetime.date(year, month, min(self.hire_date.day, calendar.monthrange(year, month)[1]))
+                years_worked = (current_date.year - self.hire_date.year)
+                months_worked = (current_date.year - self.hire_date.year) * 12 + (current_date.month - self.hire_date.month)
+                
+                # 해당 월의 누적 근속일수
+                days_worked = (current_date - self.hire_date).days
+                
+                # 입사일 기준 연차휴가 계산
+                employment_leave = 0
+                if (current_date - self.hire_date).days < 365:
+                    # 1년 미만: 1개월마다 1일씩 (최대 11일)
+                    employment_leave = min(months_worked, 11)
+                else:
+                    # 입사 1주년이 지난 시점 여부 확인
+                    anniversary = self._add_years(self.hire_date, years_worked)
+                    if current_date >= anniversary:
+                        base_leave = 15
+                        # 3년 이상 근속 시 추가 연차
+                        if years_worked >= 3:
+                            additional_days = min((years_worked - 1) // 2, 10)
+                            base_leave += additional_days
+                        employment_leave = base_leave
+                    else:
+                        # 1년 경과 전 연차: 전년도 발생 연차 사용
+                        employment_leave = min(months_worked, 11)
+                
+                # 회계연도 기준 연차휴가 계산
+                fiscal_leave = 0
+                if current_date.month == 1 and current_date.day == 1:
+                    # 1월 1일에 비례 연차 또는 15일 부여
+                    if year == self.hire_date.year + 1:
+                        days_worked_prev_year = (datetime.date(year-1, 12, 31) - self.hire_date).days + 1
+                        if days_worked_prev_year < 365:
+                            fiscal_leave = self._prorate_leave(15, self.hire_date, datetime.date(year-1, 12, 31))
+                        else:
+                            fiscal_leave = 15
+                    else:
+                        # 회계연도 기준 연차 계산
+                        fiscal_year_worked = (datetime.date(year, 1, 1) - self.hire_date).days // 365
+                        base_leave = 15
+                        if fiscal_year_worked >= 3:
+                            additional_days = min((fiscal_year_worked - 1) // 2, 10)
+                            base_leave += additional_days
+                        fiscal_leave = base_leave
+                else:
+                    # 1월 1일이 아닌 경우, 현재 회계연도의 연차
+                    if year in fiscal_year_leaves:
+                        fiscal_leave = fiscal_year_leaves[year]
+                    # 초년도 월별 발생 연차
+                    if year == self.hire_date.year and months_worked > 0:
+                        fiscal_leave = min(months_worked, 11)
+                
+                # 데이터 저장
+                data.append({
+                    "기준일": current_date.strftime("%Y-%m-%d"),
+                    "근속기간(년)": years_worked,
+                    "근속기간(월)": months_worked,
+                    "입사일 기준 연차": employment_leave,
+                    "회계연도 기준 연차": fiscal_leave
+                })
+                
+                # 퇴사한 경우 해당 월까지만 계산
+                if self.termination_date and current_date >= self.termination_date:
+                    break
+            
+            # 퇴사한 경우 해당 연도까지만 계산
+            if self.termination_date and current_date >= self.termination_date:
+                break
+        
+        return pd.DataFrame(data)
+    
+    def get_annual_leave_comparison(self, years=5):
+        """
+        입사일 기준과 회계연도 기준 연차휴가 비교
+        
+        Args:
+            years (int, optional): 계산할 연도 수. 기본값은 5.
+            
+        Returns:
+            dict: 비교 정보
+        """
+        # 연차휴가 발생 테이블
+        df = self.generate_annual_leave_table(years)
+        
+        # 마지막 행 기준 연차휴가 일수
+        last_row = df.iloc[-1]
+        employment_leave = last_row["입사일 기준 연차"]
+        fiscal_leave = last_row["회계연도 기준 연차"]
+        
+        # 누적 연차휴가 일수
+        employment_total = df["입사일 기준 연차"].sum()
+        fiscal_total = df["회계연도 기준 연차"].sum()
+        
+        # 두 방식의 차이
+        difference = fiscal_leave - employment_leave
+        total_difference = fiscal_total - employment_total
+        
+        # 각 연도별 연차휴가 일수
+        annual_data = {}
+        for year in range(self.hire_date.year, self.hire_date.year + years):
+            year_df = df[df["기준일"].str.startswith(str(year))]
+            if not year_df.empty:
+                annual_data[year] = {
+                    "입사일 기준": year_df["입사일 기준 연차"].max(),
+                    "회계연도 기준": year_df["회계연도 기준 연차"].max()
+                }
+        
+        return {
+            "현재 연차일수": {
+                "입사일 기준": employment_leave,
+                "회계연도 기준": fiscal_leave,
+                "차이": difference
+            },
+            "누적 연차일수": {
+                "입사일 기준": employment_total,
+                "회계연도 기준": fiscal_total,
+                "차이": total_difference
+            },
+            "연도별 연차일수": annual_data
+        }
@@ -0,0 +1,313 @@
+"""
+business_calendar.py - 영업일 캘린더
+
+양력 고정 공휴일, 음력 공휴일 표(설날, 부처님오신날, 추석), 대체공휴일로 2015~2030년의 근무일을 계산합니다.
+"""
+
+import datetime
+import functools
+import numpy as np
+
+# 양력 고정 공휴일 (월, 일)
+SOLAR_HOLIDAYS = [
+    (1, 1),    # 신정
+    (3, 1),    # 삼일절
+    (5, 5),    # 어린이날
+    (6, 6),    # 현충일
+    (8, 15),   # 광복절
+    (10, 3),   # 개천절
+    (10, 9),   # 한글날
+    (12, 25),  # 성탄절
+]
+
+# 음력 공휴일의 양력 환산일 (연도: (설날, 부처님오신날, 추석))
+# 설날과 추석은 당일 기준이며 전날과 다음날이 함께 휴일로 지정됩니다.
+LUNAR_HOLIDAYS = {
+    2015: ((2, 19), (5, 25), (9, 27)),
+    2016: ((2, 8), (5, 14), (9, 15)),
+    2017: ((1, 28), (5, 3), (10, 4)),
+    2018: ((2, 16), (5, 22), (9, 24)),
+    2019: ((2, 5), (5, 12), (9, 13)),
+    2020: ((1, 25), (4, 30), (10, 1)),
+    2021: ((2, 12), (5, 19), (9, 21)),
+    2022: ((2, 1), (5, 8), (9, 10)),
+    2023: ((1, 22), (5, 27), (9, 29)),
+    2024: ((2, 10), (5, 15), (9, 17)),
+    2025: ((1, 29), (5, 5), (10, 6)),
+    2026: ((2, 17), (5, 24), (9, 25)),
+    2027: ((2, 7), (5, 13), (9, 15)),
+    2028: ((1, 27), (5, 2), (10, 3)),
+    2029: ((2, 13), (5, 20), (9, 22)),
+    2030: ((2, 3), (5, 9), (9, 12)),
+}
+
+# 대체공휴일 적용 시작 연도
+# - 설날/추석/어린이날: 2014년부터
+# - 삼일절/광복절/개천절/한글날: 2021년부터 (광복절은 2021년 8월 시행)
+# - 부처님오신날/성탄절: 2023년부터
+SUBSTITUTE_HOLIDAY_START = {
+    "lunar_new_year": 2014,
+    "chuseok": 2014,
+    "childrens_day": 2014,
+    "national": 2021,
+    "buddha_christmas": 2023,
+}
+
+# 요일 마스크 (월~일, 1: 근무일)
+DEFAULT_WEEKMASK = "1111100"
+
+class BusinessCalendar:
+    """
+    영업일 캘린더 클래스
+    
+    지정한 연도 범위의 주말과 한국 공휴일을 비트맵으로 미리 계산해 두고,
+    누적합을 이용해 기간별 근무일수와 출근율을 벡터 연산으로 계산합니다.
+    """
+    
+    def __init__(self, start_year=None, end_year=None, extra_holidays=None, weekmask=DEFAULT_WEEKMASK):
+        """
+        초기화
+        
+        Args:
+            start_year (int, optional): 캘린더 시작 연도. 기본값은 None (공휴일 표의 첫 연도).
+            end_year (int, optional): 캘린더 종료 연도. 기본값은 None (공휴일 표의 마지막 연도).
+            extra_holidays (list, optional): 추가 휴일 목록 (선거일, 임시공휴일, 회사 지정 휴일 등). 기본값은 None.
+            weekmask (str, optional): 월요일부터 일요일까지의 근무 여부 ("1111100"). 기본값은 주 5일 근무.
+        
+        Raises:
+            ValueError: 연도 범위가 잘못되었거나 음력 공휴일 표(LUNAR_HOLIDAYS)를 벗어난 경우
+        """
+        self.start_year = start_year if start_year is not None else min(LUNAR_HOLIDAYS)
+        self.end_year = end_year if end_year is not None else max(LUNAR_HOLIDAYS)
+        
+        if self.start_year > self.end_year:
+            raise ValueError("캘린더 시작 연도가 종료 연도보다 늦습니다.")
+        
+        # 음력 공휴일 표가 없는 연도는 설날·추석이 빠진 캘린더가 되므로 만들지 않음
+        if self.start_year < min(LUNAR_HOLIDAYS) or self.end_year > max(LUNAR_HOLIDAYS):
+            raise ValueError(
+                f"음력 공휴일 표가 있는 연도({min(LUNAR_HOLIDAYS)}~{max(LUNAR_HOLIDAYS)}년)만 캘린더를 만들 수 있습니다."
+            )
+        
+        self.weekmask = weekmask
+        self.start = np.datetime64(f"{self.start_year}-01-01", "D")
+        self.end = np.datetime64(f"{self.end_year + 1}-01-01", "D")
+        
+        # 공휴일 목록 생성
+        self.holidays = self._build_holidays(extra_holidays)
+        
+        # 근무일 비트맵 생성 (True: 근무일)
+        days = np.arange(self.start, self.end, dtype="datetime64[D]")
+        weekday = (days.astype("int64") - 4) % 7  # 1970-01-01은 목요일
+        workday_mask = np.array([flag == "1" for flag in weekmask], dtype=bool)
+        self.workdays = workday_mask[weekday]
+        
+        holiday_offsets = (self.holidays - self.start).astype("int64")
+        self.workdays[holiday_offsets] = False
+        
+        # 누적 근무일수 (cumulative[i]: 시작일부터 i일 전까지의 근무일수)
+        self.cumulative = np.concatenate(([0], np.cumsum(self.workdays, dtype=np.int64)))
+    
+    def _build_holidays(self, extra_holidays):
+        """
+        공휴일 목록 생성
+        
+        Args:
+            extra_holidays (list): 추가 휴일 목록
+        
+        Returns:
+            numpy.ndarray: 캘린더 범위 안의 공휴일 (datetime64[D], 정렬됨)
+        """
+        holidays = set()
+        
+        for year in range(self.start_year, self.end_year + 1):
+            fixed = {
+                (month, day): datetime.date(year, month, day)
+                for month, day in SOLAR_HOLIDAYS
+                # 한글날은 2013년부터 공휴일로 재지정
+                if not ((month, day) == (10, 9) and year < 2013)
+            }
+            holidays.update(fixed.values())
+            
+            (seollal, buddha, chuseok) = LUNAR_HOLIDAYS[year]
+            seollal_day = datetime.date(year, *seollal)
+            chuseok_day = datetime.date(year, *chuseok)
+            buddha_day = datetime.date(year, *buddha)
+            
+            seollal_days = [seollal_day + datetime.timedelta(days=i) for i in (-1, 0, 1)]
+            chuseok_days = [chuseok_day + datetime.timedelta(days=i) for i in (-1, 0, 1)]
+            
+            holidays.update(seollal_days)
+            holidays.update(chuseok_days)
+            holidays.add(buddha_day)
+            
+            # 대체공휴일 계산
+            substitutes = []
+            
+            # 설날/추석: 일요일 또는 다른 공휴일과 겹치는 경우
+            for key, group in (("lunar_new_year", seollal_days), ("chuseok", chuseok_days)):
+                if year < SUBSTITUTE_HOLIDAY_START[key]:
+                    continue
+                others = holidays.difference(group)
+                overlap = sum(1 for day in group if day.weekday() == 6 or day in others)
+                substitutes.extend([group[-1]] * overlap)
+            
+            # 어린이날: 토요일, 일요일 또는 다른 공휴일과 겹치는 경우
+            childrens_day = fixed[(5, 5)]
+            if year >= SUBSTITUTE_HOLIDAY_START["childrens_day"]:
+                if childrens_day.weekday() >= 5 or childrens_day == buddha_day:
+                    substitutes.append(childrens_day)
+            
+            # 국경일: 토요일 또는 일요일인 경우
+            if year >= SUBSTITUTE_HOLIDAY_START["national"]:
+                for month_day in ((3, 1), (8, 15), (10, 3), (10, 9)):
+                    day = fixed.get(month_day)
+                    if day is not None and day.weekday() >= 5:
+                        substitutes.append(day)
+            
+            # 부처님오신날/성탄절: 토요일 또는 일요일인 경우
+            if year >= SUBSTITUTE_HOLIDAY_START["buddha_christmas"]:
+                for day in (buddha_day, fixed[(12, 25)]):
+                    if day.weekday() >= 5:
+                        substitutes.append(day)
+            
+            # 기준일 이후 첫 번째 비공휴일 평일을 대체공휴일로 지정
+            for day in sorted(substitutes):
+                candidate = day + datetime.timedelta(days=1)
+                while candidate.weekday() >= 5 or candidate in holidays:
+                    candidate += datetime.timedelta(days=1)
+                holidays.add(candidate)
+        
+        if extra_holidays is not None:
+            holidays.update(np.asarray(extra_holidays, dtype="datetime64[D]").tolist())
+        
+        result = np.unique(np.array(sorted(holidays), dtype="datetime64[D]"))
+        return result[(result >= self.start) & (result < self.end)]
+    
+    def _to_offsets(self, dates):
+        """
+        날짜를 캘린더 시작일 기준 오프셋으로 변환
+        
+        Args:
+            dates: 날짜 또는 날짜 배열 (datetime.date, 문자열, numpy/pandas 날짜)
+        
+        Returns:
+            numpy.ndarray: 오프셋 배열
+        """
+        values = np.asarray(dates).astype("datetime64[D]")
+        
+        if np.any(values < self.start) or np.any(values > self.end):
+            raise ValueError(
+                f"캘린더 범위({self.start_year}~{self.end_year}년)를 벗어난 날짜가 있습니다."
+            )
+        
+        return (values - self.start).astype(np.int64)
+    
+    def covers(self, period_start, period_end):
+        """
+        기간 전체가 캘린더 범위 안에 있는지 확인
+        
+        Args:
+            period_start: 기간 시작일
+            period_end: 기간 종료일 (포함)
+        
+        Returns:
+            bool: 캘린더 범위 안이면 True
+        """
+        start = np.datetime64(period_start, "D")
+        end = np.datetime64(period_end, "D")
+        return bool(self.start <= start and end < self.end)
+    
+    def is_workday(self, dates):
+        """
+        근무일 여부 확인
+        
+        Args:
+            dates: 날짜 또는 날짜 배열
+        
+        Returns:
+            numpy.ndarray: 근무일 여부 배열
+        """
+        offsets = self._to_offsets(dates)
+        if np.any(offsets >= len(self.workdays)):
+            raise ValueError(f"캘린더 범위({self.start_year}~{self.end_year}년)를 벗어난 날짜가 있습니다.")
+        return self.workdays[offsets]
+    
+    def busday_count(self, begin_dates, end_dates):
+        """
+        기간별 근무일수 계산 (numpy.busday_count와 동일하게 종료일은 포함하지 않음)
+        
+        Args:
+            begin_dates: 시작일 또는 시작일 배열
+            end_dates: 종료일(미포함) 또는 종료일 배열
+        
+        Returns:
+            numpy.ndarray: 근무일수 배열 (종료일이 시작일보다 빠르면 음수)
+        """
+        begin = self._to_offsets(begin_dates)
+        end = self._to_offsets(end_dates)
+        return self.cumulative[end] - self.cumulative[begin]
+    
+    def count_workdays(self, period_start, period_end):
+        """
+        기간별 근무일수 계산 (시작일과 종료일 모두 포함)
+        
+        Args:
+            period_start: 기간 시작일 또는 배열
+            period_end: 기간 종료일 또는 배열
+        
+        Returns:
+            numpy.ndarray: 근무일수 배열
+        """
+        end = np.asarray(period_end, dtype="datetime64[D]") + np.timedelta64(1, "D")
+        return np.maximum(self.busday_count(period_start, end), 0)
+    
+    def attendance_rate(self, period_start, period_end, absent_days=0):
+        """
+        기간별 출근율 계산
+        
+        소정근로일수(기간 내 근무일수) 대비 출근일수의 비율을 계산합니다.
+        
+        Args:
+            period_start: 기간 시작일 또는 배열
+            period_end: 기간 종료일(포함) 또는 배열
+            absent_days (int or array, optional): 결근일수. 기본값은 0.
+        
+        Returns:
+            numpy.ndarray: 출근율 배열 (0.0 ~ 1.0, 소정근로일이 없으면 nan)
+        """
+        scheduled = self.count_workdays(period_start, period_end).astype(float)
+        attended = np.clip(scheduled - np.asarray(absent_days, dtype=float), 0, None)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(scheduled > 0, attended / scheduled, np.nan)
+    
+    def meets_attendance_requirement(self, period_start, period_end, absent_days=0, threshold=0.8):
+        """
+        연차휴가 발생 요건(출근율 80% 이상) 충족 여부 확인
+        
+        Args:
+            period_start: 기간 시작일 또는 배열
+            period_end: 기간 종료일(포함) 또는 배열
+            absent_days (int or array, optional): 결근일수. 기본값은 0.
+            threshold (float, optional): 기준 출근율. 기본값은 0.8.
+        
+        Returns:
+            numpy.ndarray: 요건 충족 여부 배열
+        """
+        rate = self.attendance_rate(period_start, period_end, absent_days)
+        return np.nan_to_num(rate, nan=0.0) >= threshold
+
+@functools.lru_cache(maxsize=8)
+def get_business_calendar(start_year=None, end_year=None):
+    """
+    프로세스 단위로 캐시된 영업일 캘린더 반환
+    
+    Args:
+        start_year (int, optional): 캘린더 시작 연도. 기본값은 None.
+        end_year (int, optional): 캘린더 종료 연도. 기본값은 None.
+    
+    Returns:
+        BusinessCalendar: 영업일 캘린더
+    """
+    return BusinessCalendar(start_year, end_year)
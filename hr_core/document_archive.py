@@ -0,0 +1,37 @@
+"""
+document_archive.py - 문서 ZIP 묶음 생성
+
+임금명세서나 근로계약서처럼 한 건씩 생성되는 문서를 ZIP 파일에 차례로 기록합니다.
+문서는 생성되는 즉시 압축하여 기록하므로, 전체 문서를 메모리에 모으지 않고
+한 번에 문서 한 건만 메모리에 올립니다.
+"""
+
+import zipfile
+
+def write_zip_archive(target, documents, compresslevel=6):
+    """
+    문서를 ZIP 파일로 기록
+    
+    Args:
+        target (str or file): ZIP 파일 경로 또는 쓰기 가능한 바이너리 스트림
+            (탐색할 수 없는 스트림도 가능)
+        documents (iterable): (파일 이름, 내용) 튜플을 차례로 생성하는 반복 가능 객체
+            (내용은 str 또는 bytes, 생성기를 넘기면 기록할 때 한 건씩 생성)
+        compresslevel (int, optional): 압축 수준 (0~9). 기본값은 6.
+    
+    Returns:
+        int: 기록한 문서 수
+    """
+    count = 0
+    
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as archive:
+        for file_name, content in documents:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            
+            # 항목을 열어 바로 압축 기록 (문서 단위로만 메모리 사용)
+            with archive.open(file_name, "w") as entry:
+                entry.write(content)
+            count += 1
+    
+    return count
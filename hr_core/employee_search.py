@@ -0,0 +1,200 @@
+"""
+employee_search.py - 직원 검색 색인
+
+이름, 부서, 직원 ID를 1글자/2글자 단위(n-gram)로 색인하여 직원 선택 목록에
+표시할 검색 결과를 빠르게 찾습니다. 초성(ㄱ, ㄴ, ㄷ ...)으로 입력하면 이름과 부서의
+초성과 비교하며, "김ㅊ"처럼 완성된 글자와 초성을 섞어 입력해도 찾을 수 있습니다.
+"""
+
+# 한글 초성 (유니코드 한글 음절 순서)
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+_CHOSUNG_SET = frozenset(CHOSUNG)
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSUNG = 588
+
+# 앞부분 일치용 색인 키 표시 문자
+_PREFIX_MARK = "\x02"
+
+def get_initials(text):
+    """
+    문자열의 한글 음절을 초성으로 변환 (한글 음절이 아닌 문자는 그대로 유지)
+    
+    Args:
+        text (str): 변환할 문자열
+    
+    Returns:
+        str: 초성 문자열 (길이는 원래 문자열과 같음)
+    """
+    return "".join(
+        CHOSUNG[(ord(char) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSUNG]
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST else char
+        for char in text
+    )
+
+def _normalize(value):
+    """
+    검색어와 색인 값 정규화 (앞뒤 공백 제거, 소문자 변환)
+    """
+    if value is None or value != value:
+        return ""
+    return str(value).strip().lower()
+
+def _add_grams(index, key, rank):
+    """
+    색인 키의 1글자/2글자 조각과 앞부분 조각을 색인에 추가
+    
+    Args:
+        index (dict): 조각별 직원 순번 목록
+        key (str): 색인 키
+        rank (int): 직원 순번 (이름 순)
+    """
+    grams = {key[start:start + size] for size in (1, 2) for start in range(len(key) - size + 1)}
+    grams.add(_PREFIX_MARK + key[:1])
+    grams.add(_PREFIX_MARK + key[:2])
+    
+    for gram in grams:
+        postings = index.setdefault(gram, [])
+        # 직원 순번 순서로 추가하므로 마지막 값만 확인하면 중복을 막을 수 있음
+        if not postings or postings[-1] != rank:
+            postings.append(rank)
+
+class EmployeeSearchIndex:
+    """
+    직원 검색 색인 클래스
+    
+    직원 목록으로 한 번 만들어 두고, 직원 정보가 바뀌면 새로 만듭니다.
+    검색 결과는 앞부분 일치를 먼저, 그다음 부분 일치를 이름 순으로 반환합니다.
+    """
+    
+    # 검색 대상 열
+    SEARCH_COLUMNS = ["name", "department", "employee_id"]
+    
+    def __init__(self, employees):
+        """
+        직원 검색 색인 생성
+        
+        Args:
+            employees (pandas.DataFrame): 직원 목록 (employee_id, name, department 열)
+        """
+        employees = employees.sort_values("name", kind="stable")
+        
+        self.employee_ids = employees["employee_id"].astype(str).tolist()
+        self.names = employees["name"].fillna("").astype(str).tolist()
+        self._ranks = {employee_id: rank for rank, employee_id in enumerate(self.employee_ids)}
+        
+        # 직원 순번별 (색인 키, 초성 키) 목록과 조각 색인
+        self._keys = []
+        self._grams = {}
+        self._initial_grams = {}
+        
+        columns = [employees[column] if column in employees.columns else [None] * len(employees) for column in self.SEARCH_COLUMNS]
+        
+        for rank, values in enumerate(zip(*columns)):
+            keys = []
+            for value in values:
+                key = _normalize(value)
+                if not key:
+                    continue
+                initials = get_initials(key)
+                keys.append((key, initials))
+                _add_grams(self._grams, key, rank)
+                _add_grams(self._initial_grams, initials, rank)
+            self._keys.append(keys)
+    
+    def __len__(self):
+        return len(self.employee_ids)
+    
+    def _match_position(self, rank, query, pattern, use_initials):
+        """
+        직원의 색인 키에서 검색어가 처음 일치하는 위치
+        
+        Args:
+            rank (int): 직원 순번
+            query (str): 정규화된 검색어
+            pattern (str): 조각 색인에서 찾은 패턴 (초성 검색이면 검색어의 초성)
+            use_initials (bool): 초성 검색 여부
+        
+        Returns:
+            int: 가장 앞선 일치 위치 (일치하지 않으면 None)
+        """
+        best = None
+        
+        for key, initials in self._keys[rank]:
+            target = initials if use_initials else key
+            start = target.find(pattern)
+            while start >= 0:
+                # 초성 검색에서 완성된 글자는 원래 글자와 같아야 함
+                if not use_initials or all(
+                    char in _CHOSUNG_SET or key[start + offset] == char
+                    for offset, char in enumerate(query)
+                ):
+                    if best is None or start < best:
+                        best = start
+                    break
+                start = target.find(pattern, start + 1)
+        
+        return best
+    
+    def search(self, query, limit=20):
+        """
+        검색어와 일치하는 직원 ID 검색
+        
+        Args:
+            query (str): 검색어 (이름, 부서, 직원 ID의 일부 또는 초성)
+            limit (int, optional): 최대 결과 수. 기본값은 20.
+        
+        Returns:
+            list: 직원 ID 목록 (검색어가 비어 있으면 이름 순으로 앞에서부터 limit명)
+        """
+        query = _normalize(query)
+        
+        if not query:
+            return self.employee_ids[:limit]
+        
+        use_initials = any(char in _CHOSUNG_SET for char in query)
+        if use_initials:
+            index = self._initial_grams
+            pattern = get_initials(query)
+        else:
+            index = self._grams
+            pattern = query
+        
+        results = []
+        found = set()
+        
+        # 앞부분 일치 (이름 순)
+        for rank in index.get(_PREFIX_MARK + pattern[:2], []):
+            if self._match_position(rank, query, pattern, use_initials) == 0:
+                results.append(rank)
+                found.add(rank)
+                if len(results) >= limit:
+                    return [self.employee_ids[rank] for rank in results]
+        
+        # 부분 일치 (가장 짧은 조각 목록의 후보만 확인)
+        grams = [pattern[start:start + 2] for start in range(len(pattern) - 1)] or [pattern]
+        candidates = min((index.get(gram, []) for gram in grams), key=len)
+        
+        for rank in candidates:
+            if rank in found:
+                continue
+            if self._match_position(rank, query, pattern, use_initials) is not None:
+                results.append(rank)
+                if len(results) >= limit:
+                    break
+        
+        return [self.employee_ids[rank] for rank in results]
+    
+    def get_name(self, employee_id):
+        """
+        직원 ID의 이름 조회
+        
+        Args:
+            employee_id (str): 직원 ID
+        
+        Returns:
+            str: 이름 (색인에 없으면 None)
+        """
+        rank = self._ranks.get(employee_id)
+        return None if rank is None else self.names[rank]
@@ -0,0 +1,343 @@
+"""
+employment_contract.py - 근로계약서 HTML 생성
+
+Streamlit에 의존하지 않으므로 명령행 도구와 작업 프로세스에서도 사용할 수 있습니다.
+"""
+
+import datetime
+import functools
+
+from hr_core.html_template import compile_template
+
+# 근로계약서 CSS 스타일
+CONTRACT_CSS = """
+        <style>
+            body {
+                font-family: 'Malgun Gothic', 'Gulim', sans-serif;
+                line-height: 1.6;
+                margin: 40px;
+                color: #333;
+            }
+            h1 {
+                text-align: center;
+                font-size: 24px;
+                margin-bottom: 30px;
+            }
+            h2 {
+                font-size: 18px;
+                margin-top: 20px;
+                margin-bottom: 10px;
+                border-bottom: 1px solid #ccc;
+                padding-bottom: 5px;
+            }
+            .contract-section {
+                margin-bottom: 20px;
+            }
+            .signature {
+                margin-top: 40px;
+                text-align: center;
+            }
+            .signature-table {
+                width: 100%;
+                border-collapse: collapse;
+                margin-top: 20px;
+            }
+            .signature-table td {
+                padding: 10px;
+                vertical-align: top;
+            }
+            ul {
+                list-style-type: none;
+                padding-left: 0;
+            }
+            li {
+                margin-bottom: 8px;
+                padding-left: 20px;
+                position: relative;
+            }
+            li:before {
+                content: "-";
+                position: absolute;
+                left: 0;
+            }
+            .print-button {
+                text-align: center;
+                margin: 20px;
+            }
+            @media print {
+                .print-button {
+                    display: none;
+                }
+                body {
+                    margin: 0;
+                    padding: 20px;
+                }
+            }
+        </style>
+        """
+
+# 근로계약서 인쇄 기능 JavaScript
+CONTRACT_SCRIPT = """
+        <script>
+            function printContract() {
+                window.print();
+            }
+        </script>
+        """
+
+# 근로계약서 문서 골격 (${필드명} 자리에 값을 채움)
+CONTRACT_HTML = """
+        <!DOCTYPE html>
+        <html lang="ko">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>근로계약서 - ${employee_name}</title>
+            ${css_style}
+            ${print_script}
+        </head>
+        <body>
+            <div class="print-button">
+                <button onclick="printContract()">인쇄하기</button>
+            </div>
+            
+            <h1>근 로 계 약 서</h1>
+            
+            <div class="contract-section">
+                <h2>1. 사업주</h2>
+                <ul>
+                    <li>사업체명: ${company_name}</li>
+                    <li>사업자등록번호: ${business_number}</li>
+                    <li>주소: ${company_address}</li>
+                    <li>대표자: ${representative}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>2. 근로자</h2>
+                <ul>
+                    <li>성명: ${employee_name}</li>
+                    <li>주민등록번호: ${employee_id_number}</li>
+                    <li>주소: ${employee_address}</li>
+                    <li>연락처: ${employee_phone}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>3. 근로 계약 기간</h2>
+                <ul>
+                    <li>근로계약기간: ${contract_start_date} ~ ${contract_end_date}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>4. 근무 장소 및 업무 내용</h2>
+                <ul>
+                    <li>근무 장소: ${work_place}</li>
+                    <li>업무 내용: ${job_description}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>5. 근로 시간 및 휴게 시간</h2>
+                <ul>
+                    <li>근로시간: ${work_start_time} ~ ${work_end_time}</li>
+                    <li>휴게시간: ${break_time}</li>
+                    <li>근무일/휴일: ${work_days} / ${holidays}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>6. 임금</h2>
+                <ul>
+                    <li>기본급: ${base_salary}원</li>
+                    <li>상여금: ${bonus}</li>
+                    <li>기타 수당: ${other_allowances}</li>
+                    <li>임금 지급일: 매월 ${payment_day}일</li>
+                    <li>지급 방법: ${payment_method}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>7. 사회보험 적용 여부</h2>
+                <ul>
+                    <li>고용보험: ${employment_insurance}</li>
+                    <li>산재보험: ${industrial_accident_insurance}</li>
+                    <li>국민연금: ${national_pension}</li>
+                    <li>건강보험: ${health_insurance}</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>8. 휴가</h2>
+                <ul>
+                    <li>연차유급휴가: 근로기준법에 따라 부여</li>
+                    <li>경조사휴가: 회사 규정에 따라 부여</li>
+                </ul>
+            </div>
+            
+            <div class="contract-section">
+                <h2>9. 기타</h2>
+                <ul>
+                    <li>이 계약에 정함이 없는 사항은 근로기준법 및 회사 취업규칙에 따릅니다.</li>
+                    <li>${other_terms}</li>
+                </ul>
+            </div>
+            
+            <div class="signature">
+                ${contract_date}
+                
+                <table class="signature-table">
+                    <tr>
+                        <td width="50%">
+                            <p><b>(사업주)</b></p>
+                            <p>주소: ${company_address}</p>
+                            <p>성명: ${representative} (서명 또는 인)</p>
+                        </td>
+                        <td width="50%">
+                            <p><b>(근로자)</b></p>
+                            <p>주소: ${employee_address}</p>
+                            <p>성명: ${employee_name} (서명 또는 인)</p>
+                        </td>
+                    </tr>
+                </table>
+            </div>
+        </body>
+        </html>
+        """
+
+# 근로계약서 문자열 필드와 기본값
+CONTRACT_TEXT_FIELDS = {
+    "employee_name": "",
+    "company_name": "",
+    "business_number": "",
+    "company_address": "",
+    "representative": "",
+    "employee_id_number": "",
+    "employee_address": "",
+    "employee_phone": "",
+    "contract_start_date": "",
+    "contract_end_date": "기간의 정함이 없음",
+    "work_place": "",
+    "job_description": "",
+    "work_start_time": "",
+    "work_end_time": "",
+    "break_time": "",
+    "work_days": "",
+    "holidays": "",
+    "base_salary": "",
+    "bonus": "",
+    "other_allowances": "",
+    "payment_day": "",
+    "payment_method": "근로자 명의 예금통장에 입금",
+    "other_terms": ""
+}
+
+# 근로계약서 사회보험 적용 여부 필드 (기본값은 적용)
+CONTRACT_INSURANCE_FIELDS = [
+    "employment_insurance", "industrial_accident_insurance", "national_pension", "health_insurance"
+]
+
+@functools.lru_cache(maxsize=1)
+def _contract_template():
+    """
+    근로계약서 템플릿 (프로세스당 한 번만 분석)
+    """
+    return compile_template(
+        CONTRACT_HTML,
+        defaults=tuple(CONTRACT_TEXT_FIELDS.items()),
+        css_style=CONTRACT_CSS,
+        print_script=CONTRACT_SCRIPT
+    )
+
+@functools.lru_cache(maxsize=1)
+def _format_contract_date(today):
+    """
+    근로계약서 작성일 표시 문자열 (같은 날에는 캐시 재사용)
+    """
+    return today.strftime("%Y년 %m월 %d일")
+
+class EmploymentContract:
+    """
+    근로계약서 생성 클래스
+    
+    근로계약서 템플릿을 생성하고 HTML로 변환하는 기능을 제공합니다.
+    """
+    
+    def __init__(self):
+        pass
+    
+    def generate_contract_html(self, contract_data):
+        """
+        근로계약서 HTML 생성
+        
+        문서 골격과 CSS는 프로세스당 한 번만 분석한 템플릿을 재사용하고 필드 값만 채웁니다.
+        
+        Args:
+            contract_data (dict): 근로계약서 데이터
+        
+        Returns:
+            str: HTML 형식의 근로계약서
+        """
+        # 문자열 필드는 템플릿의 기본값으로 채우고, 가공이 필요한 필드만 덮어씀
+        values = {
+            **contract_data,
+            **{field: '적용' if contract_data.get(field, True) else '미적용' for field in CONTRACT_INSURANCE_FIELDS},
+            "contract_date": _format_contract_date(datetime.date.today())
+        }
+        
+        return _contract_template().render(values)
+    
+    def get_contract_template(self):
+        """
+        근로계약서 기본 템플릿 데이터 반환
+        
+        Returns:
+            dict: 근로계약서 기본 템플릿 데이터
+        """
+        today = datetime.date.today()
+        
+        return {
+            # 사업주 정보
+            "company_name": "",
+            "business_number": "",
+            "company_address": "",
+            "representative": "",
+            
+            # 근로자 정보
+            "employee_name": "",
+            "employee_id_number": "",
+            "employee_address": "",
+            "employee_phone": "",
+            
+            # 근로 계약 기간
+            "contract_start_date": today.strftime("%Y-%m-%d"),
+            "contract_end_date": "기간의 정함이 없음",
+            
+            # 근무 장소 및 업무 내용
+            "work_place": "",
+            "job_description": "",
+            
+            # 근로 시간 및 휴게 시간
+            "work_start_time": "09:00",
+            "work_end_time": "18:00",
+            "break_time": "12:00~13:00",
+            "work_days": "월~금",
+            "holidays": "토, 일, 공휴일",
+            
+            # 임금
+            "base_salary": "",
+            "bonus": "없음",
+            "other_allowances": "없음",
+            "payment_day": "25",
+            "payment_method": "근로자 명의 예금통장에 입금",
+            
+            # 사회보험 적용 여부
+            "employment_insurance": True,
+            "industrial_accident_insurance": True,
+            "national_pension": True,
+            "health_insurance": True,
+            
+            # 기타
+            "other_terms": ""
+        }
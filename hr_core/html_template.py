@@ -0,0 +1,86 @@
+"""
+html_template.py - 미리 분석해 두는 HTML 문서 템플릿
+
+임금명세서와 근로계약서처럼 같은 문서를 반복해서 만드는 경우, 템플릿을 프로세스당 한 번만
+분석하여 고정된 CSS와 문서 골격을 문자열 조각으로 보관하고, 문서마다 바뀌는 필드 값만
+끼워 넣습니다.
+"""
+
+import functools
+import re
+
+# 필드 자리 표시자 (${필드명})
+_FIELD_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+class HtmlTemplate:
+    """
+    HTML 문서 템플릿 클래스
+    
+    템플릿 원문의 ${필드명} 자리 표시자를 기준으로 고정 문자열 조각과 필드 이름 목록으로
+    나누고, 렌더링할 때는 고정 조각 사이에 필드 값만 끼워 넣습니다.
+    static으로 지정한 필드는 생성할 때 한 번만 채워 고정 조각에 합칩니다.
+    """
+    
+    def __init__(self, source, static=None, defaults=None):
+        """
+        템플릿 분석
+        
+        Args:
+            source (str): 템플릿 원문
+            static (dict, optional): 생성할 때 한 번만 채울 고정 필드 값 (CSS, 스크립트 등). 기본값은 None.
+            defaults (dict, optional): 값이 없을 때 사용할 필드별 기본값. 기본값은 None.
+        """
+        static = static or {}
+        defaults = defaults or {}
+        parts = _FIELD_PATTERN.split(source)
+        
+        # 고정 조각은 필드 수보다 하나 많음 (조각, 필드, 조각, ..., 조각)
+        self.chunks = [parts[0]]
+        self.fields = []
+        
+        for field, text in zip(parts[1::2], parts[2::2]):
+            if field in static:
+                self.chunks[-1] += static[field] + text
+            else:
+                self.fields.append(field)
+                self.chunks.append(text)
+        
+        self.defaults = {field: defaults[field] for field in self.fields if field in defaults}
+    
+    def render(self, values):
+        """
+        고정 조각 사이에 필드 값을 끼워 완성된 문서 생성
+        
+        Args:
+            values (dict): 필드 값
+        
+        Returns:
+            str: 완성된 문서
+        
+        Raises:
+            KeyError: 기본값이 없는 필드의 값이 없는 경우
+        """
+        defaults = self.defaults
+        parts = [self.chunks[0]]
+        
+        for field, chunk in zip(self.fields, self.chunks[1:]):
+            value = values.get(field, defaults[field]) if field in defaults else values[field]
+            parts.append(format(value))
+            parts.append(chunk)
+        
+        return "".join(parts)
+
+@functools.lru_cache(maxsize=None)
+def compile_template(source, defaults=None, **static):
+    """
+    템플릿을 분석하여 프로세스 안에서 재사용 (같은 원문과 고정 값이면 캐시된 템플릿 반환)
+    
+    Args:
+        source (str): 템플릿 원문
+        defaults (tuple, optional): (필드명, 기본값) 튜플 목록 (캐시 키로 쓰므로 해시 가능해야 함). 기본값은 None.
+        **static: 생성할 때 한 번만 채울 고정 필드 값
+    
+    Returns:
+        HtmlTemplate: 분석된 템플릿
+    """
+    return HtmlTemplate(source, static, dict(defaults or ()))
@@ -0,0 +1,109 @@
+"""
+ids.py - 시간순 정렬 가능한 ID 생성
+
+직원 ID와 임금 지급 ID에 사용하는 ULID 형식(26자, Crockford Base32) ID를 생성합니다.
+앞 10자는 밀리초 단위 생성 시각, 뒤 16자는 80비트 값이며,
+같은 밀리초 안에서는 80비트 값을 1씩 증가시키므로 한 프로세스에서 생성한 ID는
+항상 생성 순서대로 정렬되고 서로 겹치지 않습니다.
+"""
+
+import os
+import threading
+import time
+
+import numpy as np
+
+# Crockford Base32 문자 (I, L, O, U 제외)
+ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_ENCODING_BYTES = np.frombuffer(ENCODING.encode("ascii"), dtype=np.uint8)
+_RANDOM_BITS = 80
+_HALF_BITS = 40
+_HALF_MASK = (1 << _HALF_BITS) - 1
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_last_random = 0
+
+def _encode_time(timestamp):
+    """
+    밀리초 시각을 10자 Base32 문자열로 변환
+    """
+    return "".join(ENCODING[(timestamp >> shift) & 31] for shift in range(45, -5, -5))
+
+def _encode_halves(values):
+    """
+    40비트 값 배열을 8자 Base32 문자 코드 배열로 변환
+    
+    Args:
+        values (numpy.ndarray): uint64 배열 (각 값은 40비트 이하)
+    
+    Returns:
+        numpy.ndarray: (len(values), 8) 모양의 ASCII 코드 배열
+    """
+    shifts = np.arange(35, -5, -5, dtype=np.uint64)
+    return _ENCODING_BYTES[(values[:, None] >> shifts) & np.uint64(31)]
+
+def _reserve(count):
+    """
+    ID count개에 사용할 시각과 시작 값 예약
+    
+    Returns:
+        tuple: (밀리초 시각, 80비트 시작 값)
+    """
+    global _last_timestamp, _last_random
+    
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp <= _last_timestamp:
+            # 같은 밀리초(또는 시계가 뒤로 간 경우)에는 직전 값에 이어서 증가
+            timestamp = _last_timestamp
+            start = _last_random + 1
+        else:
+            # 새 밀리초에는 임의 값에서 시작 (최상위 비트를 비워 증가할 여유 확보)
+            start = int.from_bytes(os.urandom(_RANDOM_BITS // 8), "big") >> 1
+        
+        if start + count > 1 << _RANDOM_BITS:
+            # 80비트 값이 넘치면 다음 밀리초로 넘어감
+            timestamp += 1
+            start = 0
+        
+        _last_timestamp = timestamp
+        _last_random = start + count - 1
+    
+    return timestamp, start
+
+def new_ids(count):
+    """
+    시간순 정렬 가능한 ID를 한 번에 여러 개 생성
+    
+    Args:
+        count (int): 생성할 ID 수
+    
+    Returns:
+        list: ID 문자열 목록 (생성 순서 = 정렬 순서)
+    """
+    if count <= 0:
+        return []
+    
+    timestamp, start = _reserve(count)
+    
+    # 80비트 값 = 시작 값 + 순번 (상위/하위 40비트로 나누어 계산)
+    low = np.uint64(start & _HALF_MASK) + np.arange(count, dtype=np.uint64)
+    high = np.uint64(start >> _HALF_BITS) + (low >> np.uint64(_HALF_BITS))
+    low &= np.uint64(_HALF_MASK)
+    
+    codes = np.hstack([_encode_halves(high), _encode_halves(low)])
+    random_part = codes.tobytes().decode("ascii")
+    prefix = _encode_time(timestamp)
+    
+    return [prefix + random_part[index:index + 16] for index in range(0, count * 16, 16)]
+
+def new_id():
+    """
+    시간순 정렬 가능한 ID 하나 생성
+    
+    Returns:
+        str: 26자 ID
+    """
+    return new_ids(1)[0]
@@ -0,0 +1,316 @@
+"""
+importers.py - 기존 임금대장 및 직원 명부 일괄 가져오기
+
+엑셀이나 CSV로 관리하던 과거 자료를 행 묶음 단위로 읽어 검증한 뒤
+PayrollLedger의 일괄 추가 경로로 기록합니다.
+"""
+
+import time
+
+import pandas as pd
+
+from hr_core.payroll_ledger import DEDUCTION_RATES, EXPORT_COLUMN_NAMES, PAY_COMPONENTS
+
+# 가져오기 열 이름 매핑 (입력 열 이름: 임금대장 필드)
+# 임금대장 필드 이름과 엑셀 내보내기 열 이름을 모두 인식하므로 내보낸 파일을 그대로 가져올 수 있음
+PAYROLL_IMPORT_COLUMNS = dict(
+    [(column, column) for column in EXPORT_COLUMN_NAMES]
+    + [(label, column) for column, label in EXPORT_COLUMN_NAMES.items()]
+    + [("사번", "employee_id"), ("성명", "employee_name"), ("이름", "employee_name")]
+)
+
+# 가져오기 금액 열 (지급 항목, 초과근무 시간, 공제 항목)
+PAYROLL_AMOUNT_COLUMNS = PAY_COMPONENTS + ["overtime_hours"] + list(DEDUCTION_RATES)
+
+# 직원 명부 열 이름 매핑 (입력 열 이름: 직원 정보 필드)
+EMPLOYEE_IMPORT_COLUMNS = {
+    "name": "name",
+    "이름": "name",
+    "성명": "name",
+    "department": "department",
+    "부서": "department",
+    "position": "position",
+    "직위": "position",
+    "직급": "position",
+    "entry_date": "entry_date",
+    "hire_date": "entry_date",
+    "입사일": "entry_date",
+    "base_salary": "base_salary",
+    "기본급": "base_salary",
+    "hourly_rate": "hourly_rate",
+    "시급": "hourly_rate",
+    "payment_type": "payment_type",
+    "급여 유형": "payment_type",
+}
+
+# 급여 유형 값 매핑
+PAYMENT_TYPES = {
+    "monthly": "monthly",
+    "월급": "monthly",
+    "월급제": "monthly",
+    "hourly": "hourly",
+    "시급": "hourly",
+    "시급제": "hourly",
+}
+
+def _column_positions(header, column_mapping):
+    """
+    머리글에서 필드별 열 위치 찾기 (같은 필드가 여러 번 나오면 첫 번째 열 사용)
+    
+    Args:
+        header (list): 머리글 값 목록
+        column_mapping (dict): 입력 열 이름별 필드
+    
+    Returns:
+        dict: 필드별 열 위치
+    """
+    positions = {}
+    for index, column in enumerate(header):
+        field = column_mapping.get(str(column).strip()) if column is not None else None
+        if field is not None and field not in positions:
+            positions[field] = index
+    return positions
+
+def iter_workbook_batches(file_path, column_mapping, batch_size=20000, sheet_name=None):
+    """
+    엑셀 파일을 openpyxl 읽기 전용 모드로 한 행씩 읽어 일정 크기의 묶음으로 반환
+    
+    Args:
+        file_path (str): 엑셀 파일 경로
+        column_mapping (dict): 입력 열 이름별 필드
+        batch_size (int, optional): 묶음당 행 수. 기본값은 20000.
+        sheet_name (str, optional): 시트 이름. 기본값은 None (첫 번째 시트).
+    
+    Yields:
+        pandas.DataFrame: 필드 이름 열과 원본 행 번호(row_number) 열을 가진 묶음
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        row_iter = worksheet.iter_rows(values_only=True)
+        header = next(row_iter, None)
+        if header is None:
+            return
+        positions = _column_positions(header, column_mapping)
+        fields = list(positions)
+        
+        rows = []
+        row_numbers = []
+        for row_number, values in enumerate(row_iter, start=2):
+            if values is None or all(value is None or value == "" for value in values):
+                continue
+            rows.append([values[positions[field]] if positions[field] < len(values) else None for field in fields])
+            row_numbers.append(row_number)
+            if len(rows) >= batch_size:
+                yield pd.DataFrame(rows, columns=fields).assign(row_number=row_numbers)
+                rows = []
+                row_numbers = []
+        if rows:
+            yield pd.DataFrame(rows, columns=fields).assign(row_number=row_numbers)
+    finally:
+        workbook.close()
+
+def _normalize_ids(values):
+    """
+    ID 열을 문자열로 변환 (엑셀이 숫자로 읽은 1001.0 같은 값은 1001로)
+    """
+    values = values.map(lambda value: int(value) if isinstance(value, float) and value.is_integer() else value)
+    return values.where(values.notna(), "").astype(str).str.strip()
+
+def validate_payroll_batch(batch, employees, closed_months=()):
+    """
+    임금 지급 기록 묶음 일괄 검증
+    
+    Args:
+        batch (pandas.DataFrame): iter_workbook_batches가 반환한 묶음
+        employees (pandas.DataFrame): 등록된 직원 정보
+        closed_months (list, optional): 마감된 월 키 목록 (YYYY-MM). 기본값은 빈 목록.
+    
+    Returns:
+        tuple: (유효한 기록 DataFrame, 오류 DataFrame(row_number, error))
+    """
+    batch = batch.copy()
+    errors = pd.Series("", index=batch.index)
+    
+    def reject(mask, message):
+        errors[mask & (errors == "")] = message
+    
+    # 직원 확인 (ID가 없으면 이름이 한 명에게만 해당할 때 이름으로 찾음)
+    ids = _normalize_ids(batch["employee_id"]) if "employee_id" in batch.columns else pd.Series("", index=batch.index)
+    if "employee_name" in batch.columns:
+        unique_names = employees.drop_duplicates("name", keep=False)
+        name_to_id = dict(zip(unique_names["name"].astype(str), unique_names["employee_id"].astype(str)))
+        by_name = batch["employee_name"].astype(str).str.strip().map(name_to_id)
+        ids = ids.where(ids != "", by_name.fillna(""))
+    batch["employee_id"] = ids
+    reject(ids == "", "직원 ID가 없습니다.")
+    reject(~ids.isin(employees["employee_id"].astype(str)), "등록되지 않은 직원입니다.")
+    
+    # 지급일
+    if "payment_date" in batch.columns:
+        batch["payment_date"] = pd.to_datetime(batch["payment_date"], errors="coerce", format="mixed")
+        reject(batch["payment_date"].isna(), "지급일 형식이 올바르지 않습니다.")
+        reject(batch["payment_date"].dt.strftime("%Y-%m").isin(closed_months), "마감된 월의 지급 기록은 추가할 수 없습니다.")
+    else:
+        reject(pd.Series(True, index=batch.index), "지급일이 없습니다.")
+    
+    for column in ("payment_period_start", "payment_period_end"):
+        if column in batch.columns:
+            dates = pd.to_datetime(batch[column], errors="coerce", format="mixed")
+            reject(batch[column].notna() & (batch[column] != "") & dates.isna(), f"{EXPORT_COLUMN_NAMES[column]} 형식이 올바르지 않습니다.")
+            batch[column] = dates.dt.strftime("%Y-%m-%d").fillna("")
+    
+    # 금액 (빈 값은 허용, 숫자가 아니거나 음수이면 오류)
+    for column in PAYROLL_AMOUNT_COLUMNS:
+        if column not in batch.columns:
+            continue
+        raw = batch[column].where(batch[column] != "")
+        amounts = pd.to_numeric(raw, errors="coerce")
+        reject(raw.notna() & amounts.isna(), f"{EXPORT_COLUMN_NAMES[column]} 값이 숫자가 아닙니다.")
+        reject(amounts < 0, f"{EXPORT_COLUMN_NAMES[column]} 값이 음수입니다.")
+        batch[column] = amounts
+    
+    invalid = errors != ""
+    error_frame = pd.DataFrame({"row_number": batch.loc[invalid, "row_number"], "error": errors[invalid]})
+    valid = batch.loc[~invalid].drop(columns=["row_number", "employee_name", "ledger_id"], errors="ignore")
+    
+    return valid, error_frame
+
+def import_payroll_workbook(ledger, file_path, sheet_name=None, batch_size=20000, dry_run=False):
+    """
+    엑셀 임금대장 일괄 가져오기
+    
+    엑셀 파일을 읽기 전용 모드로 batch_size 행씩 읽어 검증하고,
+    유효한 기록은 묶음마다 PayrollLedger.add_payrolls로 한 번에 추가합니다.
+    총 지급액, 공제액, 실수령액은 add_payrolls와 같은 규칙으로 계산하며,
+    파일에 공제 항목 값이 있으면 그대로 사용합니다. 파일의 지급 ID는 사용하지 않습니다.
+    마감된 월의 기록은 오류 행으로 처리하므로 rows는 항상 imported + rejected와 같습니다.
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        file_path (str): 엑셀 파일 경로 (.xlsx)
+        sheet_name (str, optional): 시트 이름. 기본값은 None (첫 번째 시트).
+        batch_size (int, optional): 묶음당 행 수. 기본값은 20000.
+        dry_run (bool, optional): True이면 검증만 하고 기록하지 않음. 기본값은 False.
+    
+    Returns:
+        dict: 가져오기 결과 (rows, imported, rejected, errors, seconds)
+    """
+    started = time.perf_counter()
+    total_rows = 0
+    imported = 0
+    error_frames = []
+    
+    for batch in iter_workbook_batches(file_path, PAYROLL_IMPORT_COLUMNS, batch_size=batch_size, sheet_name=sheet_name):
+        total_rows += len(batch)
+        valid, errors = validate_payroll_batch(batch, ledger.employees, ledger.get_closed_months())
+        if not errors.empty:
+            error_frames.append(errors)
+        if valid.empty:
+            continue
+        if dry_run:
+            imported += len(valid)
+        else:
+            imported += len(ledger.add_payrolls(valid))
+    
+    errors = pd.concat(error_frames, ignore_index=True) if error_frames else pd.DataFrame(columns=["row_number", "error"])
+    
+    return {
+        "rows": total_rows,
+        "imported": imported,
+        "rejected": len(errors),
+        "errors": errors,
+        "seconds": time.perf_counter() - started
+    }
+
+def _employee_keys(names, entry_dates):
+    """
+    직원 중복 확인용 키 (이름, 입사일 YYYY-MM-DD) 목록
+    """
+    dates = pd.to_datetime(entry_dates, errors="coerce", format="mixed").dt.strftime("%Y-%m-%d").fillna("")
+    return list(zip(names.astype(str).str.strip(), dates))
+
+def import_employees_csv(ledger, file_path, chunk_size=5000, dry_run=False):
+    """
+    직원 명부 CSV 일괄 가져오기
+    
+    명부를 chunk_size 행씩 읽어 검증하고, 이름과 입사일이 같은 직원은
+    기존 직원 및 앞서 읽은 행과의 중복으로 보고 건너뜁니다.
+    유효한 직원은 마지막에 PayrollLedger.add_employees로 한 번에 추가합니다.
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        file_path (str): 직원 명부 CSV 파일 경로
+        chunk_size (int, optional): 묶음당 행 수. 기본값은 5000.
+        dry_run (bool, optional): True이면 검증만 하고 기록하지 않음. 기본값은 False.
+    
+    Returns:
+        dict: 가져오기 결과 (rows, imported, duplicates, rejected, errors, employee_ids, seconds)
+    """
+    started = time.perf_counter()
+    
+    # 기존 직원의 (이름, 입사일) 색인
+    seen = set(_employee_keys(ledger.employees["name"], ledger.employees["entry_date"]))
+    
+    total_rows = 0
+    duplicates = 0
+    valid_frames = []
+    error_frames = []
+    
+    for chunk_index, chunk in enumerate(pd.read_csv(file_path, chunksize=chunk_size, dtype=str, keep_default_na=False)):
+        positions = _column_positions(chunk.columns, EMPLOYEE_IMPORT_COLUMNS)
+        if chunk_index == 0 and ("name" not in positions or "entry_date" not in positions):
+            raise ValueError("명부에 이름(name/이름)과 입사일(entry_date/입사일) 열이 필요합니다.")
+        
+        batch = pd.DataFrame({field: chunk.iloc[:, position].str.strip() for field, position in positions.items()})
+        batch["row_number"] = range(total_rows + 2, total_rows + 2 + len(batch))
+        total_rows += len(batch)
+        
+        errors = pd.Series("", index=batch.index)
+        
+        entry_dates = pd.to_datetime(batch["entry_date"], errors="coerce", format="mixed")
+        errors[entry_dates.isna()] = "입사일 형식이 올바르지 않습니다."
+        errors[(batch["name"] == "") & (errors == "")] = "이름이 없습니다."
+        batch["entry_date"] = entry_dates.dt.strftime("%Y-%m-%d")
+        
+        for column in ("base_salary", "hourly_rate"):
+            if column in batch.columns:
+                amounts = pd.to_numeric(batch[column].where(batch[column] != ""), errors="coerce")
+                errors[(batch[column] != "") & amounts.isna() & (errors == "")] = f"{column} 값이 숫자가 아닙니다."
+                batch[column] = amounts.fillna(0)
+        
+        if "payment_type" in batch.columns:
+            payment_types = batch["payment_type"].str.lower().map(PAYMENT_TYPES)
+            errors[(batch["payment_type"] != "") & payment_types.isna() & (errors == "")] = "급여 유형은 monthly 또는 hourly여야 합니다."
+            batch["payment_type"] = payment_types.fillna("monthly")
+        
+        invalid = errors != ""
+        if invalid.any():
+            error_frames.append(pd.DataFrame({"row_number": batch.loc[invalid, "row_number"], "error": errors[invalid]}))
+        batch = batch.loc[~invalid]
+        
+        # 중복 확인 (기존 직원 및 이미 읽은 행)
+        keys = _employee_keys(batch["name"], batch["entry_date"])
+        keep = []
+        for key in keys:
+            keep.append(key not in seen)
+            seen.add(key)
+        duplicates += len(keys) - sum(keep)
+        
+        valid_frames.append(batch.loc[keep].drop(columns=["row_number"]))
+    
+    valid = pd.concat(valid_frames, ignore_index=True) if valid_frames else pd.DataFrame()
+    employee_ids = [] if dry_run or valid.empty else ledger.add_employees(valid)
+    errors = pd.concat(error_frames, ignore_index=True) if error_frames else pd.DataFrame(columns=["row_number", "error"])
+    
+    return {
+        "rows": total_rows,
+        "imported": len(valid),
+        "duplicates": duplicates,
+        "rejected": len(errors),
+        "errors": errors,
+        "employee_ids": employee_ids,
+        "seconds": time.perf_counter() - started
+    }
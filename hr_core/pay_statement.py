@@ -0,0 +1,527 @@
+"""
+pay_statement.py - 임금명세서 HTML 생성
+
+Streamlit에 의존하지 않으므로 명령행 도구와 작업 프로세스에서도 사용할 수 있습니다.
+"""
+
+import datetime
+import functools
+import os
+import re
+import time
+
+import pandas as pd
+
+from hr_core.document_archive import write_zip_archive
+from hr_core.html_template import compile_template
+
+# 임금대장 열과 임금명세서 항목 대응 (임금대장 열: 임금명세서 항목)
+LEDGER_STATEMENT_FIELDS = {
+    "employee_name": "employee_name",
+    "department": "department",
+    "position": "position",
+    "base_salary": "base_salary",
+    "overtime_pay": "overtime_pay",
+    "bonus": "bonus",
+    "meal_allowance": "meal_allowance",
+    "transportation_allowance": "transportation_allowance",
+    "other_allowances": "other_allowance",
+    "income_tax": "income_tax",
+    "local_income_tax": "local_income_tax",
+    "national_pension": "national_pension",
+    "health_insurance": "health_insurance",
+    "employment_insurance": "employment_insurance",
+    "gross_pay": "total_salary",
+    "total_deductions": "total_deduction",
+    "net_pay": "net_salary",
+    "note": "remarks"
+}
+
+# 파일 이름에 쓸 수 없는 문자
+_UNSAFE_FILE_CHARS = re.compile(r'[\\/:*?"<>|\s]+')
+
+# 임금명세서 CSS 스타일
+PAY_STATEMENT_CSS = """
+    <style>
+        body {
+            font-family: 'Malgun Gothic', 'Gulim', sans-serif;
+            line-height: 1.6;
+            margin: 40px;
+            color: #333;
+        }
+        .container {
+            max-width: 800px;
+            margin: 0 auto;
+            border: 1px solid #ddd;
+            padding: 20px;
+            box-shadow: 0 0 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            text-align: center;
+            font-size: 24px;
+            margin-bottom: 20px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #3498db;
+        }
+        .header {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 20px;
+            border-bottom: 1px solid #eee;
+            padding-bottom: 10px;
+        }
+        .company-info, .employee-info {
+            flex: 1;
+        }
+        .info-item {
+            margin-bottom: 5px;
+        }
+        .info-label {
+            font-weight: bold;
+            display: inline-block;
+            width: 100px;
+        }
+        .section-title {
+            font-size: 18px;
+            margin: 20px 0 10px;
+            padding-bottom: 5px;
+            border-bottom: 1px solid #eee;
+        }
+        .pay-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 20px;
+        }
+        .pay-table th, .pay-table td {
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }
+        .pay-table th {
+            background-color: #f8f9fa;
+        }
+        .summary {
+            display: flex;
+            justify-content: space-between;
+            margin: 20px 0;
+            font-weight: bold;
+        }
+        .summary-item {
+            text-align: center;
+            flex: 1;
+            padding: 10px;
+            border: 1px solid #ddd;
+        }
+        .total {
+            background-color: #e8f4fd;
+        }
+        .remarks {
+            margin-top: 20px;
+            border: 1px solid #ddd;
+            padding: 10px;
+            background-color: #f9f9f9;
+        }
+        .footer {
+            margin-top: 30px;
+            text-align: center;
+            font-size: 14px;
+            color: #777;
+        }
+        .print-button {
+            text-align: center;
+            margin: 20px;
+        }
+        @media print {
+            .print-button {
+                display: none;
+            }
+            body {
+                margin: 0;
+                padding: 20px;
+            }
+        }
+    </style>
+    """
+
+# 임금명세서 인쇄 기능 JavaScript
+PAY_STATEMENT_SCRIPT = """
+    <script>
+        function printPayStatement() {
+            window.print();
+        }
+    </script>
+    """
+
+# 임금명세서 문서 골격 (${필드명} 자리에 값을 채움)
+PAY_STATEMENT_HTML = """
+    <!DOCTYPE html>
+    <html lang="ko">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>임금명세서 - ${employee_name} (${pay_period})</title>
+        ${css_style}
+        ${print_script}
+    </head>
+    <body>
+        <div class="print-button">
+            <button onclick="printPayStatement()">인쇄하기</button>
+        </div>
+        
+        <div class="container">
+            <h1>임 금 명 세 서</h1>
+            
+            <div class="header">
+                <div class="company-info">
+                    <div class="info-item"><span class="info-label">회사명</span>: ${company_name}</div>
+                    <div class="info-item"><span class="info-label">급여 기간</span>: ${pay_period}</div>
+                    <div class="info-item"><span class="info-label">지급일</span>: ${pay_date}</div>
+                </div>
+                <div class="employee-info">
+                    <div class="info-item"><span class="info-label">직원명</span>: ${employee_name}</div>
+                    <div class="info-item"><span class="info-label">부서</span>: ${department}</div>
+                    <div class="info-item"><span class="info-label">직위</span>: ${position}</div>
+                </div>
+            </div>
+            
+            <h2 class="section-title">급여 내역</h2>
+            <table class="pay-table">
+                <tr>
+                    <th>항목</th>
+                    <th>금액</th>
+                    <th>비고</th>
+                </tr>
+                <tr>
+                    <td>기본급</td>
+                    <td>${base_salary}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>초과근무수당</td>
+                    <td>${overtime_pay}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>상여금</td>
+                    <td>${bonus}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>식대</td>
+                    <td>${meal_allowance}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>교통비</td>
+                    <td>${transportation_allowance}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>기타 수당</td>
+                    <td>${other_allowance}</td>
+                    <td></td>
+                </tr>
+            </table>
+            
+            <h2 class="section-title">공제 내역</h2>
+            <table class="pay-table">
+                <tr>
+                    <th>항목</th>
+                    <th>금액</th>
+                    <th>비고</th>
+                </tr>
+                <tr>
+                    <td>소득세</td>
+                    <td>${income_tax}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>지방소득세</td>
+                    <td>${local_income_tax}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>국민연금</td>
+                    <td>${national_pension}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>건강보험</td>
+                    <td>${health_insurance}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>고용보험</td>
+                    <td>${employment_insurance}</td>
+                    <td></td>
+                </tr>
+                <tr>
+                    <td>기타 공제</td>
+                    <td>${other_deduction}</td>
+                    <td></td>
+                </tr>
+            </table>
+            
+            <div class="summary">
+                <div class="summary-item">
+                    <div>총 지급액</div>
+                    <div>${total_salary}</div>
+                </div>
+                <div class="summary-item">
+                    <div>총 공제액</div>
+                    <div>${total_deduction}</div>
+                </div>
+                <div class="summary-item total">
+                    <div>실수령액</div>
+                    <div>${net_salary}</div>
+                </div>
+            </div>
+            
+            <div class="remarks">
+                <h3>비고</h3>
+                <p>${remarks}</p>
+            </div>
+            
+            <div class="footer">
+                <p>본 임금명세서는 ${generated_date}에 생성되었습니다.</p>
+                <p>${company_name}</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+# 임금명세서 문자열 필드
+PAY_STATEMENT_TEXT_FIELDS = [
+    "employee_name", "pay_period", "company_name", "pay_date", "department",
+    "position"
+]
+
+# 임금명세서 금액 필드 (통화 형식으로 표시)
+PAY_STATEMENT_AMOUNT_FIELDS = [
+    "base_salary", "overtime_pay", "bonus", "meal_allowance",
+    "transportation_allowance", "other_allowance", "income_tax",
+    "local_income_tax", "national_pension", "health_insurance",
+    "employment_insurance", "other_deduction", "total_salary",
+    "total_deduction", "net_salary"
+]
+
+@functools.lru_cache(maxsize=1)
+def _pay_statement_template():
+    """
+    임금명세서 템플릿 (프로세스당 한 번만 분석)
+    """
+    return compile_template(
+        PAY_STATEMENT_HTML,
+        defaults=tuple((field, '') for field in PAY_STATEMENT_TEXT_FIELDS),
+        css_style=PAY_STATEMENT_CSS,
+        print_script=PAY_STATEMENT_SCRIPT
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _format_amount(value):
+    """
+    금액을 한국어 통화 형식으로 변환 (일괄 생성에서 자주 반복되는 금액은 캐시 재사용)
+    
+    Args:
+        value (int or float): 금액 (None이면 0원)
+    
+    Returns:
+        str: 통화 형식 문자열 (예: "2,500,000원")
+    """
+    return f"{int(value or 0):,}원"
+
+@functools.lru_cache(maxsize=1)
+def _format_generated_date(today):
+    """
+    임금명세서 생성일 표시 문자열 (같은 날에는 캐시 재사용)
+    """
+    return today.strftime("%Y년 %m월 %d일")
+
+def generate_pay_statement_html(data):
+    """
+    HTML 임금명세서 생성
+    
+    문서 골격과 CSS는 프로세스당 한 번만 분석한 템플릿을 재사용하고 필드 값만 채웁니다.
+    
+    Args:
+        data (dict): 임금명세서 데이터
+    
+    Returns:
+        str: HTML 형식의 임금명세서
+    """
+    # 문자열 필드는 템플릿의 기본값으로 채우고, 금액은 한국어 통화 형식으로 변환
+    values = {
+        **data,
+        **{field: _format_amount(data.get(field)) for field in PAY_STATEMENT_AMOUNT_FIELDS},
+        # 비고의 줄바꿈은 <br>로 변환
+        "remarks": (data.get('remarks') or '').replace('\n', '<br>'),
+        "generated_date": _format_generated_date(datetime.date.today())
+    }
+    
+    return _pay_statement_template().render(values)
+
+def get_pay_statement_template():
+    """
+    임금명세서 기본 템플릿 데이터 반환
+    
+    Returns:
+        dict: 임금명세서 기본 템플릿 데이터
+    """
+    today = datetime.date.today()
+    current_month = today.replace(day=1)
+    last_month = (current_month - datetime.timedelta(days=1)).replace(day=1)
+    pay_period = f"{last_month.year}년 {last_month.month}월"
+    
+    return {
+        # 기본 정보
+        "company_name": "",
+        "employee_name": "",
+        "department": "",
+        "position": "",
+        "pay_period": pay_period,
+        "pay_date": today.strftime("%Y-%m-%d"),
+        
+        # 급여 항목
+        "base_salary": 0,
+        "overtime_pay": 0,
+        "bonus": 0,
+        "meal_allowance": 0,
+        "transportation_allowance": 0,
+        "other_allowance": 0,
+        
+        # 공제 항목
+        "income_tax": 0,
+        "local_income_tax": 0,
+        "national_pension": 0,
+        "health_insurance": 0,
+        "employment_insurance": 0,
+        "other_deduction": 0,
+        
+        # 합계
+        "total_salary": 0,
+        "total_deduction": 0,
+        "net_salary": 0,
+        
+        # 비고
+        "remarks": ""
+    }
+
+def build_pay_statement_records(payrolls, company_name=""):
+    """
+    임금대장 기록을 임금명세서 데이터 목록으로 변환
+    
+    Args:
+        payrolls (pandas.DataFrame): 임금 지급 기록 (직원 이름, 부서, 직급 열 포함,
+            PayrollLedger.join_employee_info 결과)
+        company_name (str, optional): 회사명. 기본값은 "".
+    
+    Returns:
+        list: 임금명세서 데이터 목록 (get_pay_statement_template 항목과 ledger_id)
+    """
+    if payrolls.empty:
+        return []
+    
+    template = get_pay_statement_template()
+    frame = payrolls.reindex(columns=["ledger_id"] + list(LEDGER_STATEMENT_FIELDS)).rename(columns=LEDGER_STATEMENT_FIELDS)
+    
+    # 빈 금액은 0, 빈 문자열 항목은 ""로 채움
+    text_fields = ["employee_name", "department", "position", "remarks"]
+    amount_fields = [field for field in LEDGER_STATEMENT_FIELDS.values() if field not in text_fields]
+    frame[amount_fields] = frame[amount_fields].fillna(0)
+    frame[text_fields] = frame[text_fields].astype(object).where(frame[text_fields].notna(), "")
+    
+    # 급여 기간과 지급일 (지급일 기준)
+    payment_dates = pd.to_datetime(payrolls["payment_date"])
+    frame["pay_period"] = payment_dates.dt.year.astype(str) + "년 " + payment_dates.dt.month.astype(str) + "월"
+    frame["pay_date"] = payment_dates.dt.strftime("%Y-%m-%d")
+    frame["company_name"] = company_name
+    
+    return [{**template, **record} for record in frame.to_dict("records")]
+
+def get_pay_statement_file_name(data):
+    """
+    임금명세서 파일 이름 생성 ("지급일_직원명_지급 ID.html")
+    
+    Args:
+        data (dict): 임금명세서 데이터
+    
+    Returns:
+        str: 파일 이름
+    """
+    parts = [data.get("pay_date", ""), data.get("employee_name", ""), data.get("ledger_id", "")]
+    return "_".join(_UNSAFE_FILE_CHARS.sub("-", str(part)) for part in parts if part) + ".html"
+
+def iter_pay_statement_documents(records):
+    """
+    임금명세서를 한 건씩 생성 (ZIP 묶음 기록용)
+    
+    Args:
+        records (iterable): 임금명세서 데이터
+    
+    Yields:
+        tuple: (파일 이름, HTML)
+    """
+    for data in records:
+        yield get_pay_statement_file_name(data), generate_pay_statement_html(data)
+
+def write_pay_statements(records, output_dir):
+    """
+    임금명세서 묶음을 HTML 파일로 저장 (작업 프로세스에서 실행)
+    
+    Args:
+        records (list): 임금명세서 데이터 목록
+        output_dir (str): 저장 디렉토리
+    
+    Returns:
+        int: 저장한 파일 수
+    """
+    for file_name, html in iter_pay_statement_documents(records):
+        with open(os.path.join(output_dir, file_name), "w", encoding="utf-8") as file:
+            file.write(html)
+    
+    return len(records)
+
+def build_month_statement_records(ledger, year, month, company_name=""):
+    """
+    해당 월 임금 지급 기록의 임금명세서 데이터 목록 (지급일, 직원 ID 순)
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        year (int): 연도
+        month (int): 월
+        company_name (str, optional): 회사명. 기본값은 "".
+    
+    Returns:
+        list: 임금명세서 데이터 목록
+    """
+    month_start = pd.Timestamp(year=year, month=month, day=1)
+    month_end = month_start + pd.offsets.MonthEnd(0)
+    payrolls = ledger.get_payrolls_by_period(month_start, month_end).sort_values(["payment_date", "employee_id"], kind="stable")
+    return build_pay_statement_records(ledger.join_employee_info(payrolls), company_name)
+
+def write_pay_statement_archive(ledger, year, month, target, company_name=""):
+    """
+    월 임금명세서를 ZIP 파일 하나로 생성
+    
+    명세서를 한 건씩 생성하여 바로 압축 기록하므로 메모리에는 명세서 한 건만 올라갑니다.
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        year (int): 연도
+        month (int): 월
+        target (str or file): ZIP 파일 경로 또는 쓰기 가능한 바이너리 스트림
+        company_name (str, optional): 회사명. 기본값은 "".
+    
+    Returns:
+        dict: 생성 결과 (statements, seconds, output)
+    """
+    started = time.perf_counter()
+    records = build_month_statement_records(ledger, year, month, company_name)
+    written = write_zip_archive(target, iter_pay_statement_documents(records))
+    
+    return {
+        "statements": written,
+        "seconds": time.perf_counter() - started,
+        "output": target
+    }
@@ -0,0 +1,1711 @@
+"""
+payroll_ledger.py - 임금대장 데이터 모델 및 저장소
+
+Streamlit에 의존하지 않으므로 명령행 도구와 작업 프로세스에서도 사용할 수 있습니다.
+"""
+
+import pandas as pd
+import numpy as np
+import datetime
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from hr_core.ids import new_id, new_ids
+
+# 기본 데이터 디렉토리 (패키지 상위 프로젝트 루트의 data)
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# 임금대장 데이터 파일 이름
+DATA_FILES = ["payroll_ledger.csv", "employees.csv", "ledger_meta.json"]
+
+# 지급 항목
+PAY_COMPONENTS = [
+    "base_salary", "overtime_pay", "bonus", "meal_allowance",
+    "transportation_allowance", "other_allowances"
+]
+
+# 공제 항목별 기본 공제율 (지방소득세는 소득세 기준, 나머지는 총 지급액 기준)
+DEDUCTION_RATES = {
+    "income_tax": 0.03,  # 소득세 (기본 3%)
+    "local_income_tax": 0.1,  # 지방소득세 (소득세의 10%)
+    "national_pension": 0.045,  # 국민연금 (4.5%)
+    "health_insurance": 0.0343,  # 건강보험 (3.43%)
+    "employment_insurance": 0.008  # 고용보험 (0.8%)
+}
+
+# 월별 보고서 집계 항목 (월 마감 시 저장)
+MONTH_REPORT_KEYS = [
+    "total_employees", "total_gross_pay", "total_deductions", "total_net_pay",
+    "avg_gross_pay", "avg_net_pay"
+]
+
+# 연간 보고서 월별 통계 항목
+MONTH_STAT_KEYS = ["total_employees", "total_gross_pay", "total_deductions", "total_net_pay"]
+
+# 임금 지급 기록에 붙이는 직원 정보 열 (직원 정보 열: 결합 후 열 이름)
+EMPLOYEE_INFO_COLUMNS = {
+    "name": "employee_name",
+    "department": "department",
+    "position": "position"
+}
+
+# 월별 집계표 키와 값 열 (부서는 바뀔 수 있으므로 키에 넣지 않고 조회할 때 직원 정보에서 결합)
+ROLLUP_KEYS = ["year", "month", "employee_id"]
+ROLLUP_VALUES = ["payments", "gross_pay"] + list(DEDUCTION_RATES) + ["total_deductions", "net_pay"]
+
+# 보고서 캐시 최대 항목 수
+REPORT_CACHE_SIZE = 64
+
+# 보고서 캐시 ((데이터 디렉토리, 보고서 유형, 기간, 임금대장 버전): 보고서, 최근 사용 순, 디렉토리별 최신 버전만 유지)
+_report_cache = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+# 엑셀 내보내기 열 순서
+EXPORT_COLUMNS = [
+    "ledger_id", "employee_id", "employee_name", "payment_date",
+    "payment_period_start", "payment_period_end", "base_salary",
+    "overtime_hours", "overtime_pay", "bonus", "meal_allowance",
+    "transportation_allowance", "other_allowances", "gross_pay",
+    "income_tax", "local_income_tax", "national_pension",
+    "health_insurance", "employment_insurance", "total_deductions",
+    "net_pay", "payment_method", "note"
+]
+
+# 엑셀 내보내기 열 이름
+EXPORT_COLUMN_NAMES = {
+    "ledger_id": "지급 ID",
+    "employee_id": "직원 ID",
+    "employee_name": "직원 이름",
+    "payment_date": "지급일",
+    "payment_period_start": "지급 기간 시작",
+    "payment_period_end": "지급 기간 종료",
+    "base_salary": "기본급",
+    "overtime_hours": "초과근무 시간",
+    "overtime_pay": "초과근무 수당",
+    "bonus": "상여금",
+    "meal_allowance": "식대",
+    "transportation_allowance": "교통비",
+    "other_allowances": "기타 수당",
+    "gross_pay": "총 지급액",
+    "income_tax": "소득세",
+    "local_income_tax": "지방소득세",
+    "national_pension": "국민연금",
+    "health_insurance": "건강보험",
+    "employment_insurance": "고용보험",
+    "total_deductions": "총 공제액",
+    "net_pay": "실수령액",
+    "payment_method": "지급 방법",
+    "note": "비고"
+}
+
+class PayrollLedger:
+    """
+    임금대장 시스템 클래스
+    
+    임금대장 데이터 모델 및 관리 기능을 제공합니다.
+    """
+    
+    def __init__(self, data_dir=None):
+        """
+        임금대장 시스템 초기화
+        
+        Args:
+            data_dir (str, optional): 데이터 저장 디렉토리. 기본값은 None.
+        """
+        self.data_dir = DEFAULT_DATA_DIR if data_dir is None else data_dir
+        
+        # 데이터 디렉토리 생성
+        os.makedirs(self.data_dir, exist_ok=True)
+        
+        # 임금대장 파일 경로
+        self.ledger_file = os.path.join(self.data_dir, "payroll_ledger.csv")
+        self.employee_file = os.path.join(self.data_dir, "employees.csv")
+        self.meta_file = os.path.join(self.data_dir, "ledger_meta.json")
+        self.rollup_file = os.path.join(self.data_dir, "payroll_rollup.csv")
+        self.closed_dir = os.path.join(self.data_dir, "closed")
+        
+        # 임금 지급 기록 조회 인덱스 (임금대장 버전별로 처음 조회할 때 생성)
+        self._query_index = None
+        
+        # 임금대장 데이터 로드
+        self.load_data()
+    
+    def load_data(self):
+        """
+        임금대장 데이터 로드
+        """
+        # 직원 정보 로드
+        if os.path.exists(self.employee_file):
+            self.employees = pd.read_csv(self.employee_file, dtype={"employee_id": str})
+        else:
+            self.employees = pd.DataFrame({
+                "employee_id": [],
+                "name": [],
+                "department": [],
+                "position": [],
+                "entry_date": [],
+                "base_salary": [],
+                "hourly_rate": [],
+                "payment_type": []  # 'monthly' 또는 'hourly'
+            })
+        
+        # 직원 ID별 이름·부서·직급 조회표
+        self.employee_info = _employee_info_frame(self.employees)
+        
+        # 임금대장 로드
+        if os.path.exists(self.ledger_file):
+            self.ledger = pd.read_csv(self.ledger_file, dtype={"ledger_id": str, "employee_id": str})
+            
+            # 날짜 형식 변환
+            if 'payment_date' in self.ledger.columns:
+                self.ledger['payment_date'] = pd.to_datetime(self.ledger['payment_date'])
+        else:
+            self.ledger = pd.DataFrame({
+                "ledger_id": [],
+                "employee_id": [],
+                "payment_date": [],
+                "payment_period_start": [],
+                "payment_period_end": [],
+                "base_salary": [],
+                "overtime_hours": [],
+                "overtime_pay": [],
+                "bonus": [],
+                "meal_allowance": [],
+                "transportation_allowance": [],
+                "other_allowances": [],
+                "gross_pay": [],
+                "income_tax": [],
+                "local_income_tax": [],
+                "national_pension": [],
+                "health_insurance": [],
+                "employment_insurance": [],
+                "total_deductions": [],
+                "net_pay": [],
+                "payment_method": [],
+                "note": []
+            })
+            # 빈 임금대장도 날짜 비교가 가능하도록 날짜 형식 지정
+            self.ledger["payment_date"] = pd.to_datetime(self.ledger["payment_date"])
+        
+        # 임금대장 메타 정보 로드 (마감된 월 등)
+        if os.path.exists(self.meta_file):
+            with open(self.meta_file, "r", encoding="utf-8") as file:
+                self.meta = json.load(file)
+        else:
+            self.meta = {}
+        self.meta.setdefault("closed_months", {})
+        self.meta.pop("version", None)
+        self.meta.setdefault("revision", new_id())
+        self.meta.setdefault("employee_revision", self.meta["revision"])
+        
+        # 월별 집계표 로드 (임금대장 파일이 집계 이후 바뀌었거나 집계표 형식이 다르면 다시 계산)
+        self.rollup = None
+        if os.path.exists(self.rollup_file) and self.meta.get("rollup_source") == self._ledger_file_stamp():
+            rollup = pd.read_csv(self.rollup_file, dtype={"employee_id": str})
+            if list(rollup.columns) == ROLLUP_KEYS + ROLLUP_VALUES:
+                self.rollup = rollup.set_index(ROLLUP_KEYS)
+        if self.rollup is None:
+            self.rollup = build_rollup(self.ledger)
+            self.save_rollup()
+        
+        self._query_index = None
+        self.data_stamp = data_files_stamp(self.data_dir)
+    
+    def refresh(self):
+        """
+        데이터 파일이 마지막 로드·저장 이후 바뀌었으면 다시 로드
+        
+        다른 프로세스나 인스턴스가 같은 데이터 디렉토리에 저장한 내용을 반영하므로,
+        오래 유지하는 인스턴스는 기록을 추가·수정·삭제하기 전에 호출합니다.
+        
+        Returns:
+            bool: 다시 로드했으면 True
+        """
+        if self.data_stamp == data_files_stamp(self.data_dir):
+            return False
+        
+        self.load_data()
+        return True
+    
+    def save_meta(self):
+        """
+        임금대장 메타 정보 저장 (임시 파일에 쓴 뒤 교체)
+        """
+        temp_file = f"{self.meta_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(self.meta, file, ensure_ascii=False, indent=2)
+        os.replace(temp_file, self.meta_file)
+        
+        # 저장 후 데이터 파일 상태 (refresh에서 다른 곳의 변경 여부 판단에 사용)
+        self.data_stamp = data_files_stamp(self.data_dir)
+    
+    def save_data(self, employees_changed=False):
+        """
+        임금대장 데이터 저장
+        
+        Args:
+            employees_changed (bool, optional): 직원 정보가 바뀌었는지 여부. 기본값은 False.
+        """
+        self.employees.to_csv(self.employee_file, index=False)
+        self.ledger.to_csv(self.ledger_file, index=False)
+        self.bump_version(employees_changed)
+        self.save_rollup()
+    
+    @property
+    def version(self):
+        """
+        임금대장 버전 (보고서 캐시 키로 사용)
+        
+        데이터를 저장할 때마다 메타 정보 파일에 새 리비전 ID(ULID)를 기록하므로,
+        같은 데이터 디렉토리를 여러 인스턴스가 고쳐도 버전이 겹치지 않습니다.
+        다른 프로세스가 같은 밀리초에 만든 ID끼리는 순서가 정해지지 않으므로
+        버전은 크기를 비교하지 않고 같은지만 비교합니다 (최신 여부는 stored_version 참고).
+        """
+        return self.meta["revision"]
+    
+    def stored_version(self):
+        """
+        메타 정보 파일에 마지막으로 저장된 버전
+        
+        Returns:
+            str: 저장된 리비전 ID (메타 정보 파일이 없으면 None)
+        """
+        try:
+            with open(self.meta_file, "r", encoding="utf-8") as file:
+                return json.load(file).get("revision")
+        except (OSError, ValueError):
+            return None
+    
+    @property
+    def employee_version(self):
+        """
+        직원 정보 버전 (직원 검색 색인처럼 직원 정보만 사용하는 캐시의 키로 사용)
+        
+        직원을 추가, 수정, 삭제할 때만 바뀌므로 임금 지급 기록만 바뀐 경우에는 그대로 유지됩니다.
+        """
+        return self.meta["employee_revision"]
+    
+    def bump_version(self, employees_changed=False):
+        """
+        새 리비전 ID 발급 (메타 정보 저장은 호출한 쪽에서 수행)
+        
+        Args:
+            employees_changed (bool, optional): 직원 정보가 바뀌었는지 여부 (True이면 직원 정보 버전도 발급). 기본값은 False.
+        """
+        self.meta["revision"] = new_id()
+        if employees_changed:
+            self.meta["employee_revision"] = self.meta["revision"]
+    
+    def _ledger_file_stamp(self):
+        """
+        임금대장 파일의 크기와 수정 시각 (월별 집계표가 최신인지 확인하는 데 사용)
+        """
+        if not os.path.exists(self.ledger_file):
+            return None
+        stat = os.stat(self.ledger_file)
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def save_rollup(self):
+        """
+        월별 집계표 저장 (임금대장 파일 상태를 메타 정보에 함께 기록)
+        """
+        self.rollup.reset_index().to_csv(self.rollup_file, index=False)
+        self.meta["rollup_source"] = self._ledger_file_stamp()
+        self.save_meta()
+    
+    def _apply_rollup(self, payrolls, sign=1):
+        """
+        임금 지급 기록 증감분을 월별 집계표에 반영
+        
+        Args:
+            payrolls (pandas.DataFrame): 추가(sign=1) 또는 제거(sign=-1)된 임금 지급 기록
+            sign (int, optional): 1이면 더하고 -1이면 뺌. 기본값은 1.
+        """
+        if payrolls.empty:
+            return
+        
+        delta = build_rollup(payrolls) * sign
+        rollup = self.rollup.add(delta, fill_value=0).round(6)
+        rollup["payments"] = rollup["payments"].astype(int)
+        self.rollup = rollup[rollup["payments"] > 0]
+    
+    def add_employee(self, employee_data):
+        """
+        직원 추가
+        
+        Args:
+            employee_data (dict): 직원 정보
+            
+        Returns:
+            str: 직원 ID
+        """
+        # 직원 ID 생성
+        employee_id = new_id()
+        
+        # 직원 정보 추가
+        employee = {
+            "employee_id": employee_id,
+            "name": employee_data.get("name", ""),
+            "department": employee_data.get("department", ""),
+            "position": employee_data.get("position", ""),
+            "entry_date": employee_data.get("entry_date", ""),
+            "base_salary": employee_data.get("base_salary", 0),
+            "hourly_rate": employee_data.get("hourly_rate", 0),
+            "payment_type": employee_data.get("payment_type", "monthly")
+        }
+        
+        # 직원 정보 추가
+        self.employees = pd.concat([self.employees, pd.DataFrame([employee])], ignore_index=True)
+        self.employee_info.loc[employee_id] = [employee[column] for column in EMPLOYEE_INFO_COLUMNS]
+        
+        # 데이터 저장
+        self.save_data(employees_changed=True)
+        
+        return employee_id
+    
+    def add_employees(self, employees):
+        """
+        직원 일괄 추가
+        
+        직원 ID를 한 번에 생성하고 직원 정보 파일에 한 번만 기록합니다.
+        
+        Args:
+            employees (pandas.DataFrame or list): 직원 정보 (add_employee와 같은 항목)
+        
+        Returns:
+            list: 추가된 직원 ID 목록
+        """
+        employees = pd.DataFrame(employees)
+        
+        if employees.empty:
+            return []
+        
+        # 기본값 설정
+        defaults = {
+            "name": "",
+            "department": "",
+            "position": "",
+            "entry_date": "",
+            "base_salary": 0,
+            "hourly_rate": 0,
+            "payment_type": "monthly"
+        }
+        for column, value in defaults.items():
+            if column not in employees.columns:
+                employees[column] = value
+            else:
+                employees[column] = employees[column].fillna(value)
+        
+        # 직원 ID 생성 (시간순 정렬 가능한 ID)
+        employees["employee_id"] = new_ids(len(employees))
+        
+        new_rows = employees.reindex(columns=self.employees.columns)
+        
+        # 직원 정보 추가
+        self.employees = pd.concat([self.employees, new_rows], ignore_index=True) if not self.employees.empty else new_rows.reset_index(drop=True)
+        self.employee_info = pd.concat([self.employee_info, _employee_info_frame(new_rows)])
+        
+        # 새 직원만 파일에 추가
+        if os.path.exists(self.employee_file) and os.path.getsize(self.employee_file) > 0:
+            new_rows.to_csv(self.employee_file, mode="a", header=False, index=False)
+        else:
+            new_rows.to_csv(self.employee_file, index=False)
+        
+        self.bump_version(employees_changed=True)
+        self.save_meta()
+        
+        return new_rows["employee_id"].tolist()
+    
+    def update_employee(self, employee_id, employee_data):
+        """
+        직원 정보 업데이트
+        
+        Args:
+            employee_id (str): 직원 ID
+            employee_data (dict): 업데이트할 직원 정보
+            
+        Returns:
+            bool: 업데이트 성공 여부
+        """
+        # 직원 정보 찾기
+        employee_idx = self.employees[self.employees["employee_id"] == employee_id].index
+        
+        if len(employee_idx) == 0:
+            return False
+        
+        # 직원 정보 업데이트
+        for key, value in employee_data.items():
+            if key in self.employees.columns:
+                self.employees.loc[employee_idx, key] = value
+            if key in EMPLOYEE_INFO_COLUMNS:
+                self.employee_info.loc[employee_id, key] = value
+        
+        # 데이터 저장
+        self.save_data(employees_changed=True)
+        
+        return True
+    
+    def delete_employee(self, employee_id):
+        """
+        직원 삭제
+        
+        Args:
+            employee_id (str): 직원 ID
+            
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        # 직원 정보 찾기
+        employee_idx = self.employees[self.employees["employee_id"] == employee_id].index
+        
+        if len(employee_idx) == 0:
+            return False
+        
+        # 해당 직원의 임금대장 기록 (마감된 월의 기록이 있으면 삭제 불가)
+        ledger_idx = self.ledger[self.ledger["employee_id"] == employee_id].index
+        if self.is_month_closed(self.ledger.loc[ledger_idx, "payment_date"]).any():
+            return False
+        
+        # 직원 정보 삭제
+        self.employees = self.employees.drop(employee_idx)
+        self.employee_info = self.employee_info.drop(employee_id, errors="ignore")
+        
+        # 해당 직원의 임금대장 기록 삭제
+        self.ledger = self.ledger.drop(ledger_idx)
+        self.rollup = self.rollup[self.rollup.index.get_level_values("employee_id") != employee_id]
+        
+        # 데이터 저장
+        self.save_data(employees_changed=True)
+        
+        return True
+    
+    def get_employee(self, employee_id):
+        """
+        직원 정보 조회
+        
+        Args:
+            employee_id (str): 직원 ID
+            
+        Returns:
+            dict: 직원 정보
+        """
+        employee = self.employees[self.employees["employee_id"] == employee_id]
+        
+        if len(employee) == 0:
+            return None
+        
+        return employee.iloc[0].to_dict()
+    
+    def get_all_employees(self):
+        """
+        모든 직원 정보 조회
+        
+        Returns:
+            pandas.DataFrame: 모든 직원 정보
+        """
+        return self.employees
+    
+    @property
+    def employee_names(self):
+        """
+        직원 ID별 이름 (pandas.Series, map에 바로 사용할 수 있음)
+        """
+        return self.employee_info["name"]
+    
+    def join_employee_info(self, payrolls):
+        """
+        임금 지급 기록에 직원 이름, 부서, 직급 열 추가
+        
+        Args:
+            payrolls (pandas.DataFrame): 임금 지급 기록 (employee_id 열 포함)
+        
+        Returns:
+            pandas.DataFrame: employee_name, department, position 열을 추가한 사본
+                (삭제된 직원은 빈 값)
+        """
+        info = self.employee_info.reindex(payrolls["employee_id"].astype(str))
+        frame = payrolls.copy()
+        
+        for column, joined_column in EMPLOYEE_INFO_COLUMNS.items():
+            frame[joined_column] = info[column].to_numpy()
+        
+        return frame
+    
+    def add_payroll(self, payroll_data):
+        """
+        임금 지급 기록 추가
+        
+        Args:
+            payroll_data (dict): 임금 지급 정보
+            
+        Returns:
+            str: 임금 지급 ID
+        """
+        # 임금 지급 ID 생성
+        ledger_id = new_id()
+        
+        # 직원 정보 확인
+        employee_id = payroll_data.get("employee_id", "")
+        employee = self.get_employee(employee_id)
+        
+        if employee is None:
+            return None
+        
+        # 마감된 월에는 추가 불가
+        if self.is_month_closed(payroll_data.get("payment_date", datetime.date.today())):
+            return None
+        
+        # 기본급 설정
+        base_salary = payroll_data.get("base_salary", employee["base_salary"])
+        
+        # 총 급여 계산
+        overtime_pay = payroll_data.get("overtime_pay", 0)
+        bonus = payroll_data.get("bonus", 0)
+        meal_allowance = payroll_data.get("meal_allowance", 0)
+        transportation_allowance = payroll_data.get("transportation_allowance", 0)
+        other_allowances = payroll_data.get("other_allowances", 0)
+        
+        gross_pay = base_salary + overtime_pay + bonus + meal_allowance + transportation_allowance + other_allowances
+        
+        # 공제액 계산
+        income_tax = payroll_data.get("income_tax", gross_pay * 0.03)  # 소득세 (기본 3%)
+        local_income_tax = payroll_data.get("local_income_tax", income_tax * 0.1)  # 지방소득세 (소득세의 10%)
+        national_pension = payroll_data.get("national_pension", gross_pay * 0.045)  # 국민연금 (4.5%)
+        health_insurance = payroll_data.get("health_insurance", gross_pay * 0.0343)  # 건강보험 (3.43%)
+        employment_insurance = payroll_data.get("employment_insurance", gross_pay * 0.008)  # 고용보험 (0.8%)
+        
+        total_deductions = income_tax + local_income_tax + national_pension + health_insurance + employment_insurance
+        
+        # 실수령액 계산
+        net_pay = gross_pay - total_deductions
+        
+        # 임금 지급 정보 추가
+        payroll = {
+            "ledger_id": ledger_id,
+            "employee_id": employee_id,
+            "payment_date": payroll_data.get("payment_date", datetime.date.today().strftime("%Y-%m-%d")),
+            "payment_period_start": payroll_data.get("payment_period_start", ""),
+            "payment_period_end": payroll_data.get("payment_period_end", ""),
+            "base_salary": base_salary,
+            "overtime_hours": payroll_data.get("overtime_hours", 0),
+            "overtime_pay": overtime_pay,
+            "bonus": bonus,
+            "meal_allowance": meal_allowance,
+            "transportation_allowance": transportation_allowance,
+            "other_allowances": other_allowances,
+            "gross_pay": gross_pay,
+            "income_tax": income_tax,
+            "local_income_tax": local_income_tax,
+            "national_pension": national_pension,
+            "health_insurance": health_insurance,
+            "employment_insurance": employment_insurance,
+            "total_deductions": total_deductions,
+            "net_pay": net_pay,
+            "payment_method": payroll_data.get("payment_method", "계좌이체"),
+            "note": payroll_data.get("note", "")
+        }
+        
+        # 임금 지급 정보 추가
+        new_row = pd.DataFrame([payroll])
+        new_row["payment_date"] = pd.to_datetime(new_row["payment_date"])
+        self.ledger = pd.concat([self.ledger, new_row], ignore_index=True)
+        self._apply_rollup(new_row)
+        
+        # 데이터 저장
+        self.save_data()
+        
+        return ledger_id
+    
+    def add_payrolls(self, payrolls):
+        """
+        임금 지급 기록 일괄 추가
+        
+        모든 기록의 금액을 한 번에 계산하고 임금대장 파일에 한 번만 기록합니다.
+        등록되지 않은 직원의 기록은 추가하지 않습니다. 마감된 월의 기록이 있으면
+        일부만 추가하지 않고 전체를 거부하므로, 일괄 가져오기에서는 먼저 검증 단계에서
+        해당 행을 오류로 걸러야 합니다 (importers.validate_payroll_batch).
+        
+        Args:
+            payrolls (pandas.DataFrame or list): 임금 지급 정보 (add_payroll과 같은 항목)
+        
+        Returns:
+            list: 추가된 임금 지급 ID 목록
+        
+        Raises:
+            ValueError: 마감된 월의 기록이 있는 경우
+        """
+        payrolls = pd.DataFrame(payrolls)
+        
+        if payrolls.empty or "employee_id" not in payrolls.columns:
+            return []
+        
+        # 등록된 직원의 기록만 추가
+        payrolls = payrolls[payrolls["employee_id"].isin(self.employees["employee_id"])].copy()
+        
+        if payrolls.empty:
+            return []
+        
+        # 기본급이 없으면 직원 정보의 기본급 사용
+        base_salaries = payrolls["employee_id"].map(self.employees.set_index("employee_id")["base_salary"])
+        if "base_salary" in payrolls.columns:
+            payrolls["base_salary"] = payrolls["base_salary"].fillna(base_salaries)
+        else:
+            payrolls["base_salary"] = base_salaries
+        
+        # 금액 계산
+        payrolls = calculate_payroll_frame(payrolls)
+        
+        # 기본값 설정
+        defaults = {
+            "payment_date": datetime.date.today().strftime("%Y-%m-%d"),
+            "payment_period_start": "",
+            "payment_period_end": "",
+            "overtime_hours": 0,
+            "payment_method": "계좌이체",
+            "note": ""
+        }
+        for column, value in defaults.items():
+            if column not in payrolls.columns:
+                payrolls[column] = value
+            else:
+                payrolls[column] = payrolls[column].fillna(value)
+        
+        # 임금 지급 ID 생성
+        payrolls["payment_date"] = pd.to_datetime(payrolls["payment_date"])
+        
+        # 마감된 월의 기록이 있으면 전체 거부
+        closed = self.is_month_closed(payrolls["payment_date"])
+        if closed.any():
+            months = ", ".join(sorted(payrolls.loc[closed, "payment_date"].dt.strftime("%Y-%m").unique()))
+            raise ValueError(f"마감된 월({months})의 지급 기록 {int(closed.sum())}건은 추가할 수 없습니다.")
+        
+        payrolls["ledger_id"] = new_ids(len(payrolls))
+        
+        new_rows = payrolls.reindex(columns=self.ledger.columns)
+        
+        # 임금 지급 정보 추가
+        self.ledger = pd.concat([self.ledger, new_rows], ignore_index=True) if not self.ledger.empty else new_rows.reset_index(drop=True)
+        
+        # 새 기록만 파일에 추가
+        self.append_ledger_rows(new_rows)
+        
+        # 월별 집계표에 반영
+        self._apply_rollup(new_rows)
+        self.bump_version()
+        self.save_rollup()
+        
+        return new_rows["ledger_id"].tolist()
+    
+    def append_ledger_rows(self, rows):
+        """
+        임금대장 파일 끝에 기록 추가 (파일 전체를 다시 쓰지 않음)
+        
+        Args:
+            rows (pandas.DataFrame): 추가할 임금 지급 기록
+        """
+        if os.path.exists(self.ledger_file) and os.path.getsize(self.ledger_file) > 0:
+            rows.to_csv(self.ledger_file, mode="a", header=False, index=False)
+        else:
+            rows.to_csv(self.ledger_file, index=False)
+    
+    def update_payroll(self, ledger_id, payroll_data):
+        """
+        임금 지급 기록 업데이트
+        
+        Args:
+            ledger_id (str): 임금 지급 ID
+            payroll_data (dict): 업데이트할 임금 지급 정보
+            
+        Returns:
+            bool: 업데이트 성공 여부 (마감된 월의 기록이면 False)
+        """
+        # 임금 지급 정보 찾기
+        payroll_idx = self.ledger[self.ledger["ledger_id"] == ledger_id].index
+        
+        if len(payroll_idx) == 0:
+            return False
+        
+        # 마감된 월의 기록이거나 마감된 월로 옮기는 경우 수정 불가
+        if self.is_month_closed(self.ledger.loc[payroll_idx[0], "payment_date"]) or self.is_month_closed(payroll_data.get("payment_date")):
+            return False
+        
+        # 직원 정보 확인
+        employee_id = self.ledger.loc[payroll_idx[0], "employee_id"]
+        employee = self.get_employee(employee_id)
+        
+        if employee is None:
+            return False
+        
+        # 기본급 설정
+        base_salary = payroll_data.get("base_salary", self.ledger.loc[payroll_idx[0], "base_salary"])
+        
+        # 총 급여 계산
+        overtime_pay = payroll_data.get("overtime_pay", self.ledger.loc[payroll_idx[0], "overtime_pay"])
+        bonus = payroll_data.get("bonus", self.ledger.loc[payroll_idx[0], "bonus"])
+        meal_allowance = payroll_data.get("meal_allowance", self.ledger.loc[payroll_idx[0], "meal_allowance"])
+        transportation_allowance = payroll_data.get("transportation_allowance", self.ledger.loc[payroll_idx[0], "transportation_allowance"])
+        other_allowances = payroll_data.get("other_allowances", self.ledger.loc[payroll_idx[0], "other_allowances"])
+        
+        gross_pay = base_salary + overtime_pay + bonus + meal_allowance + transportation_allowance + other_allowances
+        
+        # 공제액 계산
+        income_tax = payroll_data.get("income_tax", gross_pay * 0.03)  # 소득세 (기본 3%)
+        local_income_tax = payroll_data.get("local_income_tax", income_tax * 0.1)  # 지방소득세 (소득세의 10%)
+        national_pension = payroll_data.get("national_pension", gross_pay * 0.045)  # 국민연금 (4.5%)
+        health_insurance = payroll_data.get("health_insurance", gross_pay * 0.0343)  # 건강보험 (3.43%)
+        employment_insurance = payroll_data.get("employment_insurance", gross_pay * 0.008)  # 고용보험 (0.8%)
+        
+        total_deductions = income_tax + local_income_tax + national_pension + health_insurance + employment_insurance
+        
+        # 실수령액 계산
+        net_pay = gross_pay - total_deductions
+        
+        # 임금 지급 정보 업데이트
+        update_data = {
+            "payment_date": payroll_data.get("payment_date", self.ledger.loc[payroll_idx[0], "payment_date"]),
+            "payment_period_start": payroll_data.get("payment_period_start", self.ledger.loc[payroll_idx[0], "payment_period_start"]),
+            "payment_period_end": payroll_data.get("payment_period_end", self.ledger.loc[payroll_idx[0], "payment_period_end"]),
+            "base_salary": base_salary,
+            "overtime_hours": payroll_data.get("overtime_hours", self.ledger.loc[payroll_idx[0], "overtime_hours"]),
+            "overtime_pay": overtime_pay,
+            "bonus": bonus,
+            "meal_allowance": meal_allowance,
+            "transportation_allowance": transportation_allowance,
+            "other_allowances": other_allowances,
+            "gross_pay": gross_pay,
+            "income_tax": income_tax,
+            "local_income_tax": local_income_tax,
+            "national_pension": national_pension,
+            "health_insurance": health_insurance,
+            "employment_insurance": employment_insurance,
+            "total_deductions": total_deductions,
+            "net_pay": net_pay,
+            "payment_method": payroll_data.get("payment_method", self.ledger.loc[payroll_idx[0], "payment_method"]),
+            "note": payroll_data.get("note", self.ledger.loc[payroll_idx[0], "note"])
+        }
+        
+        update_data["payment_date"] = pd.to_datetime(update_data["payment_date"])
+        
+        # 임금 지급 정보 업데이트 (월별 집계표는 이전 기록을 빼고 새 기록을 더함)
+        self._apply_rollup(self.ledger.loc[payroll_idx], sign=-1)
+        for key, value in update_data.items():
+            self.ledger.loc[payroll_idx, key] = value
+        self._apply_rollup(self.ledger.loc[payroll_idx])
+        
+        # 데이터 저장
+        self.save_data()
+        
+        return True
+    
+    def delete_payroll(self, ledger_id):
+        """
+        임금 지급 기록 삭제
+        
+        Args:
+            ledger_id (str): 임금 지급 ID
+            
+        Returns:
+            bool: 삭제 성공 여부 (마감된 월의 기록이면 False)
+        """
+        # 임금 지급 정보 찾기
+        payroll_idx = self.ledger[self.ledger["ledger_id"] == ledger_id].index
+        
+        if len(payroll_idx) == 0:
+            return False
+        
+        # 마감된 월의 기록은 삭제 불가
+        if self.is_month_closed(self.ledger.loc[payroll_idx[0], "payment_date"]):
+            return False
+        
+        # 임금 지급 정보 삭제
+        self._apply_rollup(self.ledger.loc[payroll_idx], sign=-1)
+        self.ledger = self.ledger.drop(payroll_idx)
+        
+        # 데이터 저장
+        self.save_data()
+        
+        return True
+    
+    def get_payroll(self, ledger_id):
+        """
+        임금 지급 기록 조회
+        
+        Args:
+            ledger_id (str): 임금 지급 ID
+            
+        Returns:
+            dict: 임금 지급 정보
+        """
+        positions = self._get_query_index()["ledger_ids"].get_indexer_for([ledger_id])
+        
+        if len(positions) == 0 or positions[0] < 0:
+            return None
+        
+        return self.ledger.iloc[positions[0]].to_dict()
+    
+    def get_employee_payrolls(self, employee_id):
+        """
+        직원별 임금 지급 기록 조회
+        
+        Args:
+            employee_id (str): 직원 ID
+            
+        Returns:
+            pandas.DataFrame: 직원별 임금 지급 기록
+        """
+        return self.ledger[self.ledger["employee_id"] == employee_id].sort_values("payment_date", ascending=False)
+    
+    def get_payrolls_by_period(self, start_date, end_date):
+        """
+        기간별 임금 지급 기록 조회
+        
+        Args:
+            start_date (str): 시작일 (YYYY-MM-DD 형식)
+            end_date (str): 종료일 (YYYY-MM-DD 형식)
+            
+        Returns:
+            pandas.DataFrame: 기간별 임금 지급 기록
+        """
+        if isinstance(start_date, str):
+            start_date = pd.to_datetime(start_date)
+        if isinstance(end_date, str):
+            end_date = pd.to_datetime(end_date)
+        
+        return self.ledger[
+            (self.ledger["payment_date"] >= start_date) & 
+            (self.ledger["payment_date"] <= end_date)
+        ].sort_values("payment_date", ascending=False)
+    
+    def get_all_payrolls(self):
+        """
+        모든 임금 지급 기록 조회
+        
+        Returns:
+            pandas.DataFrame: 모든 임금 지급 기록
+        """
+        return self.ledger.sort_values("payment_date", ascending=False)
+    
+    def _get_query_index(self):
+        """
+        임금 지급 기록 조회 인덱스 반환 (임금대장 버전이 바뀌면 다시 생성)
+        
+        Returns:
+            dict: 지급일 오름차순 행 위치(order), 정렬된 지급일(dates),
+                지급 ID 인덱스(ledger_ids), 직원별 행 위치(employees)
+        """
+        if self._query_index is None or self._query_index["version"] != self.version:
+            dates = pd.to_datetime(self.ledger["payment_date"]).to_numpy(dtype="datetime64[ns]")
+            order = np.argsort(dates, kind="stable")
+            
+            self._query_index = {
+                "version": self.version,
+                "order": order,
+                "dates": dates[order],
+                "ledger_ids": pd.Index(self.ledger["ledger_id"].astype(str)),
+                "employees": self.ledger.groupby("employee_id").indices
+            }
+        
+        return self._query_index
+    
+    def query_payrolls(self, employee_ids=None, start_date=None, end_date=None, min_amount=None, max_amount=None, amount_column="net_pay", page=1, page_size=50):
+        """
+        조건에 맞는 임금 지급 기록을 지급일 최신순으로 한 페이지만 조회
+        
+        지급일 정렬 인덱스에서 기간을 이진 탐색하고 직원별 행 위치로 거르므로
+        전체 기록을 정렬하거나 복사하지 않고, 반환하는 행도 요청한 페이지뿐입니다.
+        
+        Args:
+            employee_ids (list, optional): 직원 ID 목록. 기본값은 None (전체 직원).
+            start_date (date, optional): 시작일. 기본값은 None.
+            end_date (date, optional): 종료일 (해당 일 포함). 기본값은 None.
+            min_amount (float, optional): 최소 금액. 기본값은 None.
+            max_amount (float, optional): 최대 금액. 기본값은 None.
+            amount_column (str, optional): 금액 조건 열. 기본값은 "net_pay".
+            page (int, optional): 페이지 번호 (1부터 시작). 기본값은 1.
+            page_size (int, optional): 페이지당 행 수. 기본값은 50.
+        
+        Returns:
+            dict: 조회 결과 (rows: 해당 페이지 DataFrame, total: 조건에 맞는 전체 건수,
+                page: 페이지 번호, pages: 전체 페이지 수)
+        """
+        index = self._get_query_index()
+        
+        # 기간 조건: 정렬된 지급일에서 이진 탐색
+        low = 0
+        high = len(index["dates"])
+        if start_date is not None:
+            low = index["dates"].searchsorted(np.datetime64(pd.Timestamp(start_date).normalize(), "ns"), side="left")
+        if end_date is not None:
+            end = pd.Timestamp(end_date).normalize() + pd.Timedelta(days=1)
+            high = index["dates"].searchsorted(np.datetime64(end, "ns"), side="left")
+        positions = index["order"][low:high][::-1]
+        
+        # 직원 조건: 직원별 행 위치로 거르기
+        if employee_ids is not None:
+            employee_positions = [index["employees"][employee_id] for employee_id in employee_ids if employee_id in index["employees"]]
+            if employee_positions:
+                positions = positions[np.isin(positions, np.concatenate(employee_positions))]
+            else:
+                positions = positions[:0]
+        
+        # 금액 조건
+        if min_amount is not None or max_amount is not None:
+            amounts = self.ledger[amount_column].to_numpy()[positions]
+            mask = np.ones(len(positions), dtype=bool)
+            if min_amount is not None:
+                mask &= amounts >= min_amount
+            if max_amount is not None:
+                mask &= amounts <= max_amount
+            positions = positions[mask]
+        
+        total = len(positions)
+        pages = max(1, -(-total // page_size))
+        page = min(max(1, page), pages)
+        start = (page - 1) * page_size
+        
+        return {
+            "rows": self.ledger.iloc[positions[start:start + page_size]],
+            "total": total,
+            "page": page,
+            "pages": pages
+        }
+    
+    def generate_monthly_report(self, year, month):
+        """
+        월별 임금 지급 보고서 생성
+        
+        Args:
+            year (int): 연도
+            month (int): 월
+            
+        Returns:
+            dict: 월별 임금 지급 보고서 (캐시된 결과일 수 있으므로 수정하지 말 것)
+        """
+        return self._cached_report("monthly", (year, month), self._generate_monthly_report)
+    
+    def _generate_monthly_report(self, year, month):
+        """
+        월별 임금 지급 보고서 계산 (generate_monthly_report 참고)
+        """
+        # 마감된 월은 저장된 보고서 사용
+        if self.is_month_closed(pd.Timestamp(year=year, month=month, day=1)):
+            return self.get_closed_month_report(year, month)
+        
+        # 보고서 데이터 (집계 값은 월별 집계표에서 계산, 상세 내역은 get_report_detail로 따로 조회)
+        report = {
+            "year": year,
+            "month": month,
+            **self.get_rollup_summary(year, month),
+            "employee_stats": self.get_employee_stats(year, month)
+        }
+        
+        return report
+    
+    def _cached_report(self, report_type, period, generate):
+        """
+        보고서 캐시 조회 (없으면 계산하여 저장)
+        
+        캐시 키에 임금대장 버전이 들어가므로 데이터가 바뀌면 이전 결과는 더 이상 사용되지 않습니다.
+        인스턴스의 버전이 메타 정보 파일에 저장된 버전과 다르면 (다른 곳에서 저장한 뒤 다시 로드하지 않은 경우)
+        계산한 보고서를 캐시하지 않습니다. 최신 버전의 보고서를 저장할 때는 같은 데이터 디렉토리의
+        다른 버전 보고서를 함께 버리고,
+        그래도 캐시가 가득 차면 가장 오래 사용하지 않은 보고서부터 버립니다.
+        보고서에는 집계 값만 들어가므로 항목당 크기는 직원 수에 비례합니다.
+        
+        Args:
+            report_type (str): 보고서 유형 ("monthly", "annual")
+            period (tuple): 보고서 기간
+            generate (callable): 보고서 계산 함수 (period를 인자로 받음)
+        
+        Returns:
+            dict: 보고서
+        """
+        data_dir = os.path.abspath(self.data_dir)
+        key = (data_dir, report_type, period, self.version)
+        
+        with _report_cache_lock:
+            if key in _report_cache:
+                _report_cache.move_to_end(key)
+                return _report_cache[key]
+        
+        report = generate(*period)
+        
+        # 다른 인스턴스가 이미 새 버전을 저장했으면 이전 버전 보고서는 캐시하지 않음
+        stored_version = self.stored_version()
+        if stored_version is not None and stored_version != self.version:
+            return report
+        
+        with _report_cache_lock:
+            for cached in [cached for cached in _report_cache if cached[0] == data_dir and cached[3] != self.version]:
+                del _report_cache[cached]
+            
+            _report_cache[key] = report
+            _report_cache.move_to_end(key)
+            while len(_report_cache) > REPORT_CACHE_SIZE:
+                _report_cache.popitem(last=False)
+        
+        return report
+    
+    def get_rollup_summary(self, year, month=None):
+        """
+        월별 집계표에서 기간 합계 계산 (임금 지급 기록 대신 집계 행만 사용)
+        
+        Args:
+            year (int): 연도
+            month (int, optional): 월. 기본값은 None (연간).
+        
+        Returns:
+            dict: total_employees, total_gross_pay, total_deductions, total_net_pay, avg_gross_pay, avg_net_pay,
+                deductions (공제 항목별 합계)
+        """
+        return summarize_rollup(self._rollup_rows(year, month))
+    
+    def _rollup_rows(self, year, month=None):
+        """
+        월별 집계표에서 해당 기간의 행 선택
+        """
+        mask = self.rollup.index.get_level_values("year") == year
+        if month is not None:
+            mask &= self.rollup.index.get_level_values("month") == month
+        return self.rollup[mask]
+    
+    def get_employee_stats(self, year, month=None):
+        """
+        월별 집계표에서 기간 중 직원별 합계 계산
+        
+        이름, 부서, 직급은 조회할 때의 직원 정보로 결합하므로 부서를 옮긴 직원도
+        한 행으로 집계됩니다.
+        
+        Args:
+            year (int): 연도
+            month (int, optional): 월. 기본값은 None (연간).
+        
+        Returns:
+            pandas.DataFrame: 직원별 합계 (employee_id, ROLLUP_VALUES, employee_name, department, position 열,
+                직원 ID 순)
+        """
+        stats = self._rollup_rows(year, month).groupby(level="employee_id").sum().reset_index()
+        return self.join_employee_info(stats)
+    
+    def get_report_detail(self, year, month=None):
+        """
+        보고서 기간의 임금 지급 상세 내역 조회 (마감된 월은 마감 파일 사용)
+        
+        보고서 집계에는 필요하지 않으므로 상세 내역을 화면에 표시하거나 내보낼 때만 조회합니다.
+        
+        Args:
+            year (int): 연도
+            month (int, optional): 월. 기본값은 None (연간).
+        
+        Returns:
+            pandas.DataFrame: 임금 지급 기록 (지급일 최신순)
+        """
+        if month is not None and self.is_month_closed(pd.Timestamp(year=year, month=month, day=1)):
+            return self.read_closed_month(year, month).sort_values("payment_date", ascending=False)
+        
+        start_date = pd.Timestamp(year=year, month=month or 1, day=1)
+        end_date = start_date + (pd.offsets.MonthEnd(0) if month is not None else pd.offsets.YearEnd(0))
+        return self.get_payrolls_by_period(start_date, end_date)
+    
+    def generate_annual_report(self, year):
+        """
+        연간 임금 지급 보고서 생성
+        
+        Args:
+            year (int): 연도
+            
+        Returns:
+            dict: 연간 임금 지급 보고서 (캐시된 결과일 수 있으므로 수정하지 말 것)
+        """
+        return self._cached_report("annual", (year,), self._generate_annual_report)
+    
+    def _generate_annual_report(self, year):
+        """
+        연간 임금 지급 보고서 계산 (generate_annual_report 참고)
+        """
+        # 월별 통계 (월별 집계표 사용)
+        monthly_stats = []
+        for month in range(1, 13):
+            summary = self.get_rollup_summary(year, month)
+            monthly_stats.append({"month": month, **{key: summary[key] for key in MONTH_STAT_KEYS}})
+        
+        # 보고서 데이터
+        report = {
+            "year": year,
+            **self.get_rollup_summary(year),
+            "monthly_stats": monthly_stats,
+            "employee_stats": self.get_employee_stats(year)
+        }
+        
+        return report
+    
+    def is_month_closed(self, dates):
+        """
+        마감된 월 여부 확인
+        
+        Args:
+            dates: 날짜 하나 (문자열, date, Timestamp) 또는 날짜 Series
+        
+        Returns:
+            bool 또는 pandas.Series: 마감된 월 여부 (날짜가 없으면 False)
+        """
+        closed_months = self.meta["closed_months"]
+        
+        if isinstance(dates, pd.Series):
+            if not closed_months:
+                return pd.Series(False, index=dates.index)
+            return pd.to_datetime(dates, errors="coerce").dt.strftime("%Y-%m").isin(closed_months)
+        
+        if not closed_months or dates is None or (not isinstance(dates, str) and pd.isna(dates)):
+            return False
+        return _month_key(dates) in closed_months
+    
+    def get_closed_months(self):
+        """
+        마감된 월 목록 조회
+        
+        Returns:
+            list: 마감된 월 키 목록 (YYYY-MM, 오름차순)
+        """
+        return sorted(self.meta["closed_months"])
+    
+    def close_month(self, year, month):
+        """
+        월 마감
+        
+        해당 월의 임금 지급 기록을 마감 파일(closed/payroll_YYYY-MM.csv)로, 직원별 합계를
+        마감 시점의 직원 정보와 함께 closed/employee_stats_YYYY-MM.csv로 고정하고 보고서 집계를
+        메타 정보에 저장합니다. 마감된 월의 기록은 추가, 수정, 삭제할 수 없으며
+        이후 보고서는 다시 계산하지 않고 저장된 값을 사용합니다.
+        
+        저장하는 집계는 마감 파일에 쓰는 기록에서 직접 계산하고, 월별 집계표의 값과 다르면
+        집계표를 다시 계산하여 확인한 뒤에도 다를 때 마감하지 않습니다.
+        
+        Args:
+            year (int): 연도
+            month (int): 월
+        
+        Returns:
+            dict: 마감된 월의 보고서 집계
+        
+        Raises:
+            ValueError: 이미 마감된 월이거나 마감 기록과 월별 집계표의 합계가 다른 경우
+        """
+        key = _month_key(pd.Timestamp(year=year, month=month, day=1))
+        if key in self.meta["closed_months"]:
+            raise ValueError(f"{year}년 {month}월은 이미 마감되었습니다.")
+        
+        detail = self.get_report_detail(year, month)
+        detail_rollup = build_rollup(detail)
+        frozen = summarize_rollup(detail_rollup)
+        
+        # 월별 집계표가 임금대장과 어긋났으면 다시 계산하여 확인
+        if not _summaries_match(frozen, self.get_rollup_summary(year, month)):
+            self.rollup = build_rollup(self.ledger)
+            self.save_rollup()
+            if not _summaries_match(frozen, self.get_rollup_summary(year, month)):
+                raise ValueError(f"{year}년 {month}월 임금 지급 기록과 월별 집계표의 합계가 달라 마감할 수 없습니다.")
+        
+        # 마감 파일 저장 (임시 파일에 쓴 뒤 교체)
+        os.makedirs(self.closed_dir, exist_ok=True)
+        employee_stats = self.join_employee_info(detail_rollup.groupby(level="employee_id").sum().reset_index())
+        for name, frame in (("payroll", detail), ("employee_stats", employee_stats)):
+            closed_file = self._closed_file(name, key)
+            frame.to_csv(f"{closed_file}.tmp", index=False)
+            os.replace(f"{closed_file}.tmp", closed_file)
+        
+        summary = {stat_key: _json_number(frozen[stat_key]) for stat_key in MONTH_REPORT_KEYS}
+        summary["deductions"] = {column: _json_number(value) for column, value in frozen["deductions"].items()}
+        self.meta["closed_months"][key] = {
+            "closed_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "rows": len(detail),
+            "summary": summary
+        }
+        self.bump_version()
+        self.save_meta()
+        
+        return summary
+    
+    def get_closed_month_report(self, year, month):
+        """
+        마감된 월의 보고서 조회 (합계와 직원별 합계는 마감 시 저장한 값 사용)
+        
+        마감 이후 직원 정보를 고쳐도 직원별 합계의 이름, 부서, 직급은 마감 시점의 값으로 유지됩니다.
+        
+        Args:
+            year (int): 연도
+            month (int): 월
+        
+        Returns:
+            dict: 월별 임금 지급 보고서 (generate_monthly_report와 같은 형식)
+        """
+        key = _month_key(pd.Timestamp(year=year, month=month, day=1))
+        closed = self.meta["closed_months"][key]
+        
+        # 직원별 합계 파일이 없는 이전 마감은 월별 집계표에서 계산
+        stats_file = self._closed_file("employee_stats", key)
+        if os.path.exists(stats_file):
+            employee_stats = pd.read_csv(stats_file, dtype={"employee_id": str})
+        else:
+            employee_stats = self.get_employee_stats(year, month)
+        
+        return {
+            "year": year,
+            "month": month,
+            **self.get_rollup_summary(year, month),
+            **closed["summary"],
+            "employee_stats": employee_stats
+        }
+    
+    def read_closed_month(self, year, month):
+        """
+        마감된 월의 임금 지급 기록을 마감 파일에서 읽기
+        
+        Args:
+            year (int): 연도
+            month (int): 월
+        
+        Returns:
+            pandas.DataFrame: 마감 시 고정한 임금 지급 기록
+        """
+        key = _month_key(pd.Timestamp(year=year, month=month, day=1))
+        
+        detail = pd.read_csv(self._closed_file("payroll", key), dtype={"ledger_id": str, "employee_id": str})
+        detail["payment_date"] = pd.to_datetime(detail["payment_date"])
+        return detail
+    
+    def _closed_file(self, name, key):
+        """
+        마감 파일 경로 (closed/{name}_YYYY-MM.csv)
+        """
+        return os.path.join(self.closed_dir, f"{name}_{key}.csv")
+    
+    def export_to_excel(self, file_path, payrolls=None, chunk_size=50000):
+        """
+        임금대장 데이터를 엑셀로 내보내기
+        
+        xlsxwriter의 constant_memory 모드로 행을 순서대로 기록합니다.
+        내보낼 데이터를 지정하지 않으면 임금대장 파일을 chunk_size 행씩 읽어 기록하므로
+        여러 해 분량의 임금대장도 메모리 사용량이 일정하게 유지됩니다.
+        
+        Args:
+            file_path (str | file-like): 저장할 파일 경로 또는 쓰기 가능한 스트림 (io.BytesIO 등)
+            payrolls (pandas.DataFrame, optional): 내보낼 임금대장 데이터. 기본값은 None (임금대장 전체).
+            chunk_size (int, optional): 한 번에 읽고 기록할 행 수. 기본값은 50000.
+            
+        Returns:
+            bool: 내보내기 성공 여부
+        """
+        import xlsxwriter
+        
+        # 내보낼 데이터 설정
+        if payrolls is None:
+            chunks = self.iter_ledger_chunks(chunk_size)
+        else:
+            chunks = (payrolls.iloc[start:start + chunk_size] for start in range(0, len(payrolls), chunk_size))
+        
+        # 직원 이름 조회표
+        employee_names = self.employee_names
+        
+        try:
+            workbook = xlsxwriter.Workbook(file_path, {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd"
+            })
+            try:
+                worksheet = workbook.add_worksheet()
+                header_format = workbook.add_format({"bold": True, "border": 1})
+                _write_detail_sheet(worksheet, chunks, employee_names, header_format)
+            finally:
+                workbook.close()
+            return True
+        except Exception as e:
+            print(f"엑셀 내보내기 오류: {e}")
+            return False
+    
+    def iter_ledger_chunks(self, chunk_size=50000):
+        """
+        임금대장 파일을 일정 크기의 행 묶음으로 읽기
+        
+        Args:
+            chunk_size (int, optional): 묶음당 행 수. 기본값은 50000.
+            
+        Yields:
+            pandas.DataFrame: 임금 지급 기록 묶음
+        """
+        if not os.path.exists(self.ledger_file):
+            return
+        
+        for chunk in pd.read_csv(self.ledger_file, chunksize=chunk_size, dtype={"ledger_id": str, "employee_id": str}):
+            yield chunk
+    
+    def export_to_excel_bytes(self, payrolls=None):
+        """
+        임금대장 데이터를 메모리에서 엑셀 파일로 만들어 반환
+        
+        디스크에 임시 파일을 만들지 않으므로 여러 사용자가 같은 기간을
+        동시에 내보내도 서로 영향을 주지 않습니다.
+        
+        Args:
+            payrolls (pandas.DataFrame, optional): 내보낼 임금대장 데이터. 기본값은 None.
+            
+        Returns:
+            bytes: 엑셀 파일 내용 (실패 시 None)
+        """
+        buffer = io.BytesIO()
+        if not self.export_to_excel(buffer, payrolls):
+            return None
+        return buffer.getvalue()
+    
+    def export_payroll_workbook(self, file_path, year):
+        """
+        연간 임금대장 통합 엑셀 파일 내보내기
+        
+        상세 내역, 부서별 월별 총 지급액, 직원별 연간 합계, 월별 공제 내역 시트를 만듭니다.
+        요약 시트는 모두 한 번의 집계 결과(summarize_payrolls)에서 만들고,
+        셀 서식은 통합 문서에서 한 번만 만들어 모든 시트가 함께 사용합니다.
+        
+        Args:
+            file_path (str | file-like): 저장할 파일 경로 또는 쓰기 가능한 스트림
+            year (int): 연도
+            
+        Returns:
+            bool: 내보내기 성공 여부
+        """
+        import xlsxwriter
+        
+        payrolls = self.get_payrolls_by_period(
+            pd.Timestamp(year=year, month=1, day=1), pd.Timestamp(year=year, month=12, day=31)
+        ).sort_values(["payment_date", "employee_id"], kind="stable")
+        summary = summarize_payrolls(payrolls, self.employees)
+        employee_names = self.employee_names
+        
+        try:
+            workbook = xlsxwriter.Workbook(file_path, {
+                "constant_memory": True,
+                "default_date_format": "yyyy-mm-dd"
+            })
+            try:
+                # 공용 셀 서식
+                formats = {
+                    "header": workbook.add_format({"bold": True, "border": 1, "bg_color": "#E3F2FD"}),
+                    "money": workbook.add_format({"num_format": "#,##0"}),
+                    "total": workbook.add_format({"bold": True, "num_format": "#,##0", "top": 1})
+                }
+                
+                detail_sheet = workbook.add_worksheet("상세 내역")
+                _write_detail_sheet(detail_sheet, [payrolls], employee_names, formats["header"])
+                
+                for sheet_name, frame in (
+                    ("부서별 월별", summary["department_month"]),
+                    ("직원별 연간", summary["employee_annual"]),
+                    ("공제 내역", summary["deductions"])
+                ):
+                    _write_summary_sheet(workbook.add_worksheet(sheet_name), frame, formats)
+            finally:
+                workbook.close()
+            return True
+        except Exception as e:
+            print(f"엑셀 내보내기 오류: {e}")
+            return False
+    
+    def export_payroll_workbook_bytes(self, year):
+        """
+        연간 임금대장 통합 엑셀 파일을 메모리에서 만들어 반환
+        
+        Args:
+            year (int): 연도
+            
+        Returns:
+            bytes: 엑셀 파일 내용 (실패 시 None)
+        """
+        buffer = io.BytesIO()
+        if not self.export_payroll_workbook(buffer, year):
+            return None
+        return buffer.getvalue()
+
+def data_files_stamp(data_dir=None):
+    """
+    임금대장 데이터 파일들의 크기와 수정 시각
+    
+    파일을 읽지 않고 상태만 확인하므로, 화면에서 불러온 임금대장을 재사용해도 되는지
+    판단하는 캐시 키로 사용할 수 있습니다.
+    
+    Args:
+        data_dir (str, optional): 데이터 저장 디렉토리. 기본값은 None (DEFAULT_DATA_DIR).
+    
+    Returns:
+        tuple: 파일별 (크기, 수정 시각) 튜플 (파일이 없으면 None)
+    """
+    data_dir = DEFAULT_DATA_DIR if data_dir is None else data_dir
+    stamp = []
+    
+    for file_name in DATA_FILES:
+        try:
+            stat = os.stat(os.path.join(data_dir, file_name))
+            stamp.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            stamp.append(None)
+    
+    return (os.path.abspath(data_dir),) + tuple(stamp)
+
+def _employee_info_frame(employees):
+    """
+    직원 목록에서 직원 ID별 이름·부서·직급 조회표 생성
+    
+    Args:
+        employees (pandas.DataFrame): 직원 목록
+    
+    Returns:
+        pandas.DataFrame: 직원 ID를 인덱스로 하는 EMPLOYEE_INFO_COLUMNS 열
+    """
+    info = employees.drop_duplicates("employee_id").reindex(columns=["employee_id"] + list(EMPLOYEE_INFO_COLUMNS))
+    info["employee_id"] = info["employee_id"].astype(str)
+    return info.set_index("employee_id").astype(object)
+
+def build_rollup(payrolls):
+    """
+    임금 지급 기록을 (연도, 월, 직원) 단위로 집계
+    
+    Args:
+        payrolls (pandas.DataFrame): 임금 지급 기록
+    
+    Returns:
+        pandas.DataFrame: ROLLUP_KEYS 색인과 ROLLUP_VALUES 열을 가진 집계표
+    """
+    dates = pd.to_datetime(payrolls["payment_date"], errors="coerce")
+    
+    frame = pd.DataFrame({
+        "year": dates.dt.year,
+        "month": dates.dt.month,
+        "employee_id": payrolls["employee_id"].astype(str),
+        "payments": 1
+    })
+    for column in ROLLUP_VALUES[1:]:
+        frame[column] = pd.to_numeric(payrolls[column], errors="coerce").fillna(0)
+    
+    frame = frame[dates.notna()]
+    frame["year"] = frame["year"].astype(int)
+    frame["month"] = frame["month"].astype(int)
+    
+    return frame.groupby(ROLLUP_KEYS).sum()
+
+def summarize_rollup(rollup):
+    """
+    월별 집계표 행의 합계 계산
+    
+    Args:
+        rollup (pandas.DataFrame): ROLLUP_KEYS 색인과 ROLLUP_VALUES 열을 가진 집계표 (기간 선택 후)
+    
+    Returns:
+        dict: total_employees, total_gross_pay, total_deductions, total_net_pay, avg_gross_pay, avg_net_pay,
+            deductions (공제 항목별 합계)
+    """
+    payments = rollup["payments"].sum()
+    totals = rollup[ROLLUP_VALUES[1:]].sum()
+    
+    return {
+        "total_employees": rollup.index.get_level_values("employee_id").nunique(),
+        "total_gross_pay": totals["gross_pay"],
+        "total_deductions": totals["total_deductions"],
+        "total_net_pay": totals["net_pay"],
+        "avg_gross_pay": totals["gross_pay"] / payments if payments else float("nan"),
+        "avg_net_pay": totals["net_pay"] / payments if payments else float("nan"),
+        "deductions": {column: float(totals[column]) for column in DEDUCTION_RATES}
+    }
+
+def _summaries_match(first, second):
+    """
+    두 합계(summarize_rollup 결과)의 보고서 집계 항목이 같은지 확인 (부동소수점 오차 허용)
+    """
+    first_values = [first[key] for key in MONTH_REPORT_KEYS]
+    second_values = [second[key] for key in MONTH_REPORT_KEYS]
+    return bool(np.allclose(first_values, second_values, rtol=1e-9, atol=0.01, equal_nan=True))
+
+def _month_key(date):
+    """
+    날짜의 월 키 (YYYY-MM)
+    """
+    return pd.Timestamp(date).strftime("%Y-%m")
+
+def _json_number(value):
+    """
+    numpy 숫자를 JSON으로 저장할 수 있는 파이썬 숫자로 변환 (NaN은 0)
+    """
+    if pd.isna(value):
+        return 0
+    return int(value) if float(value).is_integer() else float(value)
+
+def _write_detail_sheet(worksheet, chunks, employee_names, header_format):
+    """
+    상세 내역 시트 기록 (EXPORT_COLUMNS 순서, 행 묶음 단위)
+    
+    Args:
+        worksheet: xlsxwriter 워크시트
+        chunks (iterable): 임금 지급 기록 묶음 (pandas.DataFrame)
+        employee_names (pandas.Series): 직원 ID별 이름
+        header_format: 머리글 셀 서식
+        
+    Returns:
+        int: 기록한 행 수 (머리글 제외)
+    """
+    worksheet.write_row(0, 0, [EXPORT_COLUMN_NAMES[column] for column in EXPORT_COLUMNS], header_format)
+    
+    row_index = 1
+    for chunk in chunks:
+        for values in _export_rows(chunk, employee_names):
+            worksheet.write_row(row_index, 0, values)
+            row_index += 1
+    
+    return row_index - 1
+
+def _write_summary_sheet(worksheet, frame, formats):
+    """
+    요약 시트 기록 (문자열 열은 그대로, 숫자 열은 금액 서식, 마지막 행은 합계 서식)
+    
+    Args:
+        worksheet: xlsxwriter 워크시트
+        frame (pandas.DataFrame): 요약 데이터 (마지막 행이 합계)
+        formats (dict): 공용 셀 서식 (header, money, total)
+    """
+    worksheet.write_row(0, 0, [str(column) for column in frame.columns], formats["header"])
+    worksheet.set_column(0, len(frame.columns) - 1, 14)
+    
+    last_row = len(frame)
+    for row_index, row in enumerate(frame.itertuples(index=False, name=None), start=1):
+        cell_format = formats["total"] if row_index == last_row else formats["money"]
+        for column_index, value in enumerate(row):
+            if isinstance(value, str):
+                worksheet.write_string(row_index, column_index, value, cell_format if row_index == last_row else None)
+            elif value is not None and not pd.isna(value):
+                worksheet.write_number(row_index, column_index, value, cell_format)
+
+def summarize_payrolls(payrolls, employees):
+    """
+    임금대장 통합 엑셀 파일의 요약 데이터 계산
+    
+    부서, 직원, 월 단위로 한 번 집계한 결과에서 부서별 월별 총 지급액,
+    직원별 연간 합계, 월별 공제 내역을 만듭니다. 각 표의 마지막 행은 합계입니다.
+    
+    Args:
+        payrolls (pandas.DataFrame): 임금 지급 기록
+        employees (pandas.DataFrame): 직원 정보 (employee_id, name, department)
+        
+    Returns:
+        dict: 요약 데이터 (department_month, employee_annual, deductions)
+    """
+    amount_columns = ["gross_pay"] + list(DEDUCTION_RATES) + ["total_deductions", "net_pay"]
+    
+    frame = payrolls[["employee_id", "payment_date"] + amount_columns].copy()
+    frame["employee_id"] = frame["employee_id"].astype(str)
+    frame["month"] = pd.to_datetime(frame["payment_date"]).dt.month
+    for column in amount_columns:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").fillna(0)
+    
+    employee_info = employees[["employee_id", "name", "department"]].copy()
+    employee_info["employee_id"] = employee_info["employee_id"].astype(str)
+    frame = frame.merge(employee_info.drop_duplicates("employee_id"), on="employee_id", how="left")
+    frame["name"] = frame["name"].fillna("")
+    frame["department"] = frame["department"].fillna("미지정")
+    
+    # 단일 집계 (부서, 직원, 월)
+    base = frame.groupby(["department", "employee_id", "name", "month"], sort=True)[amount_columns].sum()
+    base["payments"] = frame.groupby(["department", "employee_id", "name", "month"], sort=True).size()
+    
+    # 부서별 월별 총 지급액
+    department_month = (
+        base["gross_pay"].groupby(level=["department", "month"]).sum()
+        .unstack("month", fill_value=0)
+        .reindex(columns=range(1, 13), fill_value=0)
+    )
+    department_month.columns = [f"{month}월" for month in department_month.columns]
+    department_month["합계"] = department_month.sum(axis=1)
+    department_month = department_month.reset_index().rename(columns={"department": "부서"})
+    
+    # 직원별 연간 합계
+    employee_annual = base.groupby(level=["department", "employee_id", "name"]).agg(
+        {"payments": "sum", "gross_pay": "sum", "total_deductions": "sum", "net_pay": "sum"}
+    ).reset_index()
+    employee_annual = employee_annual[["employee_id", "name", "department", "payments", "gross_pay", "total_deductions", "net_pay"]]
+    employee_annual.columns = ["직원 ID", "직원 이름", "부서", "지급 횟수", "총 지급액", "총 공제액", "실수령액"]
+    
+    # 월별 공제 내역
+    deductions = (
+        base[list(DEDUCTION_RATES) + ["total_deductions"]].groupby(level="month").sum()
+        .reindex(range(1, 13), fill_value=0)
+    )
+    deductions.index = [f"{month}월" for month in deductions.index]
+    deductions = deductions.rename(columns=EXPORT_COLUMN_NAMES).reset_index().rename(columns={"index": "월"})
+    
+    return {
+        "department_month": _append_total_row(department_month, "합계"),
+        "employee_annual": _append_total_row(employee_annual, "합계"),
+        "deductions": _append_total_row(deductions, "합계")
+    }
+
+def _append_total_row(frame, label):
+    """
+    숫자 열의 합계 행을 표 끝에 추가 (첫 번째 열에 label 표시)
+    """
+    totals = {column: frame[column].sum() for column in frame.columns if pd.api.types.is_numeric_dtype(frame[column])}
+    totals[frame.columns[0]] = label
+    return pd.concat([frame, pd.DataFrame([totals])], ignore_index=True).reindex(columns=frame.columns)
+
+def _export_rows(payrolls, employee_names):
+    """
+    임금 지급 기록 묶음을 엑셀 행 값으로 변환 (EXPORT_COLUMNS 순서)
+    
+    Args:
+        payrolls (pandas.DataFrame): 임금 지급 기록 묶음
+        employee_names (pandas.Series): 직원 ID별 이름
+        
+    Yields:
+        list: 행 값 (빈 값은 None, 날짜는 datetime)
+    """
+    frame = payrolls.reindex(columns=EXPORT_COLUMNS)
+    frame["employee_name"] = frame["employee_id"].astype(str).map(employee_names)
+    
+    for column in ("payment_date", "payment_period_start", "payment_period_end"):
+        frame[column] = pd.to_datetime(frame[column], errors="coerce")
+    
+    frame = frame.astype(object).where(frame.notna(), None)
+    for row in frame.itertuples(index=False, name=None):
+        yield [value.to_pydatetime() if isinstance(value, pd.Timestamp) else value for value in row]
+
+def calculate_payroll_frame(payrolls):
+    """
+    임금 지급 기록의 총 지급액, 공제액, 실수령액 일괄 계산
+    
+    add_payroll과 같은 규칙으로 계산하며, 공제 항목 값이 이미 있으면 그대로 사용합니다.
+    
+    Args:
+        payrolls (pandas.DataFrame): 임금 지급 기록 (지급 항목 포함)
+    
+    Returns:
+        pandas.DataFrame: 금액 열이 채워진 임금 지급 기록
+    """
+    payrolls = payrolls.copy()
+    
+    # 지급 항목 (없으면 0)
+    for column in PAY_COMPONENTS:
+        if column not in payrolls.columns:
+            payrolls[column] = 0
+        payrolls[column] = pd.to_numeric(payrolls[column], errors="coerce").fillna(0)
+    
+    payrolls["gross_pay"] = payrolls[PAY_COMPONENTS].sum(axis=1)
+    
+    # 공제 항목 (값이 없으면 기본 공제율 적용)
+    for column, rate in DEDUCTION_RATES.items():
+        base = payrolls["income_tax"] if column == "local_income_tax" else payrolls["gross_pay"]
+        if column in payrolls.columns:
+            payrolls[column] = pd.to_numeric(payrolls[column], errors="coerce").fillna(base * rate)
+        else:
+            payrolls[column] = base * rate
+    
+    payrolls["total_deductions"] = payrolls[list(DEDUCTION_RATES)].sum(axis=1)
+    payrolls["net_pay"] = payrolls["gross_pay"] - payrolls["total_deductions"]
+    
+    return payrolls
@@ -1,10 +1,9 @@
 import streamlit as st
 import datetime
 import io
-import base64
-import os
-import pandas as pd
-import numpy as np
+
+from hr_core.pay_statement import generate_pay_statement_html, get_pay_statement_template, write_pay_statement_archive
+from utils import get_ledger, render_download_button
 
 def render_pay_statement_ui():
     """
@@ -98,330 +97,57 @@ def render_pay_statement_ui():
                 # HTML 임금명세서 생성
                 html_content = generate_pay_statement_html(st.session_state.pay_statement_data)
                 
-                # HTML을 base64로 인코딩하여 다운로드 링크 생성
-                b64 = base64.b64encode(html_content.encode()).decode()
-                download_link = f'<a href="data:text/html;base64,{b64}" download="임금명세서_{st.session_state.pay_statement_data["employee_name"]}_{st.session_state.pay_statement_data["pay_period"]}.html">임금명세서 다운로드</a>'
-                
                 st.success("임금명세서가 성공적으로 생성되었습니다.")
-                st.markdown(download_link, unsafe_allow_html=True)
+                
+                # 다운로드 버튼 (HTML을 페이지에 포함하지 않고 별도 응답으로 전송)
+                render_download_button(
+                    html_content,
+                    f'임금명세서_{st.session_state.pay_statement_data["employee_name"]}_{st.session_state.pay_statement_data["pay_period"]}.html',
+                    "임금명세서 다운로드",
+                    mime="text/html",
+                    key="download_pay_statement"
+                )
                 
                 # 생성된 HTML 미리보기 표시
                 st.subheader("임금명세서 미리보기")
                 st.components.v1.html(html_content, height=600, scrolling=True)
         except Exception as e:
             st.error(f"임금명세서 생성 중 오류가 발생했습니다: {e}")
-
-def generate_pay_statement_html(data):
-    """
-    HTML 임금명세서 생성
-    
-    Args:
-        data (dict): 임금명세서 데이터
-        
-    Returns:
-        str: HTML 형식의 임금명세서
-    """
-    # 한국어 통화 포맷 함수
-    def format_currency(value):
-        if value is None:
-            return "0원"
-        return f"{int(value):,}원"
     
-    # CSS 스타일 정의
-    css_style = """
-    <style>
-        body {
-            font-family: 'Malgun Gothic', 'Gulim', sans-serif;
-            line-height: 1.6;
-            margin: 40px;
-            color: #333;
-        }
-        .container {
-            max-width: 800px;
-            margin: 0 auto;
-            border: 1px solid #ddd;
-            padding: 20px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            text-align: center;
-            font-size: 24px;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #3498db;
-        }
-        .header {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 20px;
-            border-bottom: 1px solid #eee;
-            padding-bottom: 10px;
-        }
-        .company-info, .employee-info {
-            flex: 1;
-        }
-        .info-item {
-            margin-bottom: 5px;
-        }
-        .info-label {
-            font-weight: bold;
-            display: inline-block;
-            width: 100px;
-        }
-        .section-title {
-            font-size: 18px;
-            margin: 20px 0 10px;
-            padding-bottom: 5px;
-            border-bottom: 1px solid #eee;
-        }
-        .pay-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 20px;
-        }
-        .pay-table th, .pay-table td {
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-        .pay-table th {
-            background-color: #f8f9fa;
-        }
-        .summary {
-            display: flex;
-            justify-content: space-between;
-            margin: 20px 0;
-            font-weight: bold;
-        }
-        .summary-item {
-            text-align: center;
-            flex: 1;
-            padding: 10px;
-            border: 1px solid #ddd;
-        }
-        .total {
-            background-color: #e8f4fd;
-        }
-        .remarks {
-            margin-top: 20px;
-            border: 1px solid #ddd;
-            padding: 10px;
-            background-color: #f9f9f9;
-        }
-        .footer {
-            margin-top: 30px;
-            text-align: center;
-            font-size: 14px;
-            color: #777;
-        }
-        .print-button {
-            text-align: center;
-            margin: 20px;
-        }
-        @media print {
-            .print-button {
-                display: none;
-            }
-            body {
-                margin: 0;
-                padding: 20px;
-            }
-        }
-    </style>
-    """
+    # 임금대장에서 일괄 생성
+    st.divider()
+    st.subheader("임금대장에서 일괄 생성")
+    st.caption("선택한 월의 모든 임금 지급 기록으로 임금명세서를 만들어 ZIP 파일 하나로 내려받습니다.")
     
-    # 인쇄 기능 JavaScript
-    print_script = """
-    <script>
-        function printPayStatement() {
-            window.print();
-        }
-    </script>
-    """
+    col1, col2, col3 = st.columns(3)
     
-    # HTML 문서 생성
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>임금명세서 - {data.get('employee_name', '')} ({data.get('pay_period', '')})</title>
-        {css_style}
-        {print_script}
-    </head>
-    <body>
-        <div class="print-button">
-            <button onclick="printPayStatement()">인쇄하기</button>
-        </div>
-        
-        <div class="container">
-            <h1>임 금 명 세 서</h1>
-            
-            <div class="header">
-                <div class="company-info">
-                    <div class="info-item"><span class="info-label">회사명</span>: {data.get('company_name', '')}</div>
-                    <div class="info-item"><span class="info-label">급여 기간</span>: {data.get('pay_period', '')}</div>
-                    <div class="info-item"><span class="info-label">지급일</span>: {data.get('pay_date', '')}</div>
-                </div>
-                <div class="employee-info">
-                    <div class="info-item"><span class="info-label">직원명</span>: {data.get('employee_name', '')}</div>
-                    <div class="info-item"><span class="info-label">부서</span>: {data.get('department', '')}</div>
-                    <div class="info-item"><span class="info-label">직위</span>: {data.get('position', '')}</div>
-                </div>
-            </div>
-            
-            <h2 class="section-title">급여 내역</h2>
-            <table class="pay-table">
-                <tr>
-                    <th>항목</th>
-                    <th>금액</th>
-                    <th>비고</th>
-                </tr>
-                <tr>
-                    <td>기본급</td>
-                    <td>{format_currency(data.get('base_salary', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>초과근무수당</td>
-                    <td>{format_currency(data.get('overtime_pay', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>상여금</td>
-                    <td>{format_currency(data.get('bonus', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>식대</td>
-                    <td>{format_currency(data.get('meal_allowance', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>교통비</td>
-                    <td>{format_currency(data.get('transportation_allowance', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>기타 수당</td>
-                    <td>{format_currency(data.get('other_allowance', 0))}</td>
-                    <td></td>
-                </tr>
-            </table>
-            
-            <h2 class="section-title">공제 내역</h2>
-            <table class="pay-table">
-                <tr>
-                    <th>항목</th>
-                    <th>금액</th>
-                    <th>비고</th>
-                </tr>
-                <tr>
-                    <td>소득세</td>
-                    <td>{format_currency(data.get('income_tax', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>지방소득세</td>
-                    <td>{format_currency(data.get('local_income_tax', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>국민연금</td>
-                    <td>{format_currency(data.get('national_pension', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>건강보험</td>
-                    <td>{format_currency(data.get('health_insurance', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>고용보험</td>
-                    <td>{format_currency(data.get('employment_insurance', 0))}</td>
-                    <td></td>
-                </tr>
-                <tr>
-                    <td>기타 공제</td>
-                    <td>{format_currency(data.get('other_deduction', 0))}</td>
-                    <td></td>
-                </tr>
-            </table>
-            
-            <div class="summary">
-                <div class="summary-item">
-                    <div>총 지급액</div>
-                    <div>{format_currency(data.get('total_salary', 0))}</div>
-                </div>
-                <div class="summary-item">
-                    <div>총 공제액</div>
-                    <div>{format_currency(data.get('total_deduction', 0))}</div>
-                </div>
-                <div class="summary-item total">
-                    <div>실수령액</div>
-                    <div>{format_currency(data.get('net_salary', 0))}</div>
-                </div>
-            </div>
-            
-            <div class="remarks">
-                <h3>비고</h3>
-                <p>{data.get('remarks', '').replace('\n', '<br>')}</p>
-            </div>
-            
-            <div class="footer">
-                <p>본 임금명세서는 {datetime.datetime.now().strftime("%Y년 %m월 %d일")}에 생성되었습니다.</p>
-                <p>{data.get('company_name', '')}</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    with col1:
+        current_year = datetime.date.today().year
+        batch_year = st.selectbox("연도", list(range(current_year - 5, current_year + 1)), index=5, key="batch_year_pay")
     
-    return html
-
-def get_pay_statement_template():
-    """
-    임금명세서 기본 템플릿 데이터 반환
+    with col2:
+        batch_month = st.selectbox("월", list(range(1, 13)), index=datetime.date.today().month - 1, key="batch_month_pay")
     
-    Returns:
-        dict: 임금명세서 기본 템플릿 데이터
-    """
-    today = datetime.date.today()
-    current_month = today.replace(day=1)
-    last_month = (current_month - datetime.timedelta(days=1)).replace(day=1)
-    pay_period = f"{last_month.year}년 {last_month.month}월"
+    with col3:
+        batch_company = st.text_input("회사명", value=form_data["company_name"], key="batch_company_pay")
     
-    return {
-        # 기본 정보
-        "company_name": "",
-        "employee_name": "",
-        "department": "",
-        "position": "",
-        "pay_period": pay_period,
-        "pay_date": today.strftime("%Y-%m-%d"),
-        
-        # 급여 항목
-        "base_salary": 0,
-        "overtime_pay": 0,
-        "bonus": 0,
-        "meal_allowance": 0,
-        "transportation_allowance": 0,
-        "other_allowance": 0,
-        
-        # 공제 항목
-        "income_tax": 0,
-        "local_income_tax": 0,
-        "national_pension": 0,
-        "health_insurance": 0,
-        "employment_insurance": 0,
-        "other_deduction": 0,
-        
-        # 합계
-        "total_salary": 0,
-        "total_deduction": 0,
-        "net_salary": 0,
-        
-        # 비고
-        "remarks": ""
-    }
+    if st.button("임금명세서 일괄 생성", key="generate_pay_statements_batch"):
+        try:
+            with st.spinner("임금명세서를 생성하여 ZIP 파일로 묶는 중입니다..."):
+                # 명세서를 한 건씩 생성하여 바로 압축 (압축된 결과만 메모리에 보관)
+                archive = io.BytesIO()
+                summary = write_pay_statement_archive(get_ledger(), batch_year, batch_month, archive, company_name=batch_company)
+            
+            if summary["statements"] > 0:
+                st.success(f"임금명세서 {summary['statements']:,}건을 생성했습니다. ({summary['seconds']:.2f}초)")
+                render_download_button(
+                    archive,
+                    f"임금명세서_{batch_year}-{batch_month:02d}.zip",
+                    "임금명세서 ZIP 다운로드",
+                    mime="application/zip",
+                    key="download_pay_statements_batch"
+                )
+            else:
+                st.warning(f"{batch_year}년 {batch_month}월에 임금 지급 기록이 없습니다.")
+        except Exception as e:
+            st.error(f"임금명세서 일괄 생성 중 오류가 발생했습니다: {e}")
@@ -0,0 +1,374 @@
+"""
+payroll_batch.py - 임금대장 일괄 처리 명령행 도구
+
+브라우저 없이 월 급여 계산, 월 마감 등 임금대장 일괄 작업을 실행합니다.
+
+사용 예:
+    python payroll_batch.py run-payroll --year 2025 --month 9
+    python payroll_batch.py run-payroll --year 2025 --month 9 --components components.csv --workers 4
+    python payroll_batch.py run-payroll --year 2025 --month 9 --close
+    python payroll_batch.py import-ledger legacy_ledger.xlsx --errors import_errors.csv
+    python payroll_batch.py import-employees roster.csv
+    python payroll_batch.py statements --year 2025 --month 9 -o statements/2025-09 --company "(주)회사"
+    python payroll_batch.py statements --year 2025 --month 9 --zip statements_2025-09.zip
+"""
+
+import argparse
+import calendar
+import datetime
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from hr_core.importers import import_employees_csv, import_payroll_workbook
+from hr_core.pay_statement import build_month_statement_records, write_pay_statement_archive, write_pay_statements
+from hr_core.payroll_ledger import PayrollLedger, calculate_payroll_frame
+
+# 고정 지급 항목 기본값 (직원별 지급 항목 파일이 없는 경우)
+DEFAULT_PAY_COMPONENTS = {
+    "overtime_hours": 0,
+    "overtime_pay": 0,
+    "bonus": 0,
+    "meal_allowance": 100000,
+    "transportation_allowance": 50000,
+    "other_allowances": 0
+}
+
+# 시급제 직원의 월 소정근로시간 기본값 (주 40시간 기준)
+DEFAULT_MONTHLY_WORK_HOURS = 209
+
+def build_monthly_payrolls(employees, components, year, month, payment_day=25):
+    """
+    월 급여 계산 대상 임금 지급 기록 생성
+    
+    Args:
+        employees (pandas.DataFrame): 직원 정보
+        components (pandas.DataFrame): 직원별 고정 지급 항목 (employee_id 열 포함, 없으면 None)
+        year (int): 연도
+        month (int): 월
+        payment_day (int, optional): 임금 지급일. 기본값은 25.
+    
+    Returns:
+        pandas.DataFrame: 금액 계산 전 임금 지급 기록 (직원 ID 순)
+    """
+    last_day = calendar.monthrange(year, month)[1]
+    payment_date = datetime.date(year, month, min(payment_day, last_day))
+    
+    payrolls = employees[["employee_id", "payment_type", "base_salary", "hourly_rate"]].copy()
+    payrolls["employee_id"] = payrolls["employee_id"].astype(str)
+    
+    if components is not None and not components.empty:
+        components = components.copy()
+        components["employee_id"] = components["employee_id"].astype(str)
+        payrolls = payrolls.merge(
+            components.drop_duplicates("employee_id", keep="last"),
+            on="employee_id", how="left", suffixes=("_employee", "")
+        )
+        # 지급 항목 파일의 기본급이 없으면 직원 정보의 기본급 사용
+        if "base_salary_employee" in payrolls.columns:
+            payrolls["base_salary"] = payrolls["base_salary"].fillna(payrolls["base_salary_employee"])
+            payrolls = payrolls.drop(columns=["base_salary_employee"])
+        if "hourly_rate_employee" in payrolls.columns:
+            payrolls["hourly_rate"] = payrolls["hourly_rate"].fillna(payrolls["hourly_rate_employee"])
+            payrolls = payrolls.drop(columns=["hourly_rate_employee"])
+    
+    for column, value in DEFAULT_PAY_COMPONENTS.items():
+        if column not in payrolls.columns:
+            payrolls[column] = value
+        else:
+            payrolls[column] = payrolls[column].fillna(value)
+    
+    # 시급제 직원은 시급 × 근로시간으로 기본급 계산
+    work_hours = payrolls["work_hours"].fillna(DEFAULT_MONTHLY_WORK_HOURS) if "work_hours" in payrolls.columns else DEFAULT_MONTHLY_WORK_HOURS
+    hourly = payrolls["payment_type"] == "hourly"
+    payrolls["base_salary"] = np.where(
+        hourly,
+        pd.to_numeric(payrolls["hourly_rate"], errors="coerce").fillna(0) * work_hours,
+        pd.to_numeric(payrolls["base_salary"], errors="coerce").fillna(0)
+    )
+    
+    payrolls["payment_date"] = payment_date.strftime("%Y-%m-%d")
+    payrolls["payment_period_start"] = datetime.date(year, month, 1).strftime("%Y-%m-%d")
+    payrolls["payment_period_end"] = datetime.date(year, month, last_day).strftime("%Y-%m-%d")
+    
+    return payrolls.sort_values("employee_id", kind="stable").reset_index(drop=True)
+
+def run_monthly_payroll(ledger, year, month, components=None, payment_day=25, workers=None, dry_run=False, close=False):
+    """
+    월 급여 계산 실행
+    
+    직원을 작업 프로세스 수만큼 나누어 총 지급액, 공제액, 실수령액을 병렬로 계산하고,
+    결과를 직원 ID 순으로 합쳐 임금대장에 한 번에 기록합니다.
+    해당 월에 이미 임금 지급 기록이 있는 직원과 월말 이후 입사 예정인 직원은 건너뜁니다.
+    close가 True이면 기록 후 해당 월을 마감합니다 (PayrollLedger.close_month).
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        year (int): 연도
+        month (int): 월
+        components (pandas.DataFrame, optional): 직원별 고정 지급 항목. 기본값은 None.
+        payment_day (int, optional): 임금 지급일. 기본값은 25.
+        workers (int, optional): 작업 프로세스 수. 기본값은 None (CPU 코어 수).
+        dry_run (bool, optional): True이면 계산만 하고 기록하지 않음. 기본값은 False.
+        close (bool, optional): True이면 기록 후 월 마감. 기본값은 False.
+    
+    Returns:
+        dict: 처리 결과 (employees, skipped, not_hired, gross_pay, net_pay, closed, seconds, payrolls)
+    
+    Raises:
+        ValueError: 이미 마감된 월인 경우
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    
+    month_start = pd.Timestamp(year=year, month=month, day=1)
+    if ledger.is_month_closed(month_start):
+        raise ValueError(f"{year}년 {month}월은 이미 마감되어 기록을 추가할 수 없습니다.")
+    
+    # 이미 지급 기록이 있는 직원 제외
+    month_end = month_start + pd.offsets.MonthEnd(0)
+    existing = ledger.get_payrolls_by_period(month_start, month_end)
+    paid_ids = set(existing["employee_id"].astype(str))
+    
+    employees = ledger.get_all_employees()
+    
+    # 월말 이후 입사 예정인 직원 제외 (입사일이 없으면 대상에 포함)
+    entry_dates = pd.to_datetime(employees["entry_date"], errors="coerce")
+    hired = ~(entry_dates > month_end)
+    
+    paid = employees["employee_id"].astype(str).isin(paid_ids)
+    targets = employees[hired & ~paid]
+    
+    payrolls = build_monthly_payrolls(targets, components, year, month, payment_day)
+    
+    if payrolls.empty:
+        computed = payrolls
+    elif workers == 1 or len(payrolls) < workers * 2:
+        computed = calculate_payroll_frame(payrolls)
+    else:
+        shards = np.array_split(np.arange(len(payrolls)), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(calculate_payroll_frame, [payrolls.iloc[shard] for shard in shards]))
+        computed = pd.concat(results).sort_values("employee_id", kind="stable").reset_index(drop=True)
+    
+    if not dry_run and not computed.empty:
+        ledger.add_payrolls(computed)
+    
+    closed = False
+    if close and not dry_run:
+        ledger.close_month(year, month)
+        closed = True
+    
+    return {
+        "employees": len(computed),
+        "skipped": int((hired & paid).sum()),
+        "not_hired": int((~hired).sum()),
+        "gross_pay": float(computed["gross_pay"].sum()) if not computed.empty else 0.0,
+        "net_pay": float(computed["net_pay"].sum()) if not computed.empty else 0.0,
+        "closed": closed,
+        "seconds": time.perf_counter() - started,
+        "payrolls": computed
+    }
+
+def run_pay_statements(ledger, year, month, output_dir, company_name="", workers=None, chunk_size=250):
+    """
+    월 임금명세서 일괄 생성
+    
+    해당 월의 임금 지급 기록을 임금명세서 항목으로 변환한 뒤, 묶음 단위로 작업 프로세스에
+    나누어 HTML 파일로 저장합니다. 진행 중인 묶음 수를 작업 프로세스 수의 2배로 제한하여
+    명세서 데이터를 한꺼번에 작업 큐에 올리지 않습니다.
+    
+    Args:
+        ledger (PayrollLedger): 임금대장
+        year (int): 연도
+        month (int): 월
+        output_dir (str): 임금명세서 저장 디렉토리
+        company_name (str, optional): 회사명. 기본값은 "".
+        workers (int, optional): 작업 프로세스 수. 기본값은 None (CPU 코어 수).
+        chunk_size (int, optional): 작업 단위 명세서 수. 기본값은 250.
+    
+    Returns:
+        dict: 생성 결과 (statements, seconds, output)
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    records = build_month_statement_records(ledger, year, month, company_name)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    chunks = [records[start:start + chunk_size] for start in range(0, len(records), chunk_size)]
+    written = 0
+    
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            written += write_pay_statements(chunk, output_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for chunk in chunks:
+                pending.append(executor.submit(write_pay_statements, chunk, output_dir))
+                if len(pending) >= workers * 2:
+                    written += pending.pop(0).result()
+            for future in pending:
+                written += future.result()
+    
+    return {
+        "statements": written,
+        "seconds": time.perf_counter() - started,
+        "output": output_dir
+    }
+
+def _load_components(file_path):
+    """
+    직원별 고정 지급 항목 파일 로드 (CSV 또는 엑셀)
+    """
+    if file_path is None:
+        return None
+    if os.path.splitext(file_path)[1].lower() in (".xlsx", ".xlsm"):
+        return pd.read_excel(file_path, dtype={"employee_id": str})
+    return pd.read_csv(file_path, dtype={"employee_id": str})
+
+def main(argv=None):
+    """
+    명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="임금대장 일괄 처리 도구")
+    parser.add_argument("--data-dir", default=None, help="임금대장 데이터 디렉토리 (기본값: ./data)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    payroll_parser = subparsers.add_parser("run-payroll", help="월 급여 계산 (재직 직원 임금 지급 기록 생성)")
+    payroll_parser.add_argument("--year", type=int, required=True, help="연도")
+    payroll_parser.add_argument("--month", type=int, required=True, choices=range(1, 13), metavar="MONTH", help="월")
+    payroll_parser.add_argument("--components", default=None, help="직원별 고정 지급 항목 파일 (employee_id 열 포함 CSV/엑셀)")
+    payroll_parser.add_argument("--payment-day", type=int, default=25, help="임금 지급일 (기본값: 25)")
+    payroll_parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 코어 수)")
+    payroll_parser.add_argument("--close", action="store_true", help="기록 후 해당 월을 마감 (이후 추가, 수정, 삭제 불가)")
+    payroll_parser.add_argument("--dry-run", action="store_true", help="계산만 하고 임금대장에 기록하지 않음")
+    
+    import_parser = subparsers.add_parser("import-ledger", help="엑셀 임금대장 일괄 가져오기")
+    import_parser.add_argument("workbook", help="가져올 엑셀 파일 (.xlsx)")
+    import_parser.add_argument("--sheet", default=None, help="시트 이름 (기본값: 첫 번째 시트)")
+    import_parser.add_argument("--batch-size", type=int, default=20000, help="묶음당 행 수 (기본값: 20000)")
+    import_parser.add_argument("--errors", default=None, help="오류 행 목록을 저장할 CSV 파일")
+    import_parser.add_argument("--dry-run", action="store_true", help="검증만 하고 임금대장에 기록하지 않음")
+    
+    employees_parser = subparsers.add_parser("import-employees", help="직원 명부 CSV 일괄 가져오기")
+    employees_parser.add_argument("roster", help="직원 명부 CSV 파일 (이름, 입사일 열 필수)")
+    employees_parser.add_argument("--chunk-size", type=int, default=5000, help="묶음당 행 수 (기본값: 5000)")
+    employees_parser.add_argument("--errors", default=None, help="오류 행 목록을 저장할 CSV 파일")
+    employees_parser.add_argument("--dry-run", action="store_true", help="검증만 하고 직원 정보에 기록하지 않음")
+    
+    statements_parser = subparsers.add_parser("statements", help="월 임금명세서 일괄 생성 (HTML)")
+    statements_parser.add_argument("--year", type=int, required=True, help="연도")
+    statements_parser.add_argument("--month", type=int, required=True, choices=range(1, 13), metavar="MONTH", help="월")
+    statements_parser.add_argument("-o", "--output-dir", default=None, help="저장 디렉토리 (기본값: pay_statements_YYYY-MM)")
+    statements_parser.add_argument("--zip", default=None, help="디렉토리 대신 ZIP 파일 하나로 저장 (ZIP 파일 경로)")
+    statements_parser.add_argument("--company", default="", help="임금명세서에 표시할 회사명")
+    statements_parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본값: CPU 코어 수)")
+    statements_parser.add_argument("--chunk-size", type=int, default=250, help="작업 단위 명세서 수 (기본값: 250)")
+    
+    args = parser.parse_args(argv)
+    ledger = PayrollLedger(data_dir=args.data_dir)
+    
+    if args.command == "run-payroll":
+        try:
+            components = _load_components(args.components)
+        except (OSError, ValueError) as e:
+            print(f"지급 항목 파일 로드 오류: {e}", file=sys.stderr)
+            return 1
+        
+        try:
+            summary = run_monthly_payroll(
+                ledger, args.year, args.month,
+                components=components, payment_day=args.payment_day,
+                workers=args.workers, dry_run=args.dry_run, close=args.close
+            )
+        except ValueError as e:
+            print(f"급여 계산 오류: {e}", file=sys.stderr)
+            return 1
+        
+        rate = summary["employees"] / summary["seconds"] if summary["seconds"] > 0 else 0
+        print(
+            f"{args.year}년 {args.month}월 급여 계산{' (시험 실행)' if args.dry_run else ''}"
+            f"{' 및 월 마감' if summary['closed'] else ''}: "
+            f"{summary['employees']}명 처리, {summary['skipped']}명 건너뜀 (기존 기록), "
+            f"{summary['not_hired']}명 제외 (입사 전), "
+            f"총 지급액 {summary['gross_pay']:,.0f}원, 실수령액 {summary['net_pay']:,.0f}원, "
+            f"{summary['seconds']:.2f}초, 초당 {rate:,.0f}명"
+        )
+    elif args.command == "import-ledger":
+        try:
+            summary = import_payroll_workbook(
+                ledger, args.workbook, sheet_name=args.sheet,
+                batch_size=args.batch_size, dry_run=args.dry_run
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"임금대장 가져오기 오류: {e}", file=sys.stderr)
+            return 1
+        
+        if args.errors and summary["rejected"]:
+            summary["errors"].to_csv(args.errors, index=False, encoding="utf-8-sig")
+        
+        rate = summary["rows"] / summary["seconds"] if summary["seconds"] > 0 else 0
+        print(
+            f"임금대장 가져오기{' (시험 실행)' if args.dry_run else ''}: "
+            f"{summary['rows']}행 중 {summary['imported']}행 추가, {summary['rejected']}행 오류, "
+            f"{summary['seconds']:.2f}초, 초당 {rate:,.0f}행"
+        )
+        if summary["rejected"]:
+            for row in summary["errors"].head(10).itertuples(index=False):
+                print(f"  {row.row_number}행: {row.error}", file=sys.stderr)
+            return 2
+    elif args.command == "import-employees":
+        try:
+            summary = import_employees_csv(
+                ledger, args.roster, chunk_size=args.chunk_size, dry_run=args.dry_run
+            )
+        except (OSError, ValueError) as e:
+            print(f"직원 명부 가져오기 오류: {e}", file=sys.stderr)
+            return 1
+        
+        if args.errors and summary["rejected"]:
+            summary["errors"].to_csv(args.errors, index=False, encoding="utf-8-sig")
+        
+        print(
+            f"직원 명부 가져오기{' (시험 실행)' if args.dry_run else ''}: "
+            f"{summary['rows']}행 중 {summary['imported']}명 추가, {summary['duplicates']}명 중복, "
+            f"{summary['rejected']}행 오류, {summary['seconds']:.2f}초"
+        )
+        if summary["rejected"]:
+            for row in summary["errors"].head(10).itertuples(index=False):
+                print(f"  {row.row_number}행: {row.error}", file=sys.stderr)
+            return 2
+    elif args.command == "statements":
+        output_dir = args.output_dir or f"pay_statements_{args.year}-{args.month:02d}"
+        try:
+            if args.zip:
+                summary = write_pay_statement_archive(
+                    ledger, args.year, args.month, args.zip, company_name=args.company
+                )
+            else:
+                summary = run_pay_statements(
+                    ledger, args.year, args.month, output_dir,
+                    company_name=args.company, workers=args.workers, chunk_size=args.chunk_size
+                )
+        except OSError as e:
+            print(f"임금명세서 생성 오류: {e}", file=sys.stderr)
+            return 1
+        
+        rate = summary["statements"] / summary["seconds"] if summary["seconds"] > 0 else 0
+        print(
+            f"{args.year}년 {args.month}월 임금명세서 {summary['statements']}건 생성, "
+            f"{summary['seconds']:.2f}초, 초당 {rate:,.0f}건 -> {summary['output']}"
+        )
+        if summary["statements"] == 0:
+            print(f"{args.year}년 {args.month}월에 임금 지급 기록이 없습니다.", file=sys.stderr)
+            return 2
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+report_charts.py - 임금대장 보고서 차트
+
+직원 수가 적으면 직원별 막대 차트를 그리고, 기준 인원을 넘으면 부서별 합계,
+실수령액 분포, 상위 직원 차트로 바꾸어 그림 데이터 크기를 일정하게 유지합니다.
+시계열 차트는 WebGL(Scattergl) 트레이스로 그립니다.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# 직원별 막대 차트를 그리는 최대 직원 수 (넘으면 집계 차트로 전환)
+EMPLOYEE_CHART_LIMIT = 50
+
+# 집계 차트의 상위 직원 수
+TOP_EMPLOYEE_COUNT = 20
+
+# 실수령액 분포 구간 수
+HISTOGRAM_BINS = 30
+
+# 지급액 구분별 이름과 색상
+PAY_SERIES = {
+    "gross_pay": ("총 지급액", "#1E88E5"),
+    "net_pay": ("실수령액", "#4CAF50")
+}
+
+def _apply_layout(fig, title, xaxis_title):
+    """
+    보고서 차트 공통 레이아웃 적용
+    
+    Args:
+        fig (plotly.graph_objects.Figure): 차트
+        title (str): 차트 제목
+        xaxis_title (str): x축 제목
+    
+    Returns:
+        plotly.graph_objects.Figure: 레이아웃을 적용한 차트
+    """
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="금액 (원)",
+        legend_title="구분",
+        barmode="group",
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig
+
+def _pay_bar_figure(frame, x_column, title, xaxis_title, label_column=None):
+    """
+    총 지급액과 실수령액 묶음 막대 차트 생성
+    
+    label_column을 지정하면 x축은 x_column 값(직원 ID 등 고유 키)으로 나누고
+    눈금과 마우스 오버에는 label_column 값(직원 이름 등)을 표시하므로,
+    이름이 같은 직원도 막대가 합쳐지지 않습니다.
+    
+    Args:
+        frame (pandas.DataFrame): x_column, gross_pay, net_pay 열 (label_column 열)
+        x_column (str): x축 열 이름 (고유 키)
+        title (str): 차트 제목
+        xaxis_title (str): x축 제목
+        label_column (str, optional): x축 눈금에 표시할 열 이름. 기본값은 None (x_column 값 표시).
+    
+    Returns:
+        plotly.graph_objects.Figure: 막대 차트
+    """
+    keys = frame[x_column].astype(str)
+    labels = frame[label_column].fillna(keys).astype(str) if label_column is not None else keys
+    
+    fig = go.Figure([
+        go.Bar(
+            x=keys, y=frame[column], name=name, marker_color=color,
+            hovertext=labels, hovertemplate="%{hovertext}<br>%{y:,.0f}원"
+        )
+        for column, (name, color) in PAY_SERIES.items()
+    ])
+    fig = _apply_layout(fig, title, xaxis_title)
+    fig.update_xaxes(type="category", tickmode="array", tickvals=keys.tolist(), ticktext=labels.tolist())
+    return fig
+
+def build_employee_pay_figures(employee_stats, title, max_employees=EMPLOYEE_CHART_LIMIT, top_count=TOP_EMPLOYEE_COUNT):
+    """
+    직원별 급여 분포 차트 생성
+    
+    직원 수가 max_employees 이하이면 직원별 막대 차트 하나를, 넘으면 부서별 합계,
+    실수령액 분포(미리 계산한 구간), 총 지급액 상위 직원 차트를 반환합니다.
+    집계 차트는 직원 수와 관계없이 크기가 일정합니다.
+    
+    Args:
+        employee_stats (pandas.DataFrame): 직원별 통계 (employee_id, employee_name, department, gross_pay, net_pay 열)
+        title (str): 차트 제목 (예: "2025년 직원별 급여 분포")
+        max_employees (int, optional): 직원별 차트 최대 직원 수. 기본값은 EMPLOYEE_CHART_LIMIT.
+        top_count (int, optional): 상위 직원 수. 기본값은 TOP_EMPLOYEE_COUNT.
+    
+    Returns:
+        list: plotly.graph_objects.Figure 목록
+    """
+    if len(employee_stats) <= max_employees:
+        return [_pay_bar_figure(employee_stats, "employee_id", title, "직원", label_column="employee_name")]
+    
+    figures = []
+    
+    # 부서별 합계
+    if "department" in employee_stats.columns:
+        department_stats = (
+            employee_stats.assign(department=employee_stats["department"].fillna("미지정"))
+            .groupby("department", sort=True)[list(PAY_SERIES)].sum()
+            .reset_index()
+        )
+        figures.append(_pay_bar_figure(department_stats, "department", f"{title} - 부서별 합계", "부서"))
+    
+    # 실수령액 분포 (구간별 인원만 전송)
+    counts, edges = np.histogram(employee_stats["net_pay"].fillna(0).to_numpy(dtype=float), bins=HISTOGRAM_BINS)
+    histogram = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name="직원 수",
+        marker_color=PAY_SERIES["net_pay"][1],
+        customdata=np.stack([edges[:-1], edges[1:]], axis=1),
+        hovertemplate="%{customdata[0]:,.0f}원 ~ %{customdata[1]:,.0f}원<br>%{y}명<extra></extra>"
+    ))
+    histogram.update_layout(
+        title=f"{title} - 실수령액 분포 ({len(employee_stats):,}명)",
+        xaxis_title="실수령액 (원)",
+        yaxis_title="직원 수",
+        bargap=0
+    )
+    figures.append(histogram)
+    
+    # 총 지급액 상위 직원
+    top_stats = employee_stats.nlargest(top_count, "gross_pay")
+    figures.append(_pay_bar_figure(
+        top_stats, "employee_id", f"{title} - 총 지급액 상위 {len(top_stats)}명", "직원", label_column="employee_name"
+    ))
+    
+    return figures
+
+def build_monthly_trend_figure(monthly_stats, title):
+    """
+    월별 급여 추이 차트 생성 (WebGL 트레이스)
+    
+    Args:
+        monthly_stats (pandas.DataFrame): 월별 통계 (month, total_gross_pay, total_net_pay 열)
+        title (str): 차트 제목
+    
+    Returns:
+        plotly.graph_objects.Figure: 선 차트
+    """
+    fig = go.Figure([
+        go.Scattergl(
+            x=monthly_stats["month"],
+            y=monthly_stats[f"total_{column}"],
+            name=name,
+            mode="lines+markers",
+            line=dict(color=color),
+            marker=dict(color=color)
+        )
+        for column, (name, color) in PAY_SERIES.items()
+    ])
+    fig = _apply_layout(fig, title, "월")
+    fig.update_xaxes(tickmode="linear", dtick=1)
+    return fig
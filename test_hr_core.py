@@ -0,0 +1,461 @@
+# hr_core 패키지 단위 테스트
+# Streamlit 없이 계산 엔진과 임금대장 저장소의 동작을 확인합니다.
+
+import os
+import sys
+import datetime
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 모듈 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from hr_core.annual_leave_calculator import AnnualLeaveCalculator
+from hr_core.business_calendar import LUNAR_HOLIDAYS, BusinessCalendar, get_business_calendar
+from hr_core import ids, payroll_ledger
+from hr_core.employee_search import EmployeeSearchIndex, get_initials
+from hr_core.importers import validate_payroll_batch
+from hr_core.payroll_ledger import ROLLUP_KEYS, PayrollLedger, build_rollup
+
+class TestBusinessCalendar(unittest.TestCase):
+    """영업일 캘린더 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.calendar = get_business_calendar()
+    
+    def test_lunar_holiday_table(self):
+        """음력 공휴일 표는 연도가 빠짐없이 이어지고 날짜가 올바른 월에 있어야 함"""
+        years = sorted(LUNAR_HOLIDAYS)
+        self.assertEqual(years, list(range(years[0], years[-1] + 1)))
+        
+        for year, (seollal, buddha, chuseok) in LUNAR_HOLIDAYS.items():
+            self.assertIn(seollal[0], (1, 2), year)
+            self.assertIn(buddha[0], (4, 5), year)
+            self.assertIn(chuseok[0], (9, 10), year)
+            # 날짜가 실제로 존재해야 함
+            for month, day in (seollal, buddha, chuseok):
+                datetime.date(year, month, day)
+    
+    def test_holidays_2025(self):
+        """2025년 설날·추석 연휴와 대체공휴일"""
+        holidays = set(self.calendar.holidays.astype(datetime.date).tolist())
+        
+        # 설날 연휴 (1월 28일 ~ 30일)
+        for day in (28, 29, 30):
+            self.assertIn(datetime.date(2025, 1, day), holidays)
+        
+        # 추석 연휴 (10월 5일 ~ 7일)와 일요일이 겹친 대체공휴일 (10월 8일)
+        for day in (5, 6, 7, 8):
+            self.assertIn(datetime.date(2025, 10, day), holidays)
+        
+        # 어린이날과 부처님오신날이 겹친 대체공휴일 (5월 6일)
+        self.assertIn(datetime.date(2025, 5, 6), holidays)
+        self.assertNotIn(datetime.date(2025, 5, 7), holidays)
+    
+    def test_workday_counts(self):
+        """월별 근무일수 (주말과 공휴일 제외)"""
+        # 2025년 1월: 평일 23일 - 신정, 설날 연휴 3일
+        self.assertEqual(int(self.calendar.count_workdays(datetime.date(2025, 1, 1), datetime.date(2025, 1, 31))), 19)
+        
+        # 2025년 10월: 평일 23일 - 개천절, 추석 연휴 2일, 대체공휴일, 한글날
+        self.assertEqual(int(self.calendar.count_workdays(datetime.date(2025, 10, 1), datetime.date(2025, 10, 31))), 18)
+        
+        # 여러 기간을 한 번에 계산
+        starts = np.array(["2025-01-01", "2025-10-01"], dtype="datetime64[D]")
+        ends = np.array(["2025-01-31", "2025-10-31"], dtype="datetime64[D]")
+        self.assertEqual(self.calendar.count_workdays(starts, ends).tolist(), [19, 18])
+    
+    def test_busday_count_matches_numpy(self):
+        """누적합 계산 결과는 numpy.busday_count와 같아야 함"""
+        rng = np.random.default_rng(0)
+        offsets = rng.integers(0, len(self.calendar.workdays), size=(200, 2))
+        begins = self.calendar.start + np.minimum(offsets[:, 0], offsets[:, 1])
+        ends = self.calendar.start + np.maximum(offsets[:, 0], offsets[:, 1])
+        
+        expected = np.busday_count(begins, ends, weekmask=self.calendar.weekmask, holidays=self.calendar.holidays)
+        np.testing.assert_array_equal(self.calendar.busday_count(begins, ends), expected)
+    
+    def test_years_outside_holiday_table(self):
+        """음력 공휴일 표를 벗어난 연도는 캘린더를 만들 수 없음"""
+        with self.assertRaises(ValueError):
+            BusinessCalendar(2010, 2012)
+        
+        self.assertFalse(self.calendar.covers(datetime.date(2014, 12, 1), datetime.date(2015, 1, 31)))
+        self.assertTrue(self.calendar.covers(datetime.date(2015, 1, 1), datetime.date(2015, 12, 31)))
+
+class TestAnnualLeaveCalculator(unittest.TestCase):
+    """연차휴가 계산기 테스트 클래스"""
+    
+    def test_hire_before_holiday_table(self):
+        """캘린더 범위 이전 입사자도 계산할 수 있어야 함 (범위 밖 기간의 출근율은 빈 값)"""
+        calculator = AnnualLeaveCalculator(datetime.date(2012, 3, 1), as_of=datetime.date(2025, 6, 1))
+        rates = calculator.get_attendance_rates()
+        
+        self.assertTrue(rates["출근율"].iloc[:3].isna().all())
+        self.assertTrue(rates["요건 충족"].iloc[3:].astype(bool).all())
+        self.assertEqual(calculator.get_employment_year_leaves()[2013], 15)
+    
+    def test_first_year_monthly_leave(self):
+        """1년 미만 근무자의 월별 연차는 실제 월 기준으로 계산"""
+        calculator = AnnualLeaveCalculator(datetime.date(2024, 3, 15), as_of=datetime.date(2025, 6, 1))
+        leaves = calculator.get_employment_year_leaves()
+        
+        # 입사 연도: 3월 ~ 12월 10일
+        self.assertEqual(leaves[2024], 10)
+        # 다음 연도: 1월, 2월 2일 + 입사 1주년 이후 기간의 비례 연차
+        self.assertEqual(leaves[2025], 2 + calculator._prorate_leave(15, datetime.date(2025, 3, 15), datetime.date(2025, 12, 31)))
+    
+    def test_proration_uses_workdays(self):
+        """비례 연차는 연간 소정근로일수 대비 재직 기간의 소정근로일수로 계산"""
+        calculator = AnnualLeaveCalculator(datetime.date(2025, 7, 1), as_of=datetime.date(2025, 8, 1))
+        business_calendar = get_business_calendar()
+        
+        worked = int(business_calendar.count_workdays(datetime.date(2025, 7, 1), datetime.date(2025, 12, 31)))
+        total = int(business_calendar.count_workdays(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31)))
+        
+        self.assertEqual(calculator.get_fiscal_year_leaves()[2026], -(-15 * worked // total))
+    
+    def test_attendance_requirement(self):
+        """출근율 80% 미만인 기간 다음의 입사일 기준 연차는 발생하지 않음"""
+        calculator = AnnualLeaveCalculator(
+            datetime.date(2022, 3, 15),
+            as_of=datetime.date(2025, 6, 1),
+            absent_days=[0, 100, 0]
+        )
+        
+        rates = calculator.get_attendance_rates()
+        self.assertEqual(rates["요건 충족"].tolist()[:3], [True, False, True])
+        
+        grants = {grant["발생일"]: grant["연차일수"] for grant in calculator.get_employment_year_schedule()}
+        self.assertEqual(grants[datetime.date(2024, 3, 15)], 0)
+        self.assertEqual(grants[datetime.date(2025, 3, 15)], 16)
+        self.assertEqual(calculator.get_employment_year_leaves()[2024], 0)
+    
+    def test_short_absence_list(self):
+        """결근일수 목록이 기간 수보다 짧으면 나머지 기간은 결근 없음으로 계산"""
+        calculator = AnnualLeaveCalculator(
+            datetime.date(2022, 3, 15),
+            as_of=datetime.date(2025, 6, 1),
+            absent_days=[100]
+        )
+        
+        rates = calculator.get_attendance_rates()
+        self.assertGreater(len(rates), 1)
+        self.assertFalse(rates["요건 충족"].iloc[0])
+        self.assertTrue(all(rates["요건 충족"].iloc[1:]))
+        self.assertEqual(rates["출근일수"].iloc[1], rates["소정근로일수"].iloc[1])
+        
+        # 숫자 하나는 모든 기간에 적용하고, 기간 수보다 긴 목록은 오류
+        self.assertFalse(any(calculator.get_attendance_rates(absent_days=100)["요건 충족"]))
+        with self.assertRaises(ValueError):
+            calculator.get_attendance_rates(absent_days=[0] * (len(rates) + 1))
+
+class TestIds(unittest.TestCase):
+    """시간순 정렬 가능한 ID 생성 테스트 클래스"""
+    
+    def test_format(self):
+        """ID는 26자 Crockford Base32 문자열이고 앞 10자는 생성 시각"""
+        before = time.time_ns() // 1_000_000
+        employee_id = ids.new_id()
+        after = time.time_ns() // 1_000_000
+        
+        self.assertEqual(len(employee_id), 26)
+        self.assertTrue(set(employee_id) <= set(ids.ENCODING))
+        
+        timestamp = 0
+        for char in employee_id[:10]:
+            timestamp = timestamp * 32 + ids.ENCODING.index(char)
+        self.assertGreaterEqual(timestamp, before)
+        self.assertLessEqual(timestamp, after + 1)
+    
+    def test_ordering(self):
+        """한 번에 만든 ID와 차례로 만든 ID 모두 생성 순서대로 정렬되고 겹치지 않음"""
+        generated = ids.new_ids(10000) + [ids.new_id() for _ in range(1000)] + ids.new_ids(5000)
+        
+        self.assertEqual(generated, sorted(generated))
+        self.assertEqual(len(set(generated)), len(generated))
+        self.assertEqual(ids.new_ids(0), [])
+    
+    def test_random_overflow(self):
+        """같은 밀리초에 80비트 값이 넘치면 다음 밀리초로 넘어가도 순서 유지"""
+        # 시계를 고정하여 두 번의 생성이 항상 같은 밀리초에 일어나도록 함
+        timestamp = max(time.time_ns() // 1_000_000, ids._last_timestamp)
+        with mock.patch.object(ids.time, "time_ns", return_value=timestamp * 1_000_000):
+            with ids._lock:
+                ids._last_timestamp = timestamp
+                ids._last_random = (1 << 80) - 2
+            
+            last = ids.new_id()
+            generated = ids.new_ids(5)
+        
+        self.assertEqual(last[10:], "Z" * 16)
+        self.assertEqual([last] + generated, sorted([last] + generated))
+        self.assertEqual(generated[0][10:], "0" * 16)
+        self.assertEqual(generated[0][:10], ids._encode_time(timestamp + 1))
+
+class TestEmployeeSearchIndex(unittest.TestCase):
+    """직원 검색 색인 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        employees = pd.DataFrame({
+            "employee_id": ["E1", "E2", "E3", "E4", "E5"],
+            "name": ["최수진", "김철수", "이철수", "박김치", "김철민"],
+            "department": ["개발팀", "개발팀", "개발팀", "인사팀", "영업팀"]
+        })
+        self.index = EmployeeSearchIndex(employees)
+        self.names = dict(zip(employees["employee_id"], employees["name"]))
+    
+    def search_names(self, query, limit=20):
+        return [self.names[employee_id] for employee_id in self.index.search(query, limit)]
+    
+    def test_get_initials(self):
+        """한글 음절은 초성으로, 나머지 문자는 그대로"""
+        self.assertEqual(get_initials("김철수"), "ㄱㅊㅅ")
+        self.assertEqual(get_initials("HR팀 2"), "HRㅌ 2")
+    
+    def test_initials_prefix_first(self):
+        """초성 검색은 앞부분 일치를 먼저, 그다음 부분 일치를 이름 순으로 반환"""
+        self.assertEqual(self.search_names("ㅊ"), ["최수진", "김철민", "김철수", "박김치", "이철수"])
+        self.assertEqual(self.search_names("ㄱㅊ"), ["김철민", "김철수", "박김치"])
+    
+    def test_mixed_initials(self):
+        """완성된 글자와 초성을 섞은 검색어는 완성된 글자가 같아야 일치"""
+        self.assertEqual(self.search_names("김ㅊ"), ["김철민", "김철수", "박김치"])
+        self.assertEqual(self.search_names("철ㅅ"), ["김철수", "이철수"])
+        self.assertEqual(self.search_names("ㄱㅊㅅ"), ["김철수"])
+    
+    def test_department_and_limit(self):
+        """부서 초성으로도 찾고, 결과 수를 제한"""
+        self.assertEqual(self.search_names("ㄱㅂ"), ["김철수", "이철수", "최수진"])
+        self.assertEqual(self.search_names("ㅊ", limit=2), ["최수진", "김철민"])
+        self.assertEqual(self.search_names(""), ["김철민", "김철수", "박김치", "이철수", "최수진"])
+        self.assertEqual(self.search_names("ㅎ"), [])
+
+class TestPayrollRollup(unittest.TestCase):
+    """임금대장 월별 집계표 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정 (임시 데이터 디렉토리에 직원 2명, 2025년 9월 지급 기록 2건)"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ledger = PayrollLedger(self.temp_dir.name)
+        
+        self.first_id, self.second_id = self.ledger.add_employees([
+            {"name": "김철수", "department": "개발팀", "base_salary": 3000000},
+            {"name": "이영희", "department": "영업팀", "base_salary": 3500000}
+        ])
+        self.first_payroll, self.second_payroll = self.ledger.add_payrolls([
+            {"employee_id": self.first_id, "payment_date": "2025-09-25"},
+            {"employee_id": self.second_id, "payment_date": "2025-09-25"}
+        ])
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def assertRollupMatchesLedger(self, ledger):
+        """증감분으로 갱신한 집계표가 임금대장 전체를 다시 집계한 결과와 같아야 함"""
+        expected = build_rollup(ledger.ledger)
+        actual = ledger.rollup.sort_index()
+        self.assertEqual(list(actual.index.names), ROLLUP_KEYS)
+        pd.testing.assert_frame_equal(actual, expected.sort_index(), check_dtype=False)
+    
+    def test_add_payrolls(self):
+        """기록 추가 시 집계"""
+        report = self.ledger.generate_monthly_report(2025, 9)
+        
+        self.assertEqual(report["total_employees"], 2)
+        self.assertEqual(report["total_gross_pay"], 6500000)
+        self.assertRollupMatchesLedger(self.ledger)
+    
+    def test_update_moves_month(self):
+        """지급일을 다른 월로 옮기면 이전 월에서 빼고 새 월에 더함"""
+        self.ledger.update_payroll(self.first_payroll, {"payment_date": "2025-10-25", "bonus": 500000})
+        
+        self.assertEqual(self.ledger.get_rollup_summary(2025, 9)["total_gross_pay"], 3500000)
+        self.assertEqual(self.ledger.get_rollup_summary(2025, 10)["total_gross_pay"], 3500000)
+        self.assertEqual(self.ledger.get_rollup_summary(2025)["total_employees"], 2)
+        self.assertRollupMatchesLedger(self.ledger)
+    
+    def test_department_change_then_update(self):
+        """부서를 옮긴 직원의 기록을 수정해도 직원 한 명으로 집계"""
+        self.ledger.update_employee(self.first_id, {"department": "영업팀"})
+        self.ledger.delete_payroll(self.second_payroll)
+        self.ledger.update_payroll(self.first_payroll, {"base_salary": 3500000})
+        
+        report = self.ledger.generate_monthly_report(2025, 9)
+        self.assertEqual(report["total_employees"], 1)
+        self.assertEqual(report["total_gross_pay"], 3500000)
+        self.assertEqual(report["employee_stats"]["department"].tolist(), ["영업팀"])
+        self.assertRollupMatchesLedger(self.ledger)
+        
+        annual = self.ledger.generate_annual_report(2025)
+        self.assertEqual(annual["total_gross_pay"], 3500000)
+        
+        # 다시 불러와도 같은 집계
+        reloaded = PayrollLedger(self.temp_dir.name)
+        self.assertEqual(reloaded.get_rollup_summary(2025, 9)["total_gross_pay"], 3500000)
+        self.assertRollupMatchesLedger(reloaded)
+    
+    def test_department_change_then_delete(self):
+        """부서를 옮긴 직원의 기록이나 직원을 삭제하면 집계에서 빠짐"""
+        self.ledger.update_employee(self.first_id, {"department": "영업팀"})
+        self.ledger.delete_payroll(self.first_payroll)
+        
+        summary = self.ledger.get_rollup_summary(2025, 9)
+        self.assertEqual(summary["total_employees"], 1)
+        self.assertEqual(summary["total_gross_pay"], 3500000)
+        self.assertRollupMatchesLedger(self.ledger)
+        
+        self.ledger.update_employee(self.second_id, {"department": "개발팀"})
+        self.ledger.delete_employee(self.second_id)
+        
+        self.assertEqual(self.ledger.get_rollup_summary(2025, 9)["total_employees"], 0)
+        self.assertTrue(self.ledger.get_employee_stats(2025).empty)
+        self.assertRollupMatchesLedger(self.ledger)
+    
+    def test_report_cache_versions(self):
+        """다른 인스턴스가 저장해도 버전이 겹치지 않고, 이전 버전 보고서는 캐시에서 빠짐"""
+        other = PayrollLedger(self.temp_dir.name)
+        self.assertEqual(other.version, self.ledger.version)
+        self.ledger.generate_monthly_report(2025, 9)
+        
+        self.ledger.add_payrolls([{"employee_id": self.first_id, "payment_date": "2025-09-30"}])
+        other.add_payrolls([{"employee_id": self.second_id, "payment_date": "2025-09-30"}])
+        self.assertNotEqual(other.version, self.ledger.version)
+        self.assertEqual(other.stored_version(), other.version)
+        
+        other.generate_monthly_report(2025, 9)
+        self.assertEqual(PayrollLedger(self.temp_dir.name).version, other.version)
+        
+        data_dir = os.path.abspath(self.temp_dir.name)
+        versions = {key[3] for key in payroll_ledger._report_cache if key[0] == data_dir}
+        self.assertEqual(versions, {other.version})
+        
+        # 이전 버전 인스턴스의 보고서는 버전 ID의 크기와 관계없이 캐시하지 않음
+        self.ledger.meta["revision"] = "Z" * 26
+        self.ledger.generate_annual_report(2025)
+        versions = {key[3] for key in payroll_ledger._report_cache if key[0] == data_dir}
+        self.assertEqual(versions, {other.version})
+    
+    def test_employee_version(self):
+        """직원 정보 버전은 직원이 바뀔 때만 바뀌고 임금 지급 기록만 바뀌면 유지"""
+        employee_version = self.ledger.employee_version
+        
+        self.ledger.add_payrolls([{"employee_id": self.first_id, "payment_date": "2025-09-30"}])
+        self.assertEqual(self.ledger.employee_version, employee_version)
+        self.assertEqual(PayrollLedger(self.temp_dir.name).employee_version, employee_version)
+        
+        self.assertTrue(self.ledger.update_employee(self.first_id, {"department": "인사팀"}))
+        self.assertNotEqual(self.ledger.employee_version, employee_version)
+        self.assertEqual(PayrollLedger(self.temp_dir.name).employee_version, self.ledger.employee_version)
+    
+    def test_refresh_before_write(self):
+        """다른 인스턴스가 저장한 내용을 다시 로드한 뒤 기록하면 변경이 사라지지 않음"""
+        other = PayrollLedger(self.temp_dir.name)
+        self.assertFalse(other.refresh())
+        
+        self.ledger.add_payrolls([{"employee_id": self.first_id, "payment_date": "2025-09-30"}])
+        self.assertTrue(other.refresh())
+        other.add_payrolls([{"employee_id": self.second_id, "payment_date": "2025-09-30"}])
+        
+        self.assertTrue(self.ledger.refresh())
+        self.assertEqual(self.ledger.get_rollup_summary(2025, 9)["total_gross_pay"], 6500000 * 2)
+        self.assertEqual(len(self.ledger.ledger), 4)
+        self.assertRollupMatchesLedger(self.ledger)
+    
+    def test_old_rollup_format_rebuilt(self):
+        """부서가 키에 들어간 이전 형식의 집계표 파일은 다시 계산"""
+        old = self.ledger.rollup.reset_index()
+        old.insert(2, "department", "개발팀")
+        old.to_csv(self.ledger.rollup_file, index=False)
+        
+        reloaded = PayrollLedger(self.temp_dir.name)
+        self.assertRollupMatchesLedger(reloaded)
+
+class TestCloseMonth(unittest.TestCase):
+    """월 마감 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정 (임시 데이터 디렉토리에 직원 2명, 2025년 9월 지급 기록 2건)"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.ledger = PayrollLedger(self.temp_dir.name)
+        
+        self.employee_ids = self.ledger.add_employees([
+            {"name": "김철수", "department": "개발팀", "base_salary": 3000000},
+            {"name": "이영희", "department": "영업팀", "base_salary": 3500000}
+        ])
+        self.ledger_ids = self.ledger.add_payrolls([
+            {"employee_id": employee_id, "payment_date": "2025-09-25"} for employee_id in self.employee_ids
+        ])
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_summary_from_partition_rows(self):
+        """월별 집계표가 어긋나 있어도 마감 집계는 마감 파일의 기록과 같아야 함"""
+        self.ledger.rollup = self.ledger.rollup * 2
+        
+        summary = self.ledger.close_month(2025, 9)
+        partition = self.ledger.read_closed_month(2025, 9)
+        
+        self.assertEqual(summary["total_employees"], partition["employee_id"].nunique())
+        self.assertEqual(summary["total_gross_pay"], partition["gross_pay"].sum())
+        self.assertEqual(summary["total_gross_pay"], 6500000)
+        self.assertEqual(self.ledger.get_rollup_summary(2025, 9)["total_gross_pay"], 6500000)
+        
+        report = PayrollLedger(self.temp_dir.name).generate_monthly_report(2025, 9)
+        self.assertEqual(report["total_employees"], 2)
+        self.assertEqual(report["total_net_pay"], summary["total_net_pay"])
+    
+    def test_closed_employee_stats_frozen(self):
+        """마감 이후 직원 정보를 고쳐도 마감된 월의 직원별 합계는 마감 시점 값 유지"""
+        self.ledger.close_month(2025, 9)
+        self.assertTrue(self.ledger.update_employee(self.employee_ids[0], {"department": "인사팀"}))
+        
+        stats = PayrollLedger(self.temp_dir.name).generate_monthly_report(2025, 9)["employee_stats"]
+        departments = dict(zip(stats["employee_id"], stats["department"]))
+        self.assertEqual(departments[self.employee_ids[0]], "개발팀")
+        self.assertEqual(stats["gross_pay"].sum(), 6500000)
+    
+    def test_closed_month_guards(self):
+        """마감된 월의 기록은 추가, 수정, 삭제할 수 없음"""
+        self.ledger.close_month(2025, 9)
+        first_id, second_id = self.employee_ids
+        
+        self.assertIsNone(self.ledger.add_payroll({"employee_id": first_id, "payment_date": "2025-09-30"}))
+        with self.assertRaises(ValueError):
+            self.ledger.add_payrolls([{"employee_id": first_id, "payment_date": "2025-09-30"}])
+        self.assertFalse(self.ledger.update_payroll(self.ledger_ids[0], {"bonus": 100000}))
+        self.assertFalse(self.ledger.delete_payroll(self.ledger_ids[0]))
+        self.assertFalse(self.ledger.delete_employee(first_id))
+        with self.assertRaises(ValueError):
+            self.ledger.close_month(2025, 9)
+        
+        # 마감되지 않은 월의 기록도 마감된 월로 옮길 수 없음
+        october_id = self.ledger.add_payroll({"employee_id": first_id, "payment_date": "2025-10-25", "base_salary": 3000000})
+        self.assertIsNotNone(october_id)
+        self.assertFalse(self.ledger.update_payroll(october_id, {"payment_date": "2025-09-30"}))
+        
+        # 일괄 가져오기 검증에서 오류 행으로 처리
+        batch = pd.DataFrame({
+            "row_number": [2, 3],
+            "employee_id": [first_id, second_id],
+            "payment_date": ["2025-09-30", "2025-10-30"]
+        })
+        valid, errors = validate_payroll_batch(batch, self.ledger.employees, self.ledger.get_closed_months())
+        self.assertEqual(errors["row_number"].tolist(), [2])
+        self.assertEqual(valid["employee_id"].tolist(), [second_id])
+        
+        # 마감된 월의 보고서는 저장된 값 유지
+        report = PayrollLedger(self.temp_dir.name).generate_monthly_report(2025, 9)
+        self.assertEqual(report["total_gross_pay"], 6500000)
+        self.assertEqual(len(self.ledger.ledger), 3)
+
+if __name__ == "__main__":
+    unittest.main()
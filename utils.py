@@ -5,7 +5,9 @@ HR 관리 시스템에서 공통으로 사용되는 유틸리티 함수들을 
 """
 
 import os
+import io
 import base64
+import mimetypes
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
@@ -31,6 +33,9 @@ def get_download_link(file_path, link_text, file_name=None):
         
     Returns:
         str: HTML 다운로드 링크
+    
+    Note:
+        파일 전체가 base64로 페이지에 포함되므로 큰 파일에는 render_download_button을 사용하세요.
     """
     if file_name is None:
         file_name = os.path.basename(file_path)
@@ -43,6 +48,59 @@ def get_download_link(file_path, link_text, file_name=None):
     
     return href
 
+def render_download_button(data, file_name, label="다운로드", mime=None, key=None):
+    """
+    메모리의 데이터를 내려받는 다운로드 버튼을 표시합니다.
+    
+    데이터를 base64 링크로 페이지에 넣지 않고 Streamlit 미디어 서버에서
+    별도 응답으로 전송하므로 큰 파일도 페이지 크기를 늘리지 않습니다.
+    
+    Args:
+        data (str | bytes | io.BytesIO | callable): 다운로드할 데이터 (호출 가능 객체는 호출 결과 사용)
+        file_name (str): 다운로드 시 파일 이름
+        label (str, optional): 버튼 텍스트. 기본값은 "다운로드".
+        mime (str, optional): MIME 형식. 기본값은 None (파일 확장자로 추정).
+        key (str, optional): 위젯 키. 기본값은 None.
+        
+    Returns:
+        bool: 버튼 클릭 여부
+    """
+    if callable(data):
+        data = data()
+    if isinstance(data, io.BytesIO):
+        data = data.getvalue()
+    elif isinstance(data, str):
+        data = data.encode("utf-8")
+    
+    if mime is None:
+        mime = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+    
+    return st.download_button(label, data=data, file_name=file_name, mime=mime, key=key)
+
+def get_ledger():
+    """
+    화면에서 사용할 임금대장 인스턴스를 반환합니다.
+    
+    인스턴스는 세션마다 따로 두므로 여러 사용자가 같은 인스턴스를 동시에 고치지 않습니다.
+    데이터 파일이 바뀌지 않았으면 이전 실행에서 불러온 인스턴스를 재사용하고,
+    다른 세션이나 명령행 도구가 기록을 바꿨으면 다시 불러옵니다.
+    
+    Returns:
+        PayrollLedger: 임금대장 인스턴스
+    """
+    # 임금대장을 쓰지 않는 페이지는 임금대장 모듈을 불러오지 않도록 사용할 때 가져옴
+    from hr_core.payroll_ledger import PayrollLedger
+    
+    ledger = st.session_state.get("payroll_ledger")
+    
+    if ledger is None:
+        ledger = PayrollLedger()
+        st.session_state["payroll_ledger"] = ledger
+    else:
+        ledger.refresh()
+    
+    return ledger
+
 def format_currency(amount, currency="원"):
     """
     금액을 통화 형식으로 포맷팅합니다.